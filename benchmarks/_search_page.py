@@ -0,0 +1,105 @@
+"""Synthetic search results, shaped like the responses of the job offers search API."""
+
+import copy
+from typing import Any
+
+SEARCH_PAGE_SIZE = 150
+
+_OFFRE_JSON: dict[str, Any] = {
+    "id": "201WLXK",
+    "intitule": "Développeur backend Python/Django (H/F)",
+    "description": "Vous rejoindrez un environnement dynamique et stimulant. " * 20,
+    "dateCreation": "2025-12-23T16:01:23.690Z",
+    "dateActualisation": "2025-12-24T09:03:02.003Z",
+    "lieuTravail": {
+        "libelle": "72 - Le Mans",
+        "latitude": 48.007462,
+        "longitude": 0.197404,
+        "codePostal": "72000",
+        "commune": "72181",
+    },
+    "romeCode": "M1855",
+    "romeLibelle": "Développeur / Développeuse web",
+    "appellationlibelle": "Développeur / Développeuse back-end",
+    "entreprise": {
+        "nom": "HOLENEK INGENIERIE",
+        "description": "Société de conseil en ingénierie logicielle",
+        "logo": "https://entreprise.francetravail.fr/static/img/logos/holenek.png",
+        "url": "https://holenek.fr",
+        "entrepriseAdaptee": False,
+    },
+    "typeContrat": "CDI",
+    "typeContratLibelle": "Contrat à durée indéterminée",
+    "natureContrat": "Contrat travail",
+    "experienceExige": "E",
+    "experienceLibelle": "4 An(s)",
+    "experienceCommentaire": "Sur un poste similaire",
+    "formations": [
+        {
+            "codeFormation": "31054",
+            "domaineLibelle": "Informatique",
+            "niveauLibelle": "Bac+5 et plus ou équivalents",
+            "commentaire": "Ecole d'ingénieur",
+            "exigence": "S",
+        }
+    ],
+    "langues": [{"libelle": "Anglais", "exigence": "S"}],
+    "permis": [{"libelle": "B - Véhicule léger", "exigence": "S"}],
+    "outilsBureautiques": ["Traitement de texte", "Tableur"],
+    "competences": [
+        {"code": "120735", "libelle": "Concevoir une application web", "exigence": "E"},
+        {"code": "121707", "libelle": "Développer des composants logiciels", "exigence": "E"},
+        {"code": "124022", "libelle": "Rédiger des spécifications techniques", "exigence": "S"},
+    ],
+    "salaire": {
+        "libelle": "Annuel de 38000.0 Euros à 45000.0 Euros sur 12.0 mois",
+        "commentaire": "Selon expérience",
+        "complement1": "Titres restaurant / Prime de panier",
+        "listeComplements": [
+            {"code": "17", "libelle": "Titres restaurant / Prime de panier"},
+            {"code": "21", "libelle": "Mutuelle"},
+        ],
+    },
+    "dureeTravailLibelle": "35H/semaine\nTravail en journée",
+    "dureeTravailLibelleConverti": "Temps plein",
+    "alternance": False,
+    "contact": {
+        "nom": "HOLENEK INGENIERIE - Mme Dupont",
+        "coordonnees1": "https://taleez.com/apply/developpeur-backend-python-django-h-f/applying",
+        "urlPostulation": "https://taleez.com/apply/developpeur-backend-python-django-h-f/applying",
+    },
+    "agence": {"courriel": "Pour postuler, utiliser le lien suivant : https://candidat.francetravail.fr"},
+    "nombrePostes": 1,
+    "accessibleTH": False,
+    "deplacementCode": "1",
+    "deplacementLibelle": "Jamais",
+    "qualificationCode": "9",
+    "qualificationLibelle": "Cadre",
+    "codeNAF": "62.02A",
+    "secteurActivite": "62",
+    "secteurActiviteLibelle": "Conseil en systèmes et logiciels informatiques",
+    "qualitesProfessionnelles": [
+        {"libelle": "Autonomie", "description": "Capacité à prendre en charge son activité sans supervision."},
+        {"libelle": "Travail en équipe", "description": "Capacité à collaborer avec les autres."},
+    ],
+    "trancheEffectifEtab": "20 à 49 salariés",
+    "origineOffre": {
+        "origine": "2",
+        "urlOrigine": "https://candidat.francetravail.fr/offres/recherche/detail/201WLXK",
+        "partenaires": [{"nom": "TALEEZ", "url": "https://taleez.com", "logo": "https://taleez.com/logo.png"}],
+    },
+    "offresManqueCandidats": False,
+    "contexteTravail": {"horaires": ["35H Travail en journée"], "conditionsExercice": ["Télétravail partiel"]},
+    "entrepriseAdaptee": False,
+    "employeurHandiEngage": False,
+}
+
+
+def search_page_json(size: int = SEARCH_PAGE_SIZE) -> list[dict[str, Any]]:
+    """Build the `resultats` of a search page, holding `size` distinct job offers."""
+    offres_json = []
+    for index in range(size):
+        offre_json = copy.deepcopy(_OFFRE_JSON)
+        offre_json["id"] = f"{index:07d}"
+        offres_json.append(offre_json)
+    return offres_json
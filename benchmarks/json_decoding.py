@@ -0,0 +1,67 @@
+"""
+Measure the time taken to turn the HTTP response of a full search page into an `HTTPResponse`.
+
+Run with `python -m benchmarks.json_decoding`. Install the `orjson` and `msgspec` extras to
+compare all the decoders.
+"""
+
+import argparse
+import json
+import timeit
+import uuid
+
+import httpx
+
+from benchmarks._search_page import SEARCH_PAGE_SIZE, search_page_json
+from france_travail_api.http_transport._http_response import HTTPResponse
+from france_travail_api.http_transport.json_decoding import (
+    JsonDecoder,
+    MsgspecJsonDecoder,
+    OrjsonDecoder,
+    StdlibJsonDecoder,
+)
+
+
+def _httpx_response(content: bytes) -> httpx.Response:
+    request = httpx.Request("GET", "https://api.francetravail.io", headers={"X-Request-Id": str(uuid.uuid4())})
+    return httpx.Response(206, content=content, request=request, headers={"Content-Type": "application/json"})
+
+
+def _available_json_decoders() -> dict[str, JsonDecoder]:
+    json_decoders: dict[str, JsonDecoder] = {"stdlib": StdlibJsonDecoder()}
+    for name, json_decoder_type in (("orjson", OrjsonDecoder), ("msgspec", MsgspecJsonDecoder)):
+        try:
+            json_decoders[name] = json_decoder_type()
+        except ImportError:
+            print(f"{name} is not installed, skipping it")
+    return json_decoders
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=7, help="number of measures, the best one is reported")
+    parser.add_argument("--number", type=int, default=100, help="number of pages decoded per measure")
+    arguments = parser.parse_args()
+
+    content = json.dumps({"resultats": search_page_json()}).encode()
+    print(f"Page of {SEARCH_PAGE_SIZE} offers, {len(content) / 1024:.0f} KiB")
+
+    def decode_text_then_json() -> None:
+        # Previous behavior: the body was decoded to text to check its emptiness, then parsed.
+        response = _httpx_response(content)
+        response.json() if response.text else {}
+
+    timings = timeit.repeat(decode_text_then_json, repeat=arguments.repeat, number=arguments.number)
+    print(f"response.text + response.json(): {min(timings) / arguments.number * 1e3:.3f} ms per page")
+
+    for name, json_decoder in _available_json_decoders().items():
+        timings = timeit.repeat(
+            lambda: HTTPResponse.from_httpx_response(_httpx_response(content), json_decoder),  # noqa: B023
+            repeat=arguments.repeat,
+            number=arguments.number,
+        )
+        print(f"{name} decoder on bytes: {min(timings) / arguments.number * 1e3:.3f} ms per page")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Measure the memory held by parsed job offers.
+
+Run with `python -m benchmarks.offre_memory`.
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from benchmarks._search_page import search_page_json
+from france_travail_api.offres.models import Offre
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--offres", type=int, default=10_000, help="number of job offers kept in memory")
+    arguments = parser.parse_args()
+
+    offres_json = search_page_json(arguments.offres)
+    gc.collect()
+    tracemalloc.start()
+    offres = [Offre.from_dict(offre_json) for offre_json in offres_json]
+    allocated_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{len(offres)} offers: {allocated_size / 2**20:.1f} MiB, {allocated_size / len(offres):.0f} bytes per offer"
+    )
+
+
+if __name__ == "__main__":
+    main()
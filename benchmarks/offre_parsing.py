@@ -0,0 +1,93 @@
+"""
+Measure the time taken to parse a full page of job offers search results.
+
+Pass `--baseline <revision>` to also measure `Offre.from_dict` as of a git revision, e.g. the
+commit before the field tables of `offres.models._decoding`. The library is then extracted from
+that revision and measured in a separate process, on the same search page.
+
+Run with `python -m benchmarks.offre_parsing`.
+"""
+
+import argparse
+import os
+import pathlib
+import subprocess
+import sys
+import tarfile
+import tempfile
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks._search_page import SEARCH_PAGE_SIZE, search_page_json
+from france_travail_api.offres.models import Offre
+
+_REPOSITORY_ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+
+def _parse_page(page_json: list[dict[str, Any]]) -> None:
+    for offre_json in page_json:
+        Offre.from_dict(offre_json)
+
+
+def _parse_page_lazily(page_json: list[dict[str, Any]]) -> None:
+    # Imported here, as baseline revisions may predate LazyOffre.
+    from france_travail_api.offres.models import LazyOffre
+
+    for offre_json in page_json:
+        offre = LazyOffre.from_dict(offre_json)
+        offre.id, offre.intitule, offre.date_creation, offre.lieu_travail
+
+
+def _report(label: str, parse_page: Callable[[list[dict[str, Any]]], None], repeat: int, number: int) -> None:
+    page_json = search_page_json()
+    timings = timeit.repeat(lambda: parse_page(page_json), repeat=repeat, number=number)
+    best_page_time = min(timings) / number
+    print(f"{label}: {best_page_time * 1e3:.3f} ms per page of {SEARCH_PAGE_SIZE} offers")
+
+
+def _report_baseline(revision: str, repeat: int, number: int) -> None:
+    with tempfile.TemporaryDirectory() as baseline_directory:
+        archive_path = pathlib.Path(baseline_directory) / "baseline.tar"
+        subprocess.run(
+            ["git", "archive", f"--output={archive_path}", revision, "france_travail_api"],
+            cwd=_REPOSITORY_ROOT,
+            check=True,
+        )
+        with tarfile.open(archive_path) as baseline_archive:
+            baseline_archive.extractall(baseline_directory, filter="data")
+        # -P keeps the working directory off sys.path, so that the library of the revision is imported.
+        subprocess.run(
+            [
+                sys.executable,
+                "-P",
+                "-m",
+                "benchmarks.offre_parsing",
+                f"--repeat={repeat}",
+                f"--number={number}",
+                f"--label=Offre.from_dict at {revision} (baseline)",
+                "--offre-only",
+            ],
+            env={**os.environ, "PYTHONPATH": os.pathsep.join([baseline_directory, str(_REPOSITORY_ROOT)])},
+            check=True,
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=7, help="number of measures, the best one is reported")
+    parser.add_argument("--number", type=int, default=100, help="number of pages parsed per measure")
+    parser.add_argument("--baseline", help="git revision whose Offre.from_dict is also measured")
+    parser.add_argument("--label", default="Offre.from_dict", help="label of the Offre.from_dict measure")
+    parser.add_argument("--offre-only", action="store_true", help="only measure Offre.from_dict")
+    arguments = parser.parse_args()
+
+    if arguments.baseline is not None:
+        _report_baseline(arguments.baseline, arguments.repeat, arguments.number)
+    _report(arguments.label, _parse_page, arguments.repeat, arguments.number)
+    if not arguments.offre_only:
+        _report("LazyOffre.from_dict, reading 4 attributes", _parse_page_lazily, arguments.repeat, arguments.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Measure the peak memory and time taken to process the job offers of a search response,
+whether it is read entirely before being parsed or parsed as its bytes are received.
+
+Run with `python -m benchmarks.streaming`.
+"""
+
+import argparse
+import json
+import timeit
+import tracemalloc
+import uuid
+from collections.abc import Callable
+
+import httpx
+
+from benchmarks._search_page import SEARCH_PAGE_SIZE, search_page_json
+from france_travail_api.http_transport._http_response import HTTPResponse, HTTPStreamResponse
+from france_travail_api.offres.models import Offre
+
+_CHUNK_SIZE = 64 * 1024
+
+
+def _httpx_response(chunks: list[bytes]) -> httpx.Response:
+    request = httpx.Request("GET", "https://api.francetravail.io", headers={"X-Request-Id": str(uuid.uuid4())})
+    return httpx.Response(206, content=iter(chunks), request=request)
+
+
+def _read_then_parse(chunks: list[bytes]) -> int:
+    response = _httpx_response(chunks)
+    response.read()
+    offres = [
+        Offre.from_dict(offre_json) for offre_json in HTTPResponse.from_httpx_response(response).body["resultats"]
+    ]
+    return sum(1 for offre in offres if offre.id)
+
+
+def _parse_while_receiving(chunks: list[bytes]) -> int:
+    response = HTTPStreamResponse(_httpx_response(chunks))
+    return sum(1 for offre_json in response.iter_json_array("resultats") if Offre.from_dict(offre_json).id)
+
+
+def _peak_memory(process: Callable[[list[bytes]], int], chunks: list[bytes]) -> int:
+    tracemalloc.start()
+    process(chunks)
+    _, peak_size = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak_size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=7, help="number of measures, the best one is reported")
+    parser.add_argument("--number", type=int, default=20, help="number of responses processed per measure")
+    arguments = parser.parse_args()
+
+    content = json.dumps({"resultats": search_page_json()}).encode()
+    chunks = [content[start : start + _CHUNK_SIZE] for start in range(0, len(content), _CHUNK_SIZE)]
+    print(f"Page of {SEARCH_PAGE_SIZE} offers, {len(content) / 1024:.0f} KiB received in {len(chunks)} chunks")
+
+    assert _read_then_parse(chunks) == _parse_while_receiving(chunks) == SEARCH_PAGE_SIZE
+    for label, process in (("read then parse", _read_then_parse), ("parse while receiving", _parse_while_receiving)):
+        timings = timeit.repeat(lambda: process(chunks), repeat=arguments.repeat, number=arguments.number)  # noqa: B023
+        print(
+            f"{label}: {min(timings) / arguments.number * 1e3:.3f} ms, "
+            f"peak memory {_peak_memory(process, chunks) / 2**20:.2f} MiB per page"
+        )
+
+
+if __name__ == "__main__":
+    main()
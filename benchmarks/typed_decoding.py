@@ -0,0 +1,51 @@
+"""
+Measure the time taken to decode the body of a full search page into job offers.
+
+Run with `python -m benchmarks.typed_decoding`. Requires the `msgspec` extra.
+"""
+
+import argparse
+import json
+import timeit
+from collections.abc import Callable
+
+from benchmarks._search_page import SEARCH_PAGE_SIZE, search_page_json
+from france_travail_api.http_transport.json_decoding import default_json_decoder
+from france_travail_api.offres.models import Offre
+from france_travail_api.offres.models._typed_decoding import TypedOffreDecoder
+
+
+def _report(label: str, decode_page: Callable[[bytes], list[Offre]], content: bytes, repeat: int, number: int) -> None:
+    timings = timeit.repeat(lambda: decode_page(content), repeat=repeat, number=number)
+    print(f"{label}: {min(timings) / number * 1e3:.3f} ms per page of {SEARCH_PAGE_SIZE} offers")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=7, help="number of measures, the best one is reported")
+    parser.add_argument("--number", type=int, default=100, help="number of pages decoded per measure")
+    arguments = parser.parse_args()
+
+    content = json.dumps({"resultats": search_page_json()}).encode()
+    json_decoder = default_json_decoder()
+    typed_offre_decoder = TypedOffreDecoder()
+
+    def decode_then_create_offres(content: bytes) -> list[Offre]:
+        return [Offre.from_dict(offre_json) for offre_json in json_decoder.decode(content)["resultats"]]
+
+    def decode_typed_offres(content: bytes) -> list[Offre]:
+        return typed_offre_decoder.decode(content)["resultats"]
+
+    assert decode_then_create_offres(content) == decode_typed_offres(content)
+    _report(
+        f"{type(json_decoder).__name__} + Offre.from_dict",
+        decode_then_create_offres,
+        content,
+        arguments.repeat,
+        arguments.number,
+    )
+    _report("TypedOffreDecoder", decode_typed_offres, content, arguments.repeat, arguments.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,30 @@ FranceTravailClient
 Scope
     Available API scopes.
 
+ConnectionOptions
+    Tuning of the connection pool, timeouts and HTTP/2.
+
+TokenRefreshSchedule
+    Schedule of the background renewal of access tokens.
+
+RateLimits
+    Maximum number of calls per second to each endpoint family.
+
+RetryPolicy
+    Policy for retrying requests failing with a transient error.
+
+OffreCache
+    Cache of job offer details.
+
+ReferentielCache
+    On-disk cache of referentiels.
+
+OffreSynchronizer
+    Incremental synchronization of job offers, reporting insertions, updates and deletions.
+
+FileSyncStateStore
+    On-disk storage of the synchronization states of searches.
+
 Examples
 --------
 >>> from france_travail_api.client import FranceTravailClient
@@ -26,9 +50,24 @@ Examples
 """
 
 from france_travail_api.auth.scope import Scope
+from france_travail_api.auth.token_refresh import TokenRefreshSchedule
 from france_travail_api.client import FranceTravailClient
+from france_travail_api.http_transport.connection import ConnectionOptions
+from france_travail_api.http_transport.rate_limit import RateLimits
+from france_travail_api.http_transport.retry import RetryPolicy
+from france_travail_api.offres.cache import OffreCache
+from france_travail_api.offres.referentiel_cache import ReferentielCache
+from france_travail_api.offres.sync import FileSyncStateStore, OffreSynchronizer
 
 __all__ = [
+    "ConnectionOptions",
+    "FileSyncStateStore",
     "FranceTravailClient",
+    "OffreCache",
+    "OffreSynchronizer",
+    "RateLimits",
+    "ReferentielCache",
+    "RetryPolicy",
     "Scope",
+    "TokenRefreshSchedule",
 ]
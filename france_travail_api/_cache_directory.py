@@ -0,0 +1,35 @@
+import os
+import pathlib
+import sys
+
+
+def user_cache_directory(*parts: str) -> pathlib.Path:
+    """
+    Get a directory of the cache of the current user, dedicated to this library.
+
+    Parameters
+    ----------
+    *parts : str
+        Subdirectories of the library cache directory.
+
+    Returns
+    -------
+    pathlib.Path
+        `france-travail-api` directory, followed by `parts`, in `%LOCALAPPDATA%` on Windows,
+        `~/Library/Caches` on macOS and `$XDG_CACHE_HOME` (default: `~/.cache`) elsewhere.
+
+    Examples
+    --------
+    >>> user_cache_directory("sync").parts[-2:]
+    ('france-travail-api', 'sync')
+    """
+    if sys.platform == "win32":
+        cache_directory = pathlib.Path(os.environ.get("LOCALAPPDATA") or pathlib.Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        cache_directory = pathlib.Path.home() / "Library" / "Caches"
+    else:
+        xdg_cache_home = os.environ.get("XDG_CACHE_HOME", "")
+        cache_directory = (
+            pathlib.Path(xdg_cache_home) if os.path.isabs(xdg_cache_home) else pathlib.Path.home() / ".cache"
+        )
+    return cache_directory.joinpath("france-travail-api", *parts)
@@ -0,0 +1,158 @@
+import contextlib
+import http
+from collections.abc import AsyncIterator, Iterator
+
+from france_travail_api.auth._credentials import FranceTravailCredentials
+from france_travail_api.http_transport._http_client import HttpClient
+from france_travail_api.http_transport._http_response import HTTPResponse, HTTPStreamResponse
+from france_travail_api.http_transport.json_decoding import JsonDecoder
+
+
+class AuthenticatedHttpClient:
+    """
+    Sends requests authenticated with the OAuth2 access token of the given credentials.
+
+    When the API rejects the access token (HTTP 401 Unauthorized), the token is renewed once and
+    the request is replayed with the new token.
+
+    Parameters
+    ----------
+    credentials : FranceTravailCredentials
+        Credentials providing the access token.
+    http_client : HttpClient
+        Internal HTTP client for making requests. Not intended for direct use.
+
+    Examples
+    --------
+    >>> client = AuthenticatedHttpClient(credentials, http_client)
+    >>> client.get("https://api.francetravail.io/partenaire/offresdemploi/v2/referentiel/metiers").status_code
+    <HTTPStatus.OK: 200>
+    """
+
+    def __init__(self, credentials: FranceTravailCredentials, http_client: HttpClient) -> None:
+        self._credentials = credentials
+        self._http_client = http_client
+
+    def get(
+        self, url: str, headers: dict[str, str] | None = None, json_decoder: JsonDecoder | None = None
+    ) -> HTTPResponse:
+        """
+        Make an authenticated GET request.
+
+        Parameters
+        ----------
+        url : str
+            URL to make the request to.
+        headers : dict[str, str] | None
+            Headers to include in the request, besides the authorization header.
+        json_decoder : JsonDecoder | None
+            Decoder of the body of a successful response, defaults to the decoder of the HTTP client.
+
+        Returns
+        -------
+        HTTPResponse
+            Response from the server.
+        """
+        token = self._credentials.get_token()
+        response = self._http_client.get(
+            url=url, headers={**(headers or {}), **token.to_authorization_header()}, json_decoder=json_decoder
+        )
+        if response.status_code != http.HTTPStatus.UNAUTHORIZED:
+            return response
+
+        renewed_token = self._credentials.renew_token(rejected_token=token)
+        return self._http_client.get(
+            url=url, headers={**(headers or {}), **renewed_token.to_authorization_header()}, json_decoder=json_decoder
+        )
+
+    async def get_async(
+        self, url: str, headers: dict[str, str] | None = None, json_decoder: JsonDecoder | None = None
+    ) -> HTTPResponse:
+        """
+        Make an authenticated asynchronous GET request.
+
+        Parameters
+        ----------
+        url : str
+            URL to make the request to.
+        headers : dict[str, str] | None
+            Headers to include in the request, besides the authorization header.
+        json_decoder : JsonDecoder | None
+            Decoder of the body of a successful response, defaults to the decoder of the HTTP client.
+
+        Returns
+        -------
+        HTTPResponse
+            Response from the server.
+        """
+        token = await self._credentials.get_token_async()
+        response = await self._http_client.get_async(
+            url=url, headers={**(headers or {}), **token.to_authorization_header()}, json_decoder=json_decoder
+        )
+        if response.status_code != http.HTTPStatus.UNAUTHORIZED:
+            return response
+
+        renewed_token = await self._credentials.renew_token_async(rejected_token=token)
+        return await self._http_client.get_async(
+            url=url, headers={**(headers or {}), **renewed_token.to_authorization_header()}, json_decoder=json_decoder
+        )
+
+    @contextlib.contextmanager
+    def stream(self, url: str, headers: dict[str, str] | None = None) -> Iterator[HTTPStreamResponse]:
+        """
+        Make an authenticated GET request whose response body is read as it is received.
+
+        Parameters
+        ----------
+        url : str
+            URL to make the request to.
+        headers : dict[str, str] | None
+            Headers to include in the request, besides the authorization header.
+
+        Yields
+        ------
+        HTTPStreamResponse
+            Response from the server, closed when leaving the context.
+        """
+        token = self._credentials.get_token()
+        with self._http_client.stream(url, headers={**(headers or {}), **token.to_authorization_header()}) as response:
+            if response.status_code != http.HTTPStatus.UNAUTHORIZED:
+                yield response
+                return
+
+        renewed_token = self._credentials.renew_token(rejected_token=token)
+        with self._http_client.stream(
+            url, headers={**(headers or {}), **renewed_token.to_authorization_header()}
+        ) as response:
+            yield response
+
+    @contextlib.asynccontextmanager
+    async def stream_async(self, url: str, headers: dict[str, str] | None = None) -> AsyncIterator[HTTPStreamResponse]:
+        """
+        Make an authenticated asynchronous GET request whose response body is read as it is received.
+
+        Parameters
+        ----------
+        url : str
+            URL to make the request to.
+        headers : dict[str, str] | None
+            Headers to include in the request, besides the authorization header.
+
+        Yields
+        ------
+        HTTPStreamResponse
+            Response from the server, closed when leaving the context.
+        """
+        token = await self._credentials.get_token_async()
+        async with self._http_client.stream_async(
+            url, headers={**(headers or {}), **token.to_authorization_header()}
+        ) as response:
+            if response.status_code != http.HTTPStatus.UNAUTHORIZED:
+                yield response
+                return
+
+        renewed_token = await self._credentials.renew_token_async(rejected_token=token)
+        async with self._http_client.stream_async(
+            url, headers={**(headers or {}), **renewed_token.to_authorization_header()}
+        ) as response:
+            yield response
@@ -1,13 +1,21 @@
+import asyncio
+import contextlib
 import datetime
+import functools
 import threading
 from typing import Sequence
 
 from france_travail_api.auth._token import Token
+from france_travail_api.auth.clock import Clock, MonotonicClock
 from france_travail_api.auth.scope import Scope, Scopes
+from france_travail_api.auth.token_refresh import TokenRefreshSchedule
+from france_travail_api.auth.token_store import TokenStore
 from france_travail_api.exceptions import FranceTravailException
 from france_travail_api.http_transport._http_client import HttpClient
+from france_travail_api.http_transport._http_response import HTTPResponse
 
 _OAUTH2_ACCESS_TOKEN_URL = "https://entreprise.francetravail.fr/connexion/oauth2/access_token?realm=%2Fpartenaire"
+_BACKGROUND_REFRESH_RETRY_DELAY = 5.0
 
 
 class FranceTravailCredentials:
@@ -25,53 +33,194 @@ class FranceTravailCredentials:
         See `france_travail_api.Scope` for available scopes.
     http_client : HttpClient
         Internal HTTP client for making requests. Not intended for direct use.
+    clock : Clock | None
+        Source of the current time to check token expiration, defaults to a `MonotonicClock`.
+    token_store : TokenStore | None
+        Store sharing tokens with other credentials using the same client ID and scopes, e.g. in
+        other processes. When set, a new token is only requested if the store has no valid one.
     """
 
-    def __init__(self, client_id: str, client_secret: str, scopes: Sequence[Scope], http_client: HttpClient) -> None:
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        scopes: Sequence[Scope],
+        http_client: HttpClient,
+        clock: Clock | None = None,
+        token_store: TokenStore | None = None,
+    ) -> None:
         self._client_id = client_id
         self._client_secret = client_secret
         self._scopes = Scopes(scopes)
         self._http_client = http_client
+        self._clock = clock or MonotonicClock()
+        self._token_store = token_store
+        self._token_store_key = f"{client_id} {self._scopes}"
 
         self._token: Token | None = None
         self._lock = threading.Lock()
+        self._async_lock = asyncio.Lock()
+        self._refresh_thread: threading.Thread | None = None
+        self._stop_refresh_event = threading.Event()
+        self._refresh_task: asyncio.Task[None] | None = None
 
-    def get_token(self, now: datetime.datetime = datetime.datetime.now(datetime.UTC)) -> Token:
+    def get_token(self, now: datetime.datetime | None = None) -> Token:
         """
         Get an OAuth2 access token.
 
+        A still-valid token is returned without waiting for a token renewal in progress, e.g. in the
+        background thread started by `start_background_refresh`. Concurrent threads needing a new
+        token share a single token request.
+
         Parameters
         ----------
-        now : datetime.datetime
-            Current datetime, defaults to the current time.
+        now : datetime.datetime | None
+            Current datetime, defaults to the current time of the credentials clock.
 
         Returns
         -------
         Token
             OAuth2 access token.
         """
+        now = now or self._clock.now()
+        if self._has_valid_token(now):
+            return self._token  # type: ignore[return-value]
+
         with self._lock:
             if self._has_valid_token(now):
                 return self._token  # type: ignore[return-value]
 
-        with self._lock:
-            if self._has_valid_token(now):  # pragma: no cover
+            return self._obtain_token(now)
+
+    async def get_token_async(self, now: datetime.datetime | None = None) -> Token:
+        """
+        Get an OAuth2 access token asynchronously.
+
+        Concurrent coroutines needing a new token share a single token request.
+
+        Parameters
+        ----------
+        now : datetime.datetime | None
+            Current datetime, defaults to the current time of the credentials clock.
+
+        Returns
+        -------
+        Token
+            OAuth2 access token.
+        """
+        now = now or self._clock.now()
+        if self._has_valid_token(now):
+            return self._token  # type: ignore[return-value]
+
+        async with self._async_lock:
+            if self._has_valid_token(now):
                 return self._token  # type: ignore[return-value]
 
-            response = self._http_client.post(
-                url=_OAUTH2_ACCESS_TOKEN_URL,
-                payload={
-                    "grant_type": "client_credentials",
-                    "client_id": self._client_id,
-                    "client_secret": self._client_secret,
-                    "scope": self._scopes,
-                },
-            )
-            if not response.status_code.is_success:
-                raise FranceTravailException.from_http_response(response)
-
-            self._token = Token.from_response(response, now)
-            return self._token
+            return await self._obtain_token_async(now)
+
+    def renew_token(self, rejected_token: Token) -> Token:
+        """
+        Renew an access token rejected by the API before its expected expiration.
+
+        When several threads report the same rejected token, only the first one requests a new token.
+
+        Parameters
+        ----------
+        rejected_token : Token
+            Token rejected by the API.
+
+        Returns
+        -------
+        Token
+            New OAuth2 access token.
+        """
+        with self._lock:
+            if self._token is not None and self._token != rejected_token:
+                return self._token
+            return self._obtain_token(self._clock.now(), rejected_token)
+
+    async def renew_token_async(self, rejected_token: Token) -> Token:
+        """
+        Renew an access token rejected by the API before its expected expiration, asynchronously.
+
+        When several coroutines report the same rejected token, only the first one requests a new token.
+
+        Parameters
+        ----------
+        rejected_token : Token
+            Token rejected by the API.
+
+        Returns
+        -------
+        Token
+            New OAuth2 access token.
+        """
+        async with self._async_lock:
+            if self._token is not None and self._token != rejected_token:
+                return self._token
+            return await self._obtain_token_async(self._clock.now(), rejected_token)
+
+    def start_background_refresh(self, schedule: TokenRefreshSchedule | None = None) -> None:
+        """
+        Start renewing the token in a background thread, ahead of its expiration.
+
+        Requests then no longer wait for a token renewal. Does nothing if the background refresh
+        is already running.
+
+        Parameters
+        ----------
+        schedule : TokenRefreshSchedule | None
+            When to renew the token, defaults to `TokenRefreshSchedule()`.
+        """
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        self._stop_refresh_event = threading.Event()
+        self._refresh_thread = threading.Thread(
+            target=self._run_background_refresh,
+            args=(schedule or TokenRefreshSchedule(), self._stop_refresh_event),
+            name="france-travail-token-refresh",
+            daemon=True,
+        )
+        self._refresh_thread.start()
+
+    def stop_background_refresh(self) -> None:
+        """
+        Stop the background thread started by `start_background_refresh`, if any.
+        """
+        if self._refresh_thread is None:
+            return
+        self._stop_refresh_event.set()
+        self._refresh_thread.join()
+        self._refresh_thread = None
+
+    async def start_background_refresh_async(self, schedule: TokenRefreshSchedule | None = None) -> None:
+        """
+        Start renewing the token in a background task of the running event loop, ahead of its expiration.
+
+        Does nothing if the background refresh is already running.
+
+        Parameters
+        ----------
+        schedule : TokenRefreshSchedule | None
+            When to renew the token, defaults to `TokenRefreshSchedule()`.
+        """
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.create_task(
+            self._run_background_refresh_async(schedule or TokenRefreshSchedule()),
+            name="france-travail-token-refresh",
+        )
+
+    async def stop_background_refresh_async(self) -> None:
+        """
+        Stop the background task started by `start_background_refresh_async`, if any.
+        """
+        if self._refresh_task is None:
+            return
+        self._refresh_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._refresh_task
+        self._refresh_task = None
 
     def to_authorization_header(self) -> dict[str, str]:
         """
@@ -84,5 +233,113 @@ class FranceTravailCredentials:
         """
         return self.get_token().to_authorization_header()
 
+    async def to_authorization_header_async(self) -> dict[str, str]:
+        """
+        Convert the token to an Authorization header, fetching the token asynchronously if needed.
+
+        Returns
+        -------
+        dict[str, str]
+            Authorization header with the token value.
+        """
+        return (await self.get_token_async()).to_authorization_header()
+
+    def _build_token_request_payload(self) -> dict[str, str | Scopes]:
+        return {
+            "grant_type": "client_credentials",
+            "client_id": self._client_id,
+            "client_secret": self._client_secret,
+            "scope": self._scopes,
+        }
+
+    def _obtain_token(self, now: datetime.datetime, rejected_token: Token | None = None) -> Token:
+        if self._token_store is None:
+            return self._fetch_token(now)
+
+        with self._token_store.lock(self._token_store_key):
+            if self._load_stored_token(now, rejected_token) is not None:
+                return self._token  # type: ignore[return-value]
+            token = self._fetch_token(now)
+            self._token_store.save(self._token_store_key, token)
+            return token
+
+    async def _obtain_token_async(self, now: datetime.datetime, rejected_token: Token | None = None) -> Token:
+        if self._token_store is None:
+            return await self._fetch_token_async(now)
+
+        store_lock = self._token_store.lock(self._token_store_key)
+        await _enter_in_thread(store_lock)
+        try:
+            if self._load_stored_token(now, rejected_token) is not None:
+                return self._token  # type: ignore[return-value]
+            token = await self._fetch_token_async(now)
+            self._token_store.save(self._token_store_key, token)
+            return token
+        finally:
+            store_lock.__exit__(None, None, None)
+
+    def _load_stored_token(self, now: datetime.datetime, rejected_token: Token | None) -> Token | None:
+        stored_token = self._token_store.load(self._token_store_key)  # type: ignore[union-attr]
+        if stored_token is None or stored_token == rejected_token or stored_token.is_expired(now):
+            return None
+        self._token = stored_token
+        return stored_token
+
+    def _fetch_token(self, now: datetime.datetime) -> Token:
+        response = self._http_client.post(url=_OAUTH2_ACCESS_TOKEN_URL, payload=self._build_token_request_payload())
+        return self._store_token(response, now)
+
+    async def _fetch_token_async(self, now: datetime.datetime) -> Token:
+        response = await self._http_client.post_async(
+            url=_OAUTH2_ACCESS_TOKEN_URL, payload=self._build_token_request_payload()
+        )
+        return self._store_token(response, now)
+
+    def _run_background_refresh(self, schedule: TokenRefreshSchedule, stop_event: threading.Event) -> None:
+        while not stop_event.wait(self._delay_before_background_refresh(schedule)):
+            try:
+                with self._lock:
+                    self._obtain_token(self._clock.now(), rejected_token=self._token)
+            except Exception:  # Failures surface on the request path, which fetches its own token if needed
+                if stop_event.wait(_BACKGROUND_REFRESH_RETRY_DELAY):
+                    return
+
+    async def _run_background_refresh_async(self, schedule: TokenRefreshSchedule) -> None:
+        while True:
+            await asyncio.sleep(self._delay_before_background_refresh(schedule))
+            try:
+                async with self._async_lock:
+                    await self._obtain_token_async(self._clock.now(), rejected_token=self._token)
+            except Exception:  # Failures surface on the request path, which fetches its own token if needed
+                await asyncio.sleep(_BACKGROUND_REFRESH_RETRY_DELAY)
+
+    def _delay_before_background_refresh(self, schedule: TokenRefreshSchedule) -> float:
+        if self._token is None:
+            return 0.0
+        return schedule.delay_before_refresh(self._token, self._clock.now())
+
+    def _store_token(self, response: HTTPResponse, now: datetime.datetime) -> Token:
+        if not response.status_code.is_success:
+            raise FranceTravailException.from_http_response(response)
+
+        self._token = Token.from_response(response, now)
+        return self._token
+
     def _has_valid_token(self, now: datetime.datetime) -> bool:
         return self._token is not None and not self._token.is_expired(now)
+
+
+async def _enter_in_thread(context_manager: contextlib.AbstractContextManager[None]) -> None:
+    """Enter a blocking context manager in a thread, exiting it as soon as it is entered if the caller is cancelled."""
+    entering = asyncio.ensure_future(asyncio.to_thread(context_manager.__enter__))
+    try:
+        await asyncio.shield(entering)
+    except asyncio.CancelledError:
+        # The thread cannot be interrupted, so the lock it is waiting for is released once acquired.
+        entering.add_done_callback(functools.partial(_exit_if_entered, context_manager))
+        raise
+
+
+def _exit_if_entered(context_manager: contextlib.AbstractContextManager[None], entering: asyncio.Future[None]) -> None:
+    if not entering.cancelled() and entering.exception() is None:
+        context_manager.__exit__(None, None, None)
@@ -0,0 +1,44 @@
+import datetime
+import time
+from typing import Protocol
+
+
+class Clock(Protocol):
+    """
+    Source of the current time used to decide when access tokens expire.
+
+    Implement this protocol to control time, e.g. in tests.
+
+    Examples
+    --------
+    >>> class FrozenClock:
+    ...     def now(self) -> datetime.datetime:
+    ...         return datetime.datetime(2025, 12, 25, tzinfo=datetime.UTC)
+    """
+
+    def now(self) -> datetime.datetime:
+        """Return the current time, as a timezone-aware UTC datetime."""
+        ...
+
+
+class MonotonicClock:
+    """
+    UTC clock which never goes backwards.
+
+    The clock reads the wall clock once, at creation, then advances with `time.monotonic()`. Token
+    expiration is therefore unaffected by system clock adjustments (NTP corrections, manual changes...)
+    in long-running processes.
+
+    Examples
+    --------
+    >>> clock = MonotonicClock()
+    >>> clock.now() <= clock.now()
+    True
+    """
+
+    def __init__(self) -> None:
+        self._wall_clock_origin = datetime.datetime.now(datetime.UTC)
+        self._monotonic_origin = time.monotonic()
+
+    def now(self) -> datetime.datetime:
+        return self._wall_clock_origin + datetime.timedelta(seconds=time.monotonic() - self._monotonic_origin)
@@ -0,0 +1,67 @@
+import datetime
+import random
+from dataclasses import dataclass
+
+from france_travail_api.auth._token import Token
+
+
+@dataclass(frozen=True)
+class TokenRefreshSchedule:
+    """
+    Schedule of the background renewal of OAuth2 access tokens.
+
+    Tokens are renewed once a fraction of their remaining lifetime has elapsed, randomized by a
+    jitter so that several processes sharing the same credentials do not refresh simultaneously.
+
+    Parameters
+    ----------
+    refresh_ratio : float (default: 0.75)
+        Fraction of the token lifetime after which it is renewed, strictly between 0 and 1.
+    jitter_ratio : float (default: 0.1)
+        Maximum relative deviation applied to the renewal delay, between 0 (included) and 1.
+
+    Examples
+    --------
+    >>> from france_travail_api import FranceTravailClient, Scope, TokenRefreshSchedule
+    >>>
+    >>> with FranceTravailClient(
+    ...     client_id="your_id",
+    ...     client_secret="your_secret",
+    ...     scopes=[Scope.OFFRES],
+    ...     token_refresh_schedule=TokenRefreshSchedule(refresh_ratio=0.5),
+    ... ) as client:
+    ...     pass  # Tokens are renewed in the background
+    """
+
+    refresh_ratio: float = 0.75
+    jitter_ratio: float = 0.1
+
+    def __post_init__(self) -> None:
+        if not 0 < self.refresh_ratio < 1:
+            raise ValueError(f"Refresh ratio must be strictly between 0 and 1, got {self.refresh_ratio}")
+        if not 0 <= self.jitter_ratio < 1:
+            raise ValueError(f"Jitter ratio must be between 0 (included) and 1, got {self.jitter_ratio}")
+
+    def delay_before_refresh(
+        self, token: Token, now: datetime.datetime, random_generator: random.Random | None = None
+    ) -> float:
+        """
+        Compute how long to wait before renewing a token.
+
+        Parameters
+        ----------
+        token : Token
+            Token to renew.
+        now : datetime.datetime
+            Current datetime.
+        random_generator : random.Random | None
+            Source of randomness for the jitter, defaults to the `random` module.
+
+        Returns
+        -------
+        float
+            Delay in seconds, 0 if the token should be renewed right away.
+        """
+        remaining_lifetime = (token.expires_at - now).total_seconds()
+        jitter = (random_generator or random).uniform(-self.jitter_ratio, self.jitter_ratio)
+        return max(0.0, remaining_lifetime * self.refresh_ratio * (1 + jitter))
@@ -0,0 +1,149 @@
+import contextlib
+import datetime
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+from collections.abc import Iterator
+from typing import Protocol
+
+from france_travail_api._cache_directory import user_cache_directory
+from france_travail_api.auth._token import Token
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+class TokenStore(Protocol):
+    """
+    Storage of OAuth2 access tokens shared between several credentials instances.
+
+    Implement this protocol to share tokens through another medium (Redis, database...).
+    """
+
+    def lock(self, key: str) -> contextlib.AbstractContextManager[None]:
+        """Hold an exclusive lock on a token while it is loaded, fetched and saved."""
+        ...
+
+    def load(self, key: str) -> Token | None:
+        """Load a token, or return None if there is none."""
+        ...
+
+    def save(self, key: str, token: Token) -> None:
+        """Save a token, replacing any previous one."""
+        ...
+
+
+class FileTokenStore:
+    """
+    Token store persisting tokens as files, shared between processes of the same host.
+
+    Concurrent renewals are serialized with `fcntl` file locks, so that a single process requests a
+    new token while the others wait for it and reuse it.
+
+    Parameters
+    ----------
+    directory : str | os.PathLike[str] | None
+        Directory where tokens are stored, defaults to a `france-travail-api/tokens` directory in the
+        cache directory of the current user (e.g. `~/.cache`), so that tokens are not shared with
+        other users of the host.
+
+    Raises
+    ------
+    RuntimeError
+        If file locks are not supported by the platform (e.g. Windows).
+
+    Notes
+    -----
+    Token files are only readable by their owner, and named after a hash of the client ID and scopes.
+
+    Examples
+    --------
+    >>> from france_travail_api import FranceTravailClient, Scope
+    >>> from france_travail_api.auth.token_store import FileTokenStore
+    >>>
+    >>> with FranceTravailClient(
+    ...     client_id="your_id",
+    ...     client_secret="your_secret",
+    ...     scopes=[Scope.OFFRES],
+    ...     token_store=FileTokenStore("/var/cache/my-app"),
+    ... ) as client:
+    ...     pass  # All processes using this directory share the same token
+    """
+
+    def __init__(self, directory: str | os.PathLike[str] | None = None) -> None:
+        if fcntl is None:  # pragma: no cover - Windows
+            raise RuntimeError("FileTokenStore requires file locks, which are not supported on this platform.")
+        self._directory = pathlib.Path(directory or user_cache_directory("tokens"))
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """
+        Hold an exclusive lock on a token, across processes.
+
+        Parameters
+        ----------
+        key : str
+            Token key.
+        """
+        self._directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with open(self._path(key, ".lock"), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def load(self, key: str) -> Token | None:
+        """
+        Load a token.
+
+        Parameters
+        ----------
+        key : str
+            Token key.
+
+        Returns
+        -------
+        Token | None
+            Stored token, or None if there is none or it cannot be read.
+        """
+        try:
+            token_json = json.loads(self._path(key, ".json").read_text())
+            return Token(
+                access_token=token_json["access_token"],
+                expires_at=datetime.datetime.fromisoformat(token_json["expires_at"]),
+                scope=token_json["scope"],
+                token_type=token_json["token_type"],
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, key: str, token: Token) -> None:
+        """
+        Save a token, atomically replacing any previous one.
+
+        Parameters
+        ----------
+        key : str
+            Token key.
+        token : Token
+            Token to save.
+        """
+        self._directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        token_json = {
+            "access_token": token.access_token,
+            "expires_at": token.expires_at.isoformat(),
+            "scope": token.scope,
+            "token_type": token.token_type,
+        }
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        with os.fdopen(file_descriptor, "w") as temporary_file:
+            json.dump(token_json, temporary_file)
+        os.replace(temporary_path, self._path(key, ".json"))
+
+    def _path(self, key: str, suffix: str) -> pathlib.Path:
+        return self._directory / f"{hashlib.sha256(key.encode()).hexdigest()}{suffix}"
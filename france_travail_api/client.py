@@ -2,8 +2,16 @@ from typing import Sequence
 
 from france_travail_api.auth._credentials import FranceTravailCredentials
 from france_travail_api.auth.scope import Scope
+from france_travail_api.auth.token_refresh import TokenRefreshSchedule
+from france_travail_api.auth.token_store import TokenStore
 from france_travail_api.http_transport._http_client import HttpClient
+from france_travail_api.http_transport.connection import ConnectionOptions
+from france_travail_api.http_transport.json_decoding import JsonDecoder
+from france_travail_api.http_transport.rate_limit import RateLimits
+from france_travail_api.http_transport.retry import RetryPolicy
 from france_travail_api.offres._client import FranceTravailOffresClient
+from france_travail_api.offres.cache import OffreCache
+from france_travail_api.offres.referentiel_cache import ReferentielCache
 
 
 class FranceTravailClient:
@@ -21,6 +29,44 @@ class FranceTravailClient:
     scopes : Sequence[Scope]
         List of API scopes defining accessible resources.
         See `france_travail_api.Scope` for available scopes.
+    token_refresh_schedule : TokenRefreshSchedule | None
+        When set, access tokens are renewed in the background following this schedule, so that
+        API calls never wait for a token renewal. Renewal runs in a thread when the client is used
+        as a context manager, and in an asyncio task when used as an async context manager.
+    token_store : TokenStore | None
+        When set, access tokens are shared through this store with other clients using the same
+        client ID and scopes, e.g. `FileTokenStore` to share them between processes of a host.
+    rate_limits : RateLimits | None
+        When set, requests are paced to respect the calls per second quota of each endpoint family,
+        instead of failing with HTTP 429 Too Many Requests.
+    retry_policy : RetryPolicy | None (default: RetryPolicy())
+        Policy for retrying requests failing with a transient error (HTTP 429, 503, connection
+        error...). None disables retries.
+    connection_options : ConnectionOptions | None
+        Tuning of the connection pool, per-phase timeouts and HTTP/2. Raise the pool limits or
+        enable HTTP/2 when sending many concurrent requests.
+    json_decoder : JsonDecoder | None
+        Decoder of the response bodies, defaults to `orjson` or `msgspec` when installed (see the
+        `orjson` and `msgspec` extras), and to the standard library otherwise.
+    offre_cache : OffreCache | None
+        When set, job offers fetched by ID are cached, and served from the cache by later calls to
+        `offres.get` and `offres.get_async`.
+    referentiel_cache : ReferentielCache | None
+        When set, referentiels are stored on disk and only downloaded again once they changed.
+    validate_search_params : bool (default: False)
+        When enabled, the codes given to multi-valued search parameters (`code_rome`, `commune`,
+        `departement`...) are checked against the referentiels and the documented number of values
+        before any search request is sent. See `SearchParamsValidator`.
+    lazy_decoding : bool (default: False)
+        When enabled, job offers are returned as `LazyOffre`, whose attributes are decoded from the
+        JSON data on first access. This speeds up searches whose results are only partially read.
+    typed_decoding : bool (default: False)
+        When enabled, job offers are decoded with `msgspec` straight from the bytes of the search
+        responses, without building dictionaries first. Requires the `msgspec` extra and cannot be
+        combined with `lazy_decoding`. Unlike the default decoding, nested objects whose keys are all
+        null (e.g. `"contact": {"nom": null}`) are decoded to None, and a value of an unexpected type
+        or an unknown code (e.g. `"typeContrat": "XYZ"`) fails the decoding of the whole search page
+        with `msgspec.ValidationError`, a `ValueError`.
     _http_client : HttpClient
         Internal HTTP client for making requests. Not intended for direct use.
 
@@ -58,32 +104,69 @@ class FranceTravailClient:
     """
 
     def __init__(
-        self, client_id: str, client_secret: str, scopes: Sequence[Scope], _http_client: HttpClient | None = None
+        self,
+        client_id: str,
+        client_secret: str,
+        scopes: Sequence[Scope],
+        token_refresh_schedule: TokenRefreshSchedule | None = None,
+        token_store: TokenStore | None = None,
+        rate_limits: RateLimits | None = None,
+        retry_policy: RetryPolicy | None = RetryPolicy(),
+        connection_options: ConnectionOptions | None = None,
+        json_decoder: JsonDecoder | None = None,
+        offre_cache: OffreCache | None = None,
+        referentiel_cache: ReferentielCache | None = None,
+        validate_search_params: bool = False,
+        lazy_decoding: bool = False,
+        typed_decoding: bool = False,
+        _http_client: HttpClient | None = None,
     ) -> None:
-        self._http_client = _http_client or HttpClient()
-        self._credentials = FranceTravailCredentials(client_id, client_secret, scopes, self._http_client)
-
-        self.offres = FranceTravailOffresClient(self._credentials, self._http_client)
+        self._http_client = _http_client or HttpClient(
+            rate_limits=rate_limits,
+            retry_policy=retry_policy,
+            connection_options=connection_options,
+            json_decoder=json_decoder,
+        )
+        self._credentials = FranceTravailCredentials(
+            client_id, client_secret, scopes, self._http_client, token_store=token_store
+        )
+        self._token_refresh_schedule = token_refresh_schedule
+
+        self.offres = FranceTravailOffresClient(
+            self._credentials,
+            self._http_client,
+            offre_cache,
+            referentiel_cache,
+            validate_search_params,
+            lazy_decoding,
+            typed_decoding,
+        )
 
     def close(self) -> None:
         """
         Close the client and its underlying HTTP client.
         """
+        self._credentials.stop_background_refresh()
         self._http_client.close()
 
     async def close_async(self) -> None:
         """
         Close the client and its underlying HTTP client asynchronously.
         """
+        await self._credentials.stop_background_refresh_async()
         await self._http_client.close_async()
 
     def __enter__(self) -> "FranceTravailClient":
+        if self._token_refresh_schedule is not None:
+            self._credentials.start_background_refresh(self._token_refresh_schedule)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self.close()
 
     async def __aenter__(self) -> "FranceTravailClient":
+        if self._token_refresh_schedule is not None:
+            await self._credentials.start_background_refresh_async(self._token_refresh_schedule)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
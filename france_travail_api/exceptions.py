@@ -98,3 +98,47 @@ class OffreNotFoundException(FranceTravailException):
     """
 
     pass
+
+
+class InvalidSearchParametersException(FranceTravailException):
+    """
+    Exception raised when search parameters are rejected before any request is sent.
+
+    Parameters
+    ----------
+    errors : list[str]
+        Description of each invalid parameter.
+
+    Attributes
+    ----------
+    errors : list[str]
+        Description of each invalid parameter.
+
+    See Also
+    --------
+    france_travail_api.offres.search_validation.SearchParamsValidator : Validator raising this exception
+
+    Examples
+    --------
+    >>> raise InvalidSearchParametersException(["commune: at most 5 values are allowed, got 6"])
+    """
+
+    def __init__(self, errors: list[str]) -> None:
+        self.errors = errors
+        super().__init__(f"Invalid search parameters: {'; '.join(errors)}")
+
+
+class IncompleteHarvestWarning(UserWarning):
+    """
+    Warning emitted when a job offers harvest cannot retrieve all the offers of a search.
+
+    This happens when a search still exceeds the API limit of 3150 results after being
+    split along every available dimension, or when the searches it was split into have fewer
+    results than itself (e.g. offers located abroad, or with a contract type which is not a
+    `CodeTypeContrat`).
+
+    Examples
+    --------
+    >>> import warnings
+    >>> warnings.simplefilter("error", IncompleteHarvestWarning)
+    """
@@ -1,21 +1,43 @@
+import asyncio
+import contextlib
+import threading
+import time
 import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
 from typing import Any
 
 import httpx
 
-from france_travail_api.http_transport._http_response import HTTPResponse
+from france_travail_api.http_transport._http_response import HTTPResponse, HTTPStreamResponse
+from france_travail_api.http_transport._rate_limiter import RateLimiter
+from france_travail_api.http_transport._retrier import Retrier
+from france_travail_api.http_transport.connection import ConnectionOptions
+from france_travail_api.http_transport.json_decoding import JsonDecoder, default_json_decoder
+from france_travail_api.http_transport.rate_limit import RateLimits
+from france_travail_api.http_transport.retry import RetryPolicy
 
 
 class HttpClient:
     """
     Basic wrapper around `httpx` client to make standardized sync and async HTTP requests.
 
-    TODO: better retry logic, logging, monitoring...
+    The sync and async `httpx` clients are created on first use, so that a client used only
+    synchronously (or only asynchronously) opens a single connection pool.
+
+    TODO: logging, monitoring...
 
     Parameters
     ----------
     timeout : float (default: 30.0)
         Timeout for HTTP requests.
+    connection_options : ConnectionOptions | None
+        Tuning of the connection pool, per-phase timeouts and HTTP/2, defaults to `ConnectionOptions()`.
+    rate_limits : RateLimits | None
+        When set, requests are delayed to respect the rate limit of their endpoint family.
+    retry_policy : RetryPolicy | None
+        When set, requests failing with a transient error are retried following this policy.
+    json_decoder : JsonDecoder | None
+        Decoder of the response bodies, defaults to the fastest one installed (see `default_json_decoder`).
 
     Examples
     --------
@@ -31,11 +53,45 @@ class HttpClient:
     >>> client.close()
     """
 
-    def __init__(self, timeout: float = 30.0):
-        self.sync_client = httpx.Client(timeout=timeout)
-        self.async_client = httpx.AsyncClient(timeout=timeout)
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        rate_limits: RateLimits | None = None,
+        retry_policy: RetryPolicy | None = None,
+        connection_options: ConnectionOptions | None = None,
+        json_decoder: JsonDecoder | None = None,
+    ):
+        self._timeout = timeout
+        self._connection_options = connection_options or ConnectionOptions()
+        self._sync_client: httpx.Client | None = None
+        self._async_client: httpx.AsyncClient | None = None
+        self._clients_lock = threading.Lock()
+        self._closed = False
+        self._rate_limiter = RateLimiter(rate_limits) if rate_limits is not None else None
+        self._retrier = Retrier(retry_policy) if retry_policy is not None else None
+        self._json_decoder = json_decoder or default_json_decoder()
+
+    @property
+    def sync_client(self) -> httpx.Client:
+        """Synchronous `httpx` client, created on first access."""
+        with self._clients_lock:
+            if self._sync_client is None:
+                self._ensure_not_closed()
+                self._sync_client = httpx.Client(**self._httpx_client_options())
+            return self._sync_client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Asynchronous `httpx` client, created on first access."""
+        with self._clients_lock:
+            if self._async_client is None:
+                self._ensure_not_closed()
+                self._async_client = httpx.AsyncClient(**self._httpx_client_options())
+            return self._async_client
 
-    def get(self, url: str, headers: dict[str, str] | None = None) -> HTTPResponse:
+    def get(
+        self, url: str, headers: dict[str, str] | None = None, json_decoder: JsonDecoder | None = None
+    ) -> HTTPResponse:
         """
         Make a GET request.
 
@@ -45,17 +101,22 @@ class HttpClient:
             URL to make the request to.
         headers : dict[str, str] | None
             Headers to include in the request.
+        json_decoder : JsonDecoder | None
+            Decoder of the body of a successful response, defaults to the decoder of the client.
+            Bodies of error responses are always decoded by the decoder of the client.
 
         Returns
         -------
         HTTPResponse
             Response from the server.
         """
-        return HTTPResponse.from_httpx_response(
-            self.sync_client.get(url, headers=self._build_request_headers("GET", headers))
+        return self._send(
+            url, lambda: self.sync_client.get(url, headers=self._build_request_headers("GET", headers)), json_decoder
         )
 
-    async def get_async(self, url: str, headers: dict[str, str] | None = None) -> HTTPResponse:
+    async def get_async(
+        self, url: str, headers: dict[str, str] | None = None, json_decoder: JsonDecoder | None = None
+    ) -> HTTPResponse:
         """
         Make an asynchronous GET request.
 
@@ -65,16 +126,127 @@ class HttpClient:
             URL to make the request to.
         headers : dict[str, str] | None
             Headers to include in the request.
+        json_decoder : JsonDecoder | None
+            Decoder of the body of a successful response, defaults to the decoder of the client.
+            Bodies of error responses are always decoded by the decoder of the client.
 
         Returns
         -------
         HTTPResponse
             Response from the server.
         """
-        return HTTPResponse.from_httpx_response(
-            await self.async_client.get(url, headers=self._build_request_headers("GET", headers))
+        return await self._send_async(
+            url,
+            lambda: self.async_client.get(url, headers=self._build_request_headers("GET", headers)),
+            json_decoder,
         )
 
+    @contextlib.contextmanager
+    def stream(self, url: str, headers: dict[str, str] | None = None) -> Iterator[HTTPStreamResponse]:
+        """
+        Make a GET request whose response body is read as it is received.
+
+        Rate limits and retries apply as for `get`, until the response headers are received. Error
+        responses are read entirely before being returned.
+
+        Parameters
+        ----------
+        url : str
+            URL to make the request to.
+        headers : dict[str, str] | None
+            Headers to include in the request.
+
+        Yields
+        ------
+        HTTPStreamResponse
+            Response from the server, closed when leaving the context.
+
+        Examples
+        --------
+        >>> with client.stream("https://api.example.com/items") as response:
+        ...     for item in response.iter_json_array():
+        ...         print(item)
+        """
+        if self._retrier is not None:
+            self._retrier.record_request()
+        attempt = 1
+        while True:
+            self._wait_for_rate_limit(url)
+            request = self.sync_client.build_request("GET", url, headers=self._build_request_headers("GET", headers))
+            try:
+                response = self.sync_client.send(request, stream=True)
+            except httpx.TransportError:
+                delay = self._delay_before_retry(attempt)
+                if delay is None:
+                    raise
+            else:
+                stream_response = HTTPStreamResponse(response, self._json_decoder)
+                delay = None if response.is_success else self._delay_before_retry(attempt, stream_response.read())
+                if delay is None:
+                    try:
+                        yield stream_response
+                    finally:
+                        response.close()
+                    return
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    @contextlib.asynccontextmanager
+    async def stream_async(self, url: str, headers: dict[str, str] | None = None) -> AsyncIterator[HTTPStreamResponse]:
+        """
+        Make an asynchronous GET request whose response body is read as it is received.
+
+        Rate limits and retries apply as for `get_async`, until the response headers are received.
+        Error responses are read entirely before being returned.
+
+        Parameters
+        ----------
+        url : str
+            URL to make the request to.
+        headers : dict[str, str] | None
+            Headers to include in the request.
+
+        Yields
+        ------
+        HTTPStreamResponse
+            Response from the server, closed when leaving the context.
+
+        Examples
+        --------
+        >>> async with client.stream_async("https://api.example.com/items") as response:
+        ...     async for item in response.iter_json_array_async():
+        ...         print(item)
+        """
+        if self._retrier is not None:
+            self._retrier.record_request()
+        attempt = 1
+        while True:
+            await self._wait_for_rate_limit_async(url)
+            request = self.async_client.build_request("GET", url, headers=self._build_request_headers("GET", headers))
+            try:
+                response = await self.async_client.send(request, stream=True)
+            except httpx.TransportError:
+                delay = self._delay_before_retry(attempt)
+                if delay is None:
+                    raise
+            else:
+                stream_response = HTTPStreamResponse(response, self._json_decoder)
+                delay = (
+                    None
+                    if response.is_success
+                    else self._delay_before_retry(attempt, await stream_response.read_async())
+                )
+                if delay is None:
+                    try:
+                        yield stream_response
+                    finally:
+                        await response.aclose()
+                    return
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
     def post(self, url: str, payload: dict[str, Any], headers: dict[str, str] | None = None) -> HTTPResponse:
         """
         Make a POST request.
@@ -93,8 +265,8 @@ class HttpClient:
         HTTPResponse
             Response from the server.
         """
-        return HTTPResponse.from_httpx_response(
-            self.sync_client.post(url, data=payload, headers=self._build_request_headers("POST", headers))
+        return self._send(
+            url, lambda: self.sync_client.post(url, data=payload, headers=self._build_request_headers("POST", headers))
         )
 
     async def post_async(
@@ -117,25 +289,126 @@ class HttpClient:
         HTTPResponse
             Response from the server.
         """
-        return HTTPResponse.from_httpx_response(
-            await self.async_client.post(url, data=payload, headers=self._build_request_headers("POST", headers))
+        return await self._send_async(
+            url,
+            lambda: self.async_client.post(url, data=payload, headers=self._build_request_headers("POST", headers)),
         )
 
     def close(self) -> None:
         """
-        Close the HTTP client.
+        Close the HTTP client and the connection pools it opened.
 
-        This method should be called when the client is no longer needed.
+        This method should be called when the client is no longer needed. The asynchronous
+        connection pool can only be closed here outside of a running event loop: use `close_async`
+        in asynchronous code. Its connections opened by an event loop which is closed now, e.g. by
+        a previous `asyncio.run`, cannot be closed anymore: the pool is then dropped.
         """
-        self.sync_client.close()
+        with self._clients_lock:
+            self._closed = True
+            sync_client, async_client = self._sync_client, self._async_client
+        if sync_client is not None:
+            sync_client.close()
+        if async_client is not None and not async_client.is_closed and not self._is_event_loop_running():
+            try:
+                asyncio.run(async_client.aclose())
+            except RuntimeError:
+                pass  # The connections are bound to a closed event loop.
 
     async def close_async(self) -> None:
         """
-        Close the asynchronous HTTP client.
+        Close the HTTP client and the connection pools it opened, asynchronously.
 
         This method should be called when the client is no longer needed.
         """
-        await self.async_client.aclose()
+        with self._clients_lock:
+            self._closed = True
+            sync_client, async_client = self._sync_client, self._async_client
+        if sync_client is not None:
+            sync_client.close()
+        if async_client is not None:
+            await async_client.aclose()
+
+    def _httpx_client_options(self) -> dict[str, Any]:
+        return {
+            "timeout": self._connection_options.to_httpx_timeout(self._timeout),
+            "limits": self._connection_options.to_httpx_limits(),
+            "http2": self._connection_options.http2,
+        }
+
+    def _ensure_not_closed(self) -> None:
+        if self._closed:
+            raise RuntimeError("Cannot send a request, as the client has been closed.")
+
+    @staticmethod
+    def _is_event_loop_running() -> bool:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    def _send(
+        self, url: str, send_request: Callable[[], httpx.Response], json_decoder: JsonDecoder | None = None
+    ) -> HTTPResponse:
+        if self._retrier is not None:
+            self._retrier.record_request()
+        attempt = 1
+        while True:
+            self._wait_for_rate_limit(url)
+            try:
+                response = self._to_http_response(send_request(), json_decoder)
+            except httpx.TransportError:
+                delay = self._delay_before_retry(attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self._delay_before_retry(attempt, response)
+                if delay is None:
+                    return response
+            time.sleep(delay)
+            attempt += 1
+
+    async def _send_async(
+        self,
+        url: str,
+        send_request: Callable[[], Awaitable[httpx.Response]],
+        json_decoder: JsonDecoder | None = None,
+    ) -> HTTPResponse:
+        if self._retrier is not None:
+            self._retrier.record_request()
+        attempt = 1
+        while True:
+            await self._wait_for_rate_limit_async(url)
+            try:
+                response = self._to_http_response(await send_request(), json_decoder)
+            except httpx.TransportError:
+                delay = self._delay_before_retry(attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self._delay_before_retry(attempt, response)
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _to_http_response(self, response: httpx.Response, json_decoder: JsonDecoder | None) -> HTTPResponse:
+        if json_decoder is None or not response.is_success:
+            json_decoder = self._json_decoder
+        return HTTPResponse.from_httpx_response(response, json_decoder)
+
+    def _delay_before_retry(self, attempt: int, response: HTTPResponse | None = None) -> float | None:
+        if self._retrier is None:
+            return None
+        return self._retrier.delay_before_retry(attempt, response)
+
+    def _wait_for_rate_limit(self, url: str) -> None:
+        if self._rate_limiter is not None:
+            self._rate_limiter.wait(url)
+
+    async def _wait_for_rate_limit_async(self, url: str) -> None:
+        if self._rate_limiter is not None:
+            await self._rate_limiter.wait_async(url)
 
     def _build_request_headers(self, verb: str, headers: dict[str, str] | None) -> dict:
         return {**(headers or {}), "X-Request-Id": str(uuid.uuid4())}
@@ -144,10 +417,10 @@ class HttpClient:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.sync_client.close()
+        self.close()
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.async_client.aclose()
+        await self.close_async()
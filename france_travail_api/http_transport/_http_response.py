@@ -1,10 +1,14 @@
 import http
 import uuid
+from collections.abc import AsyncIterator, Iterator
 from dataclasses import dataclass
 from typing import Any
 
 import httpx
 
+from france_travail_api.http_transport._json_stream import JsonArrayParser
+from france_travail_api.http_transport.json_decoding import JsonDecoder, StdlibJsonDecoder
+
 
 @dataclass(frozen=True)
 class HTTPResponse:
@@ -29,13 +33,15 @@ class HTTPResponse:
     headers: dict[str, str]
 
     @staticmethod
-    def from_httpx_response(response: httpx.Response) -> "HTTPResponse":
+    def from_httpx_response(response: httpx.Response, json_decoder: JsonDecoder | None = None) -> "HTTPResponse":
         """
         Create an HTTPResponse from an HTTPX response.
 
         Parameters
         ----------
         response : httpx.Response
+        json_decoder : JsonDecoder | None
+            Decoder of the response body, defaults to `StdlibJsonDecoder()`.
 
         Returns
         -------
@@ -46,10 +52,131 @@ class HTTPResponse:
         When the API returns HTTP 204 No Content (e.g., when a job offer is not found),
         the response has no body. In such cases, an empty dictionary is returned to maintain
         type consistency and prevent JSON parsing errors.
+
+        The body is decoded straight from the raw bytes, without decoding it to text first.
+
+        Error responses whose body is not JSON, e.g. the HTML pages of gateway errors (502, 503, 504),
+        get an empty body, so that their status can still be retried or reported.
         """
         return HTTPResponse(
             request_id=uuid.UUID(response.request.headers["X-Request-Id"]),
             status_code=http.HTTPStatus(response.status_code),
-            body=response.json() if response.text else {},  # Empty dict for HTTP 204 No Content
+            body=_decode_body(response, json_decoder or _STDLIB_JSON_DECODER),
             headers=dict(response.headers),
         )
+
+
+_STDLIB_JSON_DECODER = StdlibJsonDecoder()
+
+
+def _decode_body(response: httpx.Response, json_decoder: JsonDecoder) -> Any:
+    content = response.content
+    if not content:
+        return {}  # Empty for HTTP 204
+    if response.is_success:
+        return json_decoder.decode(content)
+    try:
+        return json_decoder.decode(content)
+    except ValueError:
+        return {}
+
+
+class HTTPStreamResponse:
+    """
+    Represents an HTTP response from the server, whose body is read as it is received.
+
+    Parameters
+    ----------
+    response : httpx.Response
+        HTTPX response opened in streaming mode, whose body is not read yet.
+    json_decoder : JsonDecoder | None
+        Decoder of the body when it is read entirely, defaults to `StdlibJsonDecoder()`.
+
+    Attributes
+    ----------
+    status_code : http.HTTPStatus
+        HTTP status code.
+    request_id : uuid.UUID
+        Request ID for the request.
+    headers : dict[str, str]
+        Response headers.
+    """
+
+    def __init__(self, response: httpx.Response, json_decoder: JsonDecoder | None = None) -> None:
+        self.status_code = http.HTTPStatus(response.status_code)
+        self.request_id = uuid.UUID(response.request.headers["X-Request-Id"])
+        self.headers = dict(response.headers)
+        self._response = response
+        self._json_decoder = json_decoder
+
+    def iter_json_array(self, key: str | None = None) -> Iterator[Any]:
+        """
+        Iterate over the items of a JSON array of the body, each one decoded as soon as it is received.
+
+        Parameters
+        ----------
+        key : str | None
+            Key of the array in the top-level object of the body. When None, the body itself is the array.
+
+        Yields
+        ------
+        Any
+            Items of the array.
+
+        Raises
+        ------
+        ValueError
+            If the body is not valid JSON or is truncated.
+        """
+        parser = JsonArrayParser(key)
+        for chunk in self._response.iter_bytes():
+            yield from parser.feed(chunk)
+        yield from parser.close()
+
+    async def iter_json_array_async(self, key: str | None = None) -> AsyncIterator[Any]:
+        """
+        Iterate asynchronously over the items of a JSON array of the body, each one decoded as soon as it is received.
+
+        Parameters
+        ----------
+        key : str | None
+            Key of the array in the top-level object of the body. When None, the body itself is the array.
+
+        Yields
+        ------
+        Any
+            Items of the array.
+
+        Raises
+        ------
+        ValueError
+            If the body is not valid JSON or is truncated.
+        """
+        parser = JsonArrayParser(key)
+        async for chunk in self._response.aiter_bytes():
+            for item in parser.feed(chunk):
+                yield item
+        for item in parser.close():
+            yield item
+
+    def read(self) -> HTTPResponse:
+        """
+        Read and decode the whole body, e.g. to handle an error response.
+
+        Returns
+        -------
+        HTTPResponse
+        """
+        self._response.read()
+        return HTTPResponse.from_httpx_response(self._response, self._json_decoder)
+
+    async def read_async(self) -> HTTPResponse:
+        """
+        Read and decode asynchronously the whole body, e.g. to handle an error response.
+
+        Returns
+        -------
+        HTTPResponse
+        """
+        await self._response.aread()
+        return HTTPResponse.from_httpx_response(self._response, self._json_decoder)
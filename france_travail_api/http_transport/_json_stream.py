@@ -0,0 +1,198 @@
+import codecs
+import enum
+import json
+import re
+from typing import Any, cast
+
+_STRING = r'"(?:[^"\\]++|\\.)*+"'
+
+# Before the streamed array, each pattern consumes complete strings and other insignificant characters in a
+# single match, and stops at the next bracket, at the quote of a string not received completely yet, or at
+# the end of the received text.
+_NESTED_VALUE = re.compile(r'(?:[^"\[\]{}]++|' + _STRING + r')*+(?P<token>[\[\]{}"]|\Z)')
+_OBJECT_KEY = re.compile(r'(?:[^"\[\]{}]++|(?P<key>' + _STRING + r'))*+(?P<token>[\[\]{}"]|\Z)')
+_WHITESPACE = re.compile(r"[ \t\n\r]*+")
+_NUMBER_CONTINUATION = re.compile(r"[0-9.eE+-]*+")
+
+
+class _State(enum.Enum):
+    SEEKING_ARRAY = "seeking_array"
+    IN_ARRAY = "in_array"
+    DONE = "done"
+
+
+class JsonArrayParser:
+    """
+    Incremental parser of the items of a JSON array, fed with the bytes of a document as they arrive.
+
+    Each item is decoded as soon as its last byte is received, by the C scanner of the `json` module,
+    and the text of the items already decoded is discarded: only the item being received is buffered.
+
+    Parameters
+    ----------
+    key : str | None
+        Key of the array in the top-level object of the document, e.g. `resultats`.
+        When None, the document itself is the array.
+
+    Examples
+    --------
+    >>> parser = JsonArrayParser(key="resultats")
+    >>> parser.feed(b'{"resultats": [{"id": "048KLTP"}, {"id": "04')
+    [{'id': '048KLTP'}]
+    >>> parser.feed(b'8KLTQ"}]}')
+    [{'id': '048KLTQ'}]
+    >>> parser.close()
+    []
+    """
+
+    def __init__(self, key: str | None = None) -> None:
+        self._key = json.dumps(key) if key is not None else None
+        self._utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._text = ""
+        self._state = _State.SEEKING_ARRAY
+        self._depth = 0
+        self._last_key: str | None = None
+        self._items_count = 0
+        self._after_item = False
+        self._min_retry_length = 0
+        self._final = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """
+        Parse the next bytes of the document.
+
+        Parameters
+        ----------
+        chunk : bytes
+            Bytes following the ones already fed.
+
+        Returns
+        -------
+        list[Any]
+            Items of the array completed by these bytes.
+
+        Raises
+        ------
+        ValueError
+            If the document is not a JSON array, or an object holding the array under its key.
+        """
+        return self._parse(self._utf8_decoder.decode(chunk))
+
+    def close(self) -> list[Any]:
+        """
+        Parse the last bytes of the document, and check that it was fed entirely.
+
+        Returns
+        -------
+        list[Any]
+            Items of the array completed by the last bytes.
+
+        Raises
+        ------
+        ValueError
+            If the document is truncated or an item is not valid JSON.
+        """
+        self._final = True
+        items = self._parse(self._utf8_decoder.decode(b"", final=True))
+        if self._state is _State.IN_ARRAY or self._depth != 0 or self._text.strip():
+            raise ValueError("Truncated or invalid JSON document")
+        return items
+
+    def _parse(self, text: str) -> list[Any]:
+        if self._state is _State.DONE:
+            return []
+
+        self._text += text
+        items: list[Any] = []
+        position = 0
+        if self._state is _State.SEEKING_ARRAY:
+            position = self._seek_array(position)
+        if self._state is _State.IN_ARRAY:
+            position = self._parse_items(position, items)
+        self._text = self._text[position:] if self._state is not _State.DONE else ""
+        return items
+
+    def _seek_array(self, position: int) -> int:
+        text = self._text
+        while True:
+            if self._key is None:
+                position = _match(_WHITESPACE, text, position).end()
+                if position == len(text):
+                    return position
+                if text[position] != "[":
+                    raise ValueError("Expected a JSON array")
+                self._state = _State.IN_ARRAY
+                return position + 1
+
+            if self._depth == 1:
+                match = _match(_OBJECT_KEY, text, position)
+                if match.group("key") is not None:
+                    self._last_key = match.group("key")
+            else:
+                match = _match(_NESTED_VALUE, text, position)
+            token_start = match.start("token")
+            if token_start == len(text) or text[token_start] == '"':
+                # Wait for the rest of the text, or of the string it ends with.
+                return token_start
+
+            position = token_start + 1
+            if text[token_start] in "[{":
+                self._depth += 1
+                if text[token_start] == "[" and self._depth == 2 and self._last_key == self._key:
+                    self._state = _State.IN_ARRAY
+                    return position
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._state = _State.DONE  # The document has no array under the key.
+                    return position
+
+    def _parse_items(self, position: int, items: list[Any]) -> int:
+        text = self._text
+        while True:
+            position = _match(_WHITESPACE, text, position).end()
+            if position == len(text):
+                return position
+
+            if self._after_item:
+                if text[position] == ",":
+                    self._after_item = False
+                    position += 1
+                    continue
+                if text[position] == "]":
+                    self._state = _State.DONE
+                    self._depth = 0
+                    return position + 1
+                raise ValueError(f"Expected ',' or ']' after item {self._items_count} of the JSON array")
+
+            if text[position] == "]" and self._items_count == 0:
+                self._state = _State.DONE
+                self._depth = 0
+                return position + 1
+            if len(text) - position < self._min_retry_length and not self._final:
+                return position
+            try:
+                item, end = self._json_decoder.raw_decode(text, position)
+            except json.JSONDecodeError:
+                # The item is not received completely yet. Decoding is only attempted again once twice as
+                # much text is received, so that a large item received in small chunks is decoded in linear time.
+                self._min_retry_length = 2 * (len(text) - position)
+                return position
+            if (
+                text[position] not in '{["'
+                and not self._final
+                and _match(_NUMBER_CONTINUATION, text, end).end() == len(text)
+            ):
+                # A number or literal may be continued by the next bytes, e.g. `-2.` by `5e3`.
+                return position
+            self._min_retry_length = 0
+            items.append(item)
+            self._items_count += 1
+            self._after_item = True
+            position = end
+
+
+def _match(pattern: re.Pattern[str], text: str, position: int) -> re.Match[str]:
+    """Match a pattern that matches any text, possibly with an empty match."""
+    return cast(re.Match[str], pattern.match(text, position))
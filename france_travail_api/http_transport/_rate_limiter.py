@@ -0,0 +1,128 @@
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+
+from france_travail_api.http_transport.rate_limit import EndpointFamily, RateLimits
+
+
+class TokenBucket:
+    """
+    Token bucket pacing calls to a given rate.
+
+    Each call takes a token from the bucket, which refills continuously at `rate` tokens per second
+    up to its capacity. When the bucket is empty, calls reserve the next tokens and wait for them,
+    in their order of arrival. The bucket is shared safely between threads and asyncio tasks.
+
+    Parameters
+    ----------
+    rate : float
+        Tokens added per second.
+    capacity : float | None
+        Maximum number of tokens, i.e. the largest burst of calls sent without waiting. Defaults
+        to one second worth of tokens, and at least 1.
+    monotonic : Callable[[], float]
+        Source of the current time in seconds, defaults to `time.monotonic`.
+
+    Examples
+    --------
+    >>> bucket = TokenBucket(rate=2.0)
+    >>> bucket.reserve(), bucket.reserve()
+    (0.0, 0.0)
+    >>> bucket.reserve() > 0  # Waits about half a second
+    True
+    """
+
+    def __init__(
+        self, rate: float, capacity: float | None = None, monotonic: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._rate = rate
+        self._capacity = capacity if capacity is not None else max(1.0, rate)
+        self._monotonic = monotonic
+        self._tokens = self._capacity
+        self._updated_at = monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token from the bucket.
+
+        Returns
+        -------
+        float
+            Delay in seconds to wait before making the call, 0 if it can be made right away.
+        """
+        with self._lock:
+            now = self._monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+            self._updated_at = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self._rate)
+
+
+class RateLimiter:
+    """
+    Paces requests to each endpoint family according to its rate limit.
+
+    Parameters
+    ----------
+    rate_limits : RateLimits
+        Rate limit of each endpoint family.
+    monotonic : Callable[[], float]
+        Source of the current time in seconds, defaults to `time.monotonic`.
+
+    Examples
+    --------
+    >>> rate_limiter = RateLimiter(RateLimits(search=4.0))
+    >>> rate_limiter.wait("https://api.francetravail.io/partenaire/offresdemploi/v2/offres/search")
+    """
+
+    def __init__(self, rate_limits: RateLimits, monotonic: Callable[[], float] = time.monotonic) -> None:
+        self._buckets = {
+            family: TokenBucket(calls_per_second, monotonic=monotonic)
+            for family in EndpointFamily
+            if (calls_per_second := rate_limits.for_family(family)) is not None
+        }
+
+    def reserve(self, url: str) -> float:
+        """
+        Reserve a call to a URL.
+
+        Parameters
+        ----------
+        url : str
+            URL of the request.
+
+        Returns
+        -------
+        float
+            Delay in seconds to wait before making the request.
+        """
+        bucket = self._buckets.get(EndpointFamily.from_url(url))
+        return bucket.reserve() if bucket is not None else 0.0
+
+    def wait(self, url: str) -> None:
+        """
+        Wait until a request to a URL can be made.
+
+        Parameters
+        ----------
+        url : str
+            URL of the request.
+        """
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self, url: str) -> None:
+        """
+        Wait asynchronously until a request to a URL can be made.
+
+        Parameters
+        ----------
+        url : str
+            URL of the request.
+        """
+        delay = self.reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
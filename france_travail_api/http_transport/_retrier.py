@@ -0,0 +1,84 @@
+import datetime
+import random
+import threading
+
+from france_travail_api.http_transport._http_response import HTTPResponse
+from france_travail_api.http_transport.retry import RetryPolicy, parse_retry_after
+
+
+class Retrier:
+    """
+    Decides whether and when to retry requests, following a retry policy and its retry budget.
+
+    The retry budget is shared by all the requests sent through the retrier, from any thread or
+    asyncio task.
+
+    Parameters
+    ----------
+    retry_policy : RetryPolicy
+        Policy to follow.
+    random_generator : random.Random | None
+        Source of randomness for the backoff jitter, defaults to the `random` module.
+
+    Examples
+    --------
+    >>> retrier = Retrier(RetryPolicy(backoff_base=0))
+    >>> retrier.record_request()
+    >>> retrier.delay_before_retry(attempt=1)  # Connection error
+    0.0
+    """
+
+    def __init__(self, retry_policy: RetryPolicy, random_generator: random.Random | None = None) -> None:
+        self._retry_policy = retry_policy
+        self._random_generator = random_generator
+        self._retry_budget = float(retry_policy.retry_budget)
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        """Record a new request, replenishing the retry budget."""
+        with self._lock:
+            self._retry_budget = min(
+                float(self._retry_policy.retry_budget), self._retry_budget + self._retry_policy.retry_budget_ratio
+            )
+
+    def delay_before_retry(self, attempt: int, response: HTTPResponse | None = None) -> float | None:
+        """
+        Compute the delay before retrying a failed attempt.
+
+        Parameters
+        ----------
+        attempt : int
+            Number of the failed attempt, starting at 1.
+        response : HTTPResponse | None
+            Response of the attempt, None if its connection failed.
+
+        Returns
+        -------
+        float | None
+            Delay in seconds before the retry, or None if the request must not be retried.
+        """
+        if attempt >= self._retry_policy.max_attempts:
+            return None
+
+        if response is None:
+            if not self._retry_policy.retry_on_connection_errors:
+                return None
+            delay = self._retry_policy.backoff(attempt, self._random_generator)
+        else:
+            if response.status_code not in self._retry_policy.retry_statuses:
+                return None
+            retry_after = parse_retry_after(response.headers, datetime.datetime.now(datetime.UTC))
+            if retry_after is not None and retry_after > self._retry_policy.max_retry_after:
+                return None
+            delay = (
+                retry_after if retry_after is not None else self._retry_policy.backoff(attempt, self._random_generator)
+            )
+
+        return delay if self._withdraw_from_retry_budget() else None
+
+    def _withdraw_from_retry_budget(self) -> bool:
+        with self._lock:
+            if self._retry_budget < 1:
+                return False
+            self._retry_budget -= 1
+            return True
@@ -0,0 +1,103 @@
+import importlib.util
+from dataclasses import dataclass
+
+import httpx
+
+
+@dataclass(frozen=True)
+class ConnectionOptions:
+    """
+    Tuning of the connection pool and timeouts of the HTTP client.
+
+    Parameters
+    ----------
+    max_connections : int | None (default: 100)
+        Maximum number of concurrent connections, None for no limit. Requests beyond this limit wait
+        for a free connection, up to `pool_timeout`.
+    max_keepalive_connections : int | None (default: 20)
+        Maximum number of idle connections kept alive for reuse, None for no limit.
+    keepalive_expiry : float | None (default: 5.0)
+        Seconds after which an idle connection is closed, None to keep it open indefinitely.
+    connect_timeout : float | None
+        Timeout to establish a connection, defaults to the timeout of the HTTP client.
+    read_timeout : float | None
+        Timeout to receive a chunk of the response, defaults to the timeout of the HTTP client.
+    write_timeout : float | None
+        Timeout to send a chunk of the request, defaults to the timeout of the HTTP client.
+    pool_timeout : float | None
+        Timeout to acquire a connection from the pool, defaults to the timeout of the HTTP client.
+    http2 : bool (default: False)
+        Whether to multiplex requests over HTTP/2 connections. Requires the `http2` extra:
+        `pip install france-travail-api[http2]`.
+
+    Raises
+    ------
+    ImportError
+        If `http2` is enabled but the `h2` package is not installed.
+
+    Examples
+    --------
+    >>> from france_travail_api import ConnectionOptions, FranceTravailClient, Scope
+    >>>
+    >>> async with FranceTravailClient(
+    ...     client_id="your_id",
+    ...     client_secret="your_secret",
+    ...     scopes=[Scope.OFFRES],
+    ...     connection_options=ConnectionOptions(max_keepalive_connections=50, connect_timeout=5.0, http2=True),
+    ... ) as client:
+    ...     pass  # Concurrent requests share multiplexed connections
+    """
+
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    connect_timeout: float | None = None
+    read_timeout: float | None = None
+    write_timeout: float | None = None
+    pool_timeout: float | None = None
+    http2: bool = False
+
+    def __post_init__(self) -> None:
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError("HTTP/2 requires the `http2` extra: pip install france-travail-api[http2]")
+
+    def to_httpx_limits(self) -> httpx.Limits:
+        """
+        Build the connection pool limits of `httpx` clients.
+
+        Returns
+        -------
+        httpx.Limits
+            Connection pool limits.
+        """
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def to_httpx_timeout(self, default_timeout: float) -> httpx.Timeout:
+        """
+        Build the timeouts of `httpx` clients.
+
+        Parameters
+        ----------
+        default_timeout : float
+            Timeout in seconds of the phases without a specific timeout.
+
+        Returns
+        -------
+        httpx.Timeout
+            Timeouts of each phase of a request.
+        """
+        return httpx.Timeout(
+            default_timeout,
+            connect=self._or_default(self.connect_timeout, default_timeout),
+            read=self._or_default(self.read_timeout, default_timeout),
+            write=self._or_default(self.write_timeout, default_timeout),
+            pool=self._or_default(self.pool_timeout, default_timeout),
+        )
+
+    @staticmethod
+    def _or_default(timeout: float | None, default_timeout: float) -> float:
+        return timeout if timeout is not None else default_timeout
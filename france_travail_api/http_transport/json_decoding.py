@@ -0,0 +1,108 @@
+import json
+from typing import Any, Protocol
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None  # type: ignore[assignment]
+
+
+class JsonDecoder(Protocol):
+    """
+    Decoder of the JSON bodies of HTTP responses.
+
+    Implement this protocol to decode responses with another JSON library.
+    """
+
+    def decode(self, content: bytes) -> Any:
+        """Decode a JSON document from the raw bytes of a response body."""
+        ...
+
+
+class StdlibJsonDecoder:
+    """
+    JSON decoder based on the `json` module of the standard library.
+
+    Examples
+    --------
+    >>> StdlibJsonDecoder().decode(b'{"id": "048KLTP"}')
+    {'id': '048KLTP'}
+    """
+
+    def decode(self, content: bytes) -> Any:
+        return json.loads(content)
+
+
+class OrjsonDecoder:
+    """
+    JSON decoder based on `orjson`, several times faster than the standard library.
+
+    Requires the `orjson` extra: `pip install france-travail-api[orjson]`.
+
+    Raises
+    ------
+    ImportError
+        If `orjson` is not installed.
+
+    Examples
+    --------
+    >>> OrjsonDecoder().decode(b'{"id": "048KLTP"}')
+    {'id': '048KLTP'}
+    """
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("OrjsonDecoder requires the `orjson` extra: pip install france-travail-api[orjson]")
+
+    def decode(self, content: bytes) -> Any:
+        return orjson.loads(content)
+
+
+class MsgspecJsonDecoder:
+    """
+    JSON decoder based on `msgspec`, several times faster than the standard library.
+
+    Requires the `msgspec` extra: `pip install france-travail-api[msgspec]`.
+
+    Raises
+    ------
+    ImportError
+        If `msgspec` is not installed.
+
+    Examples
+    --------
+    >>> MsgspecJsonDecoder().decode(b'{"id": "048KLTP"}')
+    {'id': '048KLTP'}
+    """
+
+    def __init__(self) -> None:
+        if msgspec is None:
+            raise ImportError(
+                "MsgspecJsonDecoder requires the `msgspec` extra: pip install france-travail-api[msgspec]"
+            )
+        self._decoder = msgspec.json.Decoder()
+
+    def decode(self, content: bytes) -> Any:
+        return self._decoder.decode(content)
+
+
+def default_json_decoder() -> JsonDecoder:
+    """
+    Pick the fastest JSON decoder available.
+
+    Returns
+    -------
+    JsonDecoder
+        `OrjsonDecoder` if `orjson` is installed, else `MsgspecJsonDecoder` if `msgspec` is installed,
+        else `StdlibJsonDecoder`.
+    """
+    if orjson is not None:
+        return OrjsonDecoder()
+    if msgspec is not None:
+        return MsgspecJsonDecoder()
+    return StdlibJsonDecoder()
@@ -0,0 +1,110 @@
+import enum
+from dataclasses import dataclass
+
+
+class EndpointFamily(enum.Enum):
+    """
+    Families of France Travail endpoints sharing a call quota.
+
+    Examples
+    --------
+    >>> EndpointFamily.from_url("https://api.francetravail.io/partenaire/offresdemploi/v2/offres/search?motsCles=python")
+    <EndpointFamily.SEARCH: 'search'>
+    """
+
+    SEARCH = "search"
+    GET = "get"
+    REFERENTIEL = "referentiel"
+    TOKEN = "token"
+
+    @staticmethod
+    def from_url(url: str) -> "EndpointFamily":
+        """
+        Find the family of the endpoint targeted by a URL.
+
+        Parameters
+        ----------
+        url : str
+            URL of the request.
+
+        Returns
+        -------
+        EndpointFamily
+            Family of the endpoint, `GET` for any endpoint which is not a search, a referentiel or the
+            token endpoint.
+        """
+        path = url.split("?", 1)[0]
+        if "/connexion/oauth2/" in path:
+            return EndpointFamily.TOKEN
+        if "/referentiel/" in path:
+            return EndpointFamily.REFERENTIEL
+        if path.endswith("/offres/search"):
+            return EndpointFamily.SEARCH
+        return EndpointFamily.GET
+
+
+@dataclass(frozen=True)
+class RateLimits:
+    """
+    Maximum number of calls per second sent to each endpoint family.
+
+    Requests exceeding a limit are delayed rather than rejected, so that a client saturates its
+    quota without receiving HTTP 429 Too Many Requests responses. Short bursts of up to one second
+    worth of calls are sent right away.
+
+    Parameters
+    ----------
+    search : float | None (default: 10.0)
+        Calls per second to the job offers search endpoint, None for no limit.
+    get : float | None (default: 10.0)
+        Calls per second to the job offer details endpoint, None for no limit.
+    referentiel : float | None (default: 10.0)
+        Calls per second to the referentiel endpoints, None for no limit.
+    token : float | None (default: 10.0)
+        Calls per second to the OAuth2 token endpoint, None for no limit.
+
+    Notes
+    -----
+    Quotas are granted per application: check those of your application on francetravail.io and
+    share a single client between the threads and tasks of a process.
+
+    Examples
+    --------
+    >>> from france_travail_api import FranceTravailClient, RateLimits, Scope
+    >>>
+    >>> with FranceTravailClient(
+    ...     client_id="your_id",
+    ...     client_secret="your_secret",
+    ...     scopes=[Scope.OFFRES],
+    ...     rate_limits=RateLimits(search=4.0),
+    ... ) as client:
+    ...     pass  # Searches are paced to 4 calls per second
+    """
+
+    search: float | None = 10.0
+    get: float | None = 10.0
+    referentiel: float | None = 10.0
+    token: float | None = 10.0
+
+    def __post_init__(self) -> None:
+        for family in EndpointFamily:
+            calls_per_second = self.for_family(family)
+            if calls_per_second is not None and calls_per_second <= 0:
+                raise ValueError(f"Rate limit of {family.value} endpoints must be positive, got {calls_per_second}")
+
+    def for_family(self, family: EndpointFamily) -> float | None:
+        """
+        Get the rate limit of an endpoint family.
+
+        Parameters
+        ----------
+        family : EndpointFamily
+            Endpoint family.
+
+        Returns
+        -------
+        float | None
+            Calls per second, None for no limit.
+        """
+        calls_per_second: float | None = getattr(self, family.value)
+        return calls_per_second
@@ -0,0 +1,137 @@
+import datetime
+import email.utils
+import http
+import random
+from dataclasses import dataclass, field
+
+_DEFAULT_RETRY_STATUSES = frozenset(
+    {
+        http.HTTPStatus.REQUEST_TIMEOUT,
+        http.HTTPStatus.TOO_MANY_REQUESTS,
+        http.HTTPStatus.INTERNAL_SERVER_ERROR,
+        http.HTTPStatus.BAD_GATEWAY,
+        http.HTTPStatus.SERVICE_UNAVAILABLE,
+        http.HTTPStatus.GATEWAY_TIMEOUT,
+    }
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Policy for retrying requests which failed with a transient error.
+
+    Requests are retried when the server answers with one of `retry_statuses`, or when the
+    connection fails (connection error, timeout...). Retries wait for an exponential backoff with
+    full jitter, or for the delay requested by the server in its `Retry-After` header.
+
+    A retry budget prevents retries from amplifying an outage: retries first consume an initial
+    allowance of `retry_budget` retries, which is then replenished by `retry_budget_ratio` retry for
+    each request sent.
+
+    Parameters
+    ----------
+    max_attempts : int (default: 3)
+        Maximum number of attempts per request, including the first one. 1 disables retries.
+    backoff_base : float (default: 0.5)
+        Backoff in seconds before the first retry, doubled at each retry.
+    backoff_max : float (default: 30.0)
+        Maximum backoff in seconds.
+    retry_statuses : frozenset[http.HTTPStatus]
+        Statuses of responses to retry, defaults to 408, 429, 500, 502, 503 and 504.
+    retry_on_connection_errors : bool (default: True)
+        Whether to retry requests whose connection failed.
+    max_retry_after : float (default: 60.0)
+        Maximum delay in seconds requested by a `Retry-After` header to wait for. Responses asking
+        for a longer delay are returned without retrying.
+    retry_budget : int (default: 10)
+        Maximum number of retries sent in a row without any new request in between.
+    retry_budget_ratio : float (default: 0.2)
+        Retries allowed for each request sent once the retry budget is spent.
+
+    Examples
+    --------
+    >>> from france_travail_api import FranceTravailClient, RetryPolicy, Scope
+    >>>
+    >>> with FranceTravailClient(
+    ...     client_id="your_id",
+    ...     client_secret="your_secret",
+    ...     scopes=[Scope.OFFRES],
+    ...     retry_policy=RetryPolicy(max_attempts=5),
+    ... ) as client:
+    ...     pass  # Transient errors are retried up to 4 times
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    retry_statuses: frozenset[http.HTTPStatus] = field(default=_DEFAULT_RETRY_STATUSES)
+    retry_on_connection_errors: bool = True
+    max_retry_after: float = 60.0
+    retry_budget: int = 10
+    retry_budget_ratio: float = 0.2
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError(f"Max attempts must be at least 1, got {self.max_attempts}")
+        if self.backoff_base < 0 or self.backoff_max < 0:
+            raise ValueError(f"Backoff must be positive, got base {self.backoff_base} and max {self.backoff_max}")
+        if self.retry_budget < 0 or self.retry_budget_ratio < 0:
+            raise ValueError(
+                f"Retry budget must be positive, got {self.retry_budget} and ratio {self.retry_budget_ratio}"
+            )
+
+    def backoff(self, retry_number: int, random_generator: random.Random | None = None) -> float:
+        """
+        Compute the backoff before a retry, with full jitter.
+
+        Parameters
+        ----------
+        retry_number : int
+            Number of the retry, starting at 1.
+        random_generator : random.Random | None
+            Source of randomness for the jitter, defaults to the `random` module.
+
+        Returns
+        -------
+        float
+            Delay in seconds, uniformly drawn between 0 and the exponential backoff.
+        """
+        exponential_backoff = min(self.backoff_max, self.backoff_base * 2 ** (retry_number - 1))
+        return (random_generator or random).uniform(0, exponential_backoff)
+
+
+def parse_retry_after(headers: dict[str, str], now: datetime.datetime) -> float | None:
+    """
+    Parse the delay requested by the `Retry-After` header of a response.
+
+    Parameters
+    ----------
+    headers : dict[str, str]
+        Response headers.
+    now : datetime.datetime
+        Current datetime, to compute the delay of an HTTP date.
+
+    Returns
+    -------
+    float | None
+        Delay in seconds, or None if the header is missing or invalid.
+
+    Examples
+    --------
+    >>> parse_retry_after({"retry-after": "2"}, datetime.datetime.now(datetime.UTC))
+    2.0
+    """
+    value = next((value for name, value in headers.items() if name.lower() == "retry-after"), None)
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.UTC)
+    return max(0.0, (retry_at - now).total_seconds())
@@ -1,12 +1,31 @@
+import asyncio
+import concurrent.futures
+import datetime
 import http
+import inspect
+import itertools
+import warnings
+from typing import Any, AsyncIterator, Iterable, Iterator
 
 from france_travail_api._url import FranceTravailUrl
+from france_travail_api.auth._authenticated_http_client import AuthenticatedHttpClient
 from france_travail_api.auth._credentials import FranceTravailCredentials
-from france_travail_api.exceptions import OffreNotFoundException
+from france_travail_api.exceptions import FranceTravailException, IncompleteHarvestWarning, OffreNotFoundException
 from france_travail_api.http_transport._http_client import HttpClient
 from france_travail_api.http_transport._http_response import HTTPResponse
+from france_travail_api.http_transport.json_decoding import JsonDecoder
+from france_travail_api.offres._pagination import (
+    SEARCH_PAGE_SIZE,
+    SEARCH_RESULTS_LIMIT,
+    SearchPage,
+    SearchRange,
+    parse_content_range_total,
+)
+from france_travail_api.offres._partitioning import SearchPartitioner, SplitCoverage
 from france_travail_api.offres._referentiels_client import ReferentielsClient
-from france_travail_api.offres.models import Offre
+from france_travail_api.offres.cache import OffreCache
+from france_travail_api.offres.models import LazyOffre, Offre
+from france_travail_api.offres.models._typed_decoding import TypedOffreDecoder
 from france_travail_api.offres.models.contrat import CodeTypeContrat
 from france_travail_api.offres.models.experience import ExperienceExigee
 from france_travail_api.offres.models.search_params import (
@@ -18,16 +37,37 @@ from france_travail_api.offres.models.search_params import (
     Qualification,
     Sort,
 )
+from france_travail_api.offres.referentiel_cache import ReferentielCache
+from france_travail_api.offres.search_validation import SearchParamsValidator
 
 JOB_OFFER_SEARCH_API_URL = "https://api.francetravail.io/partenaire/offresdemploi/v2/offres/search"
 JOB_OFFER_GET_API_URL = "https://api.francetravail.io/partenaire/offresdemploi/v2/offres"
 
 
 class FranceTravailOffresClient:
-    def __init__(self, credentials: FranceTravailCredentials, http_client: HttpClient) -> None:
+    def __init__(
+        self,
+        credentials: FranceTravailCredentials,
+        http_client: HttpClient,
+        offre_cache: OffreCache | None = None,
+        referentiel_cache: ReferentielCache | None = None,
+        validate_search_params: bool = False,
+        lazy_decoding: bool = False,
+        typed_decoding: bool = False,
+    ) -> None:
+        if lazy_decoding and typed_decoding:
+            raise ValueError("Lazy decoding and typed decoding cannot be combined")
         self._credentials = credentials
         self._http_client = http_client
-        self.referentiels = ReferentielsClient(credentials, http_client)
+        self._offre_cache = offre_cache
+        self._authenticated_http_client = AuthenticatedHttpClient(credentials, http_client)
+        self.referentiels = ReferentielsClient(credentials, http_client, referentiel_cache)
+        self._search_params_validator = SearchParamsValidator(self.referentiels) if validate_search_params else None
+        self._typed_offre_decoder = TypedOffreDecoder() if typed_decoding else None
+        if self._typed_offre_decoder is not None:
+            self._decode_offre = self._typed_offre_decoder.from_dict
+        else:
+            self._decode_offre = LazyOffre.from_dict if lazy_decoding else Offre.from_dict
 
     def search(
         self,
@@ -168,6 +208,13 @@ class FranceTravailOffresClient:
         list[Offre]
             List of job offers matching the search criteria
 
+        Raises
+        ------
+        InvalidSearchParametersException
+            If search parameters validation is enabled and a parameter is invalid.
+        FranceTravailException
+            If the API responds with an error.
+
         Examples
         --------
         >>> client = FranceTravailOffresClient(credentials, http_client)
@@ -182,10 +229,11 @@ class FranceTravailOffresClient:
         params = locals().copy()
         params.pop("self")
         params = self._convert_enums_to_api_values(params)
+        self._validate_search_params(params)
 
         url = self._build_search_url(params)
-        response_body = self._execute_search_request(url)
-        return [Offre.from_dict(offre_json) for offre_json in response_body.get("resultats", [])]
+        response = self._execute_search_request(url, self._typed_offre_decoder)
+        return self._parse_search_response(response).offres
 
     async def search_async(
         self,
@@ -326,6 +374,13 @@ class FranceTravailOffresClient:
         list[Offre]
             List of job offers matching the search criteria
 
+        Raises
+        ------
+        InvalidSearchParametersException
+            If search parameters validation is enabled and a parameter is invalid.
+        FranceTravailException
+            If the API responds with an error.
+
         Examples
         --------
         >>> import asyncio
@@ -341,10 +396,485 @@ class FranceTravailOffresClient:
         params = locals().copy()
         params.pop("self")
         params = self._convert_enums_to_api_values(params)
+        await self._validate_search_params_async(params)
 
         url = self._build_search_url(params)
-        response_body = await self._execute_search_request_async(url)
-        return [Offre.from_dict(offre_json) for offre_json in response_body.get("resultats", [])]
+        response = await self._execute_search_request_async(url, self._typed_offre_decoder)
+        return self._parse_search_response(response).offres
+
+    def search_raw(self, mots_cles: str, **search_params: Any) -> list[dict[str, Any]]:
+        """Search for job offers, returning their JSON data without building `Offre` objects.
+
+        Use it to forward job offers as they are (e.g. to a data lake), without paying for their
+        conversion into models.
+
+        Parameters
+        ----------
+        mots_cles : str
+            Keywords to search for
+        **search_params : Any
+            Any other parameter accepted by `search`
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            JSON data of the job offers matching the search criteria, as returned by the API
+
+        Raises
+        ------
+        TypeError
+            If an unknown search parameter is given.
+        InvalidSearchParametersException
+            If search parameters validation is enabled and a parameter is invalid.
+        FranceTravailException
+            If the API responds with an error.
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> client.search_raw(mots_cles="boulanger", departement="75")
+        [{'id': '201WLXK', 'intitule': 'Boulanger / Boulangère (H/F)', ...}, ...]
+        """
+        params = self._build_raw_search_params(mots_cles=mots_cles, **search_params)
+        self._validate_search_params(params)
+
+        url = self._build_search_url(params)
+        response = self._execute_search_request(url)
+        return self._parse_raw_search_response(response)
+
+    async def search_raw_async(self, mots_cles: str, **search_params: Any) -> list[dict[str, Any]]:
+        """Search for job offers asynchronously, returning their JSON data without building `Offre` objects.
+
+        Parameters
+        ----------
+        mots_cles : str
+            Keywords to search for
+        **search_params : Any
+            Any other parameter accepted by `search_async`
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            JSON data of the job offers matching the search criteria, as returned by the API
+
+        Raises
+        ------
+        TypeError
+            If an unknown search parameter is given.
+        InvalidSearchParametersException
+            If search parameters validation is enabled and a parameter is invalid.
+        FranceTravailException
+            If the API responds with an error.
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> asyncio.run(client.search_raw_async(mots_cles="boulanger", departement="75"))
+        [{'id': '201WLXK', 'intitule': 'Boulanger / Boulangère (H/F)', ...}, ...]
+        """
+        params = self._build_raw_search_params(mots_cles=mots_cles, **search_params)
+        await self._validate_search_params_async(params)
+
+        url = self._build_search_url(params)
+        response = await self._execute_search_request_async(url)
+        return self._parse_raw_search_response(response)
+
+    def search_stream(self, mots_cles: str, **search_params: Any) -> Iterator[Offre]:
+        """Search for job offers, yielding each one as soon as it is received.
+
+        The search response is parsed as its bytes arrive, so that memory holds only the job offer
+        being received instead of the whole response, and the first job offers can be processed
+        before the last ones are downloaded.
+
+        Parameters
+        ----------
+        mots_cles : str
+            Keywords to search for
+        **search_params : Any
+            Any other parameter accepted by `search`
+
+        Yields
+        ------
+        Offre
+            Job offers matching the search criteria, in the order of the response
+
+        Raises
+        ------
+        TypeError
+            If an unknown search parameter is given.
+        InvalidSearchParametersException
+            If search parameters validation is enabled and a parameter is invalid.
+        FranceTravailException
+            If the API responds with an error.
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> for offre in client.search_stream(mots_cles="boulanger", range_param="0-149"):
+        ...     print(offre.intitule)
+        """
+        params = self._build_raw_search_params(mots_cles=mots_cles, **search_params)
+        self._validate_search_params(params)
+
+        with self._authenticated_http_client.stream(self._build_search_url(params)) as response:
+            if not response.status_code.is_success:
+                raise FranceTravailException.from_http_response(response.read())
+            if response.status_code != http.HTTPStatus.NO_CONTENT:
+                for offre_json in response.iter_json_array("resultats"):
+                    yield self._decode_offre(offre_json)
+
+    async def search_stream_async(self, mots_cles: str, **search_params: Any) -> AsyncIterator[Offre]:
+        """Search for job offers asynchronously, yielding each one as soon as it is received.
+
+        Parameters
+        ----------
+        mots_cles : str
+            Keywords to search for
+        **search_params : Any
+            Any other parameter accepted by `search_async`
+
+        Yields
+        ------
+        Offre
+            Job offers matching the search criteria, in the order of the response
+
+        Raises
+        ------
+        TypeError
+            If an unknown search parameter is given.
+        InvalidSearchParametersException
+            If search parameters validation is enabled and a parameter is invalid.
+        FranceTravailException
+            If the API responds with an error.
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> async for offre in client.search_stream_async(mots_cles="boulanger", range_param="0-149"):
+        ...     print(offre.intitule)
+        """
+        params = self._build_raw_search_params(mots_cles=mots_cles, **search_params)
+        await self._validate_search_params_async(params)
+
+        async with self._authenticated_http_client.stream_async(self._build_search_url(params)) as response:
+            if not response.status_code.is_success:
+                raise FranceTravailException.from_http_response(await response.read_async())
+            if response.status_code != http.HTTPStatus.NO_CONTENT:
+                async for offre_json in response.iter_json_array_async("resultats"):
+                    yield self._decode_offre(offre_json)
+
+    def search_iter(self, mots_cles: str, page_size: int = SEARCH_PAGE_SIZE, **search_params: Any) -> Iterator[Offre]:
+        """Iterate over all job offers matching a search, fetching result windows lazily.
+
+        Result windows are requested one at a time, as the iteration goes on. The total number of
+        results is read from the `Content-Range` header, and iteration stops at the API limit of
+        3150 results.
+
+        Parameters
+        ----------
+        mots_cles : str
+            Keywords to search for
+        page_size : int, optional
+            Number of offers fetched per request, between 1 and 150 (default: 150)
+        **search_params : Any
+            Any other parameter accepted by `search`, except `range_param`
+
+        Yields
+        ------
+        Offre
+            Job offers matching the search criteria
+
+        Raises
+        ------
+        TypeError
+            If an unknown search parameter is given.
+        InvalidSearchParametersException
+            If search parameters validation is enabled and a parameter is invalid.
+        ValueError
+            If the page size is out of bounds.
+        FranceTravailException
+            If the API responds with an error.
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> for offre in client.search_iter(mots_cles="boulanger", departement="75"):
+        ...     print(offre.id)
+        """
+        params = self._build_search_params(mots_cles=mots_cles, **search_params)
+        self._validate_search_params(params)
+        for page in self._iter_search_pages(params, SearchRange.first(page_size)):
+            yield from page.offres
+
+    async def search_iter_async(
+        self, mots_cles: str, page_size: int = SEARCH_PAGE_SIZE, **search_params: Any
+    ) -> AsyncIterator[Offre]:
+        """Iterate asynchronously over all job offers matching a search, fetching result windows lazily.
+
+        Parameters
+        ----------
+        mots_cles : str
+            Keywords to search for
+        page_size : int, optional
+            Number of offers fetched per request, between 1 and 150 (default: 150)
+        **search_params : Any
+            Any other parameter accepted by `search_async`, except `range_param`
+
+        Yields
+        ------
+        Offre
+            Job offers matching the search criteria
+
+        Raises
+        ------
+        TypeError
+            If an unknown search parameter is given.
+        InvalidSearchParametersException
+            If search parameters validation is enabled and a parameter is invalid.
+        ValueError
+            If the page size is out of bounds.
+        FranceTravailException
+            If the API responds with an error.
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> async for offre in client.search_iter_async(mots_cles="boulanger", departement="75"):
+        ...     print(offre.id)
+        """
+        params = self._build_search_params(mots_cles=mots_cles, **search_params)
+        await self._validate_search_params_async(params)
+        async for page in self._iter_search_pages_async(params, SearchRange.first(page_size)):
+            for offre in page.offres:
+                yield offre
+
+    async def search_all_async(
+        self, mots_cles: str, max_concurrency: int = 4, page_size: int = SEARCH_PAGE_SIZE, **search_params: Any
+    ) -> list[Offre]:
+        """Fetch all job offers matching a search, requesting result windows concurrently.
+
+        The first window is fetched alone to learn the total number of results from the
+        `Content-Range` header. The remaining windows (up to the API limit of 3150 results)
+        are then requested concurrently, and results are returned in search order.
+
+        Parameters
+        ----------
+        mots_cles : str
+            Keywords to search for
+        max_concurrency : int, optional
+            Maximum number of windows requested at the same time (default: 4)
+        page_size : int, optional
+            Number of offers fetched per request, between 1 and 150 (default: 150)
+        **search_params : Any
+            Any other parameter accepted by `search_async`, except `range_param`
+
+        Returns
+        -------
+        list[Offre]
+            All reachable job offers matching the search criteria, in search order
+
+        Raises
+        ------
+        TypeError
+            If an unknown search parameter is given.
+        InvalidSearchParametersException
+            If search parameters validation is enabled and a parameter is invalid.
+        ValueError
+            If the page size or the concurrency limit is out of bounds.
+        FranceTravailException
+            If the API responds with an error.
+
+        Notes
+        -----
+        If the API does not announce a total, the remaining windows are fetched sequentially.
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> asyncio.run(client.search_all_async(mots_cles="boulanger", max_concurrency=8))
+        [Offre(id="201WLXK", ...), ...]
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"Maximum concurrency must be at least 1, got {max_concurrency}")
+        params = self._build_search_params(mots_cles=mots_cles, **search_params)
+        await self._validate_search_params_async(params)
+        first_range = SearchRange.first(page_size)
+        first_page = await self._search_page_async(params, first_range)
+
+        if first_page.total is None:
+            following_pages = [
+                page async for page in self._iter_search_pages_async(params, first_page.next_range(first_range))
+            ]
+        else:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def fetch_page(search_range: SearchRange) -> SearchPage:
+                async with semaphore:
+                    return await self._search_page_async(params, search_range)
+
+            following_pages = await asyncio.gather(
+                *(fetch_page(search_range) for search_range in first_page.following_ranges(first_range))
+            )
+
+        return [offre for page in (first_page, *following_pages) for offre in page.offres]
+
+    def harvest(self, mots_cles: str, **search_params: Any) -> Iterator[Offre]:
+        """Iterate over all job offers matching a search, beyond the API limit of 3150 results.
+
+        Searches with more than 3150 results are recursively split into narrower searches (by
+        département, then commune, contract type and creation date windows) until each of them
+        fits within the limit. Offers are de-duplicated by ID and streamed as they are fetched.
+
+        Parameters
+        ----------
+        mots_cles : str
+            Keywords to search for
+        **search_params : Any
+            Any other parameter accepted by `search`, except `range_param`
+
+        Yields
+        ------
+        Offre
+            Job offers matching the search criteria, each one exactly once
+
+        Raises
+        ------
+        TypeError
+            If an unknown search parameter is given.
+        InvalidSearchParametersException
+            If search parameters validation is enabled and a parameter is invalid.
+        FranceTravailException
+            If the API responds with an error.
+
+        Warns
+        -----
+        IncompleteHarvestWarning
+            If a search cannot be split enough to fit within the API limit, in which case only its
+            first 3150 results are returned, or if the searches it was split into miss some of its
+            results.
+
+        Notes
+        -----
+        A search without geographic filter is split by French département, so offers located
+        outside of them (e.g. abroad) are not harvested. Likewise, splitting by contract type leaves
+        out offers whose contract type is not a `CodeTypeContrat`. Such gaps are detected by
+        comparing the totals of the narrower searches with the total of the split search.
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> for offre in client.harvest(mots_cles="développeur", code_rome="M1805"):
+        ...     print(offre.id)
+        """
+        yield from self._harvest(mots_cles, search_params, incomplete_searches=[])
+
+    async def harvest_async(self, mots_cles: str, **search_params: Any) -> AsyncIterator[Offre]:
+        """Iterate asynchronously over all job offers matching a search, beyond the API limit of 3150 results.
+
+        Parameters
+        ----------
+        mots_cles : str
+            Keywords to search for
+        **search_params : Any
+            Any other parameter accepted by `search_async`, except `range_param`
+
+        Yields
+        ------
+        Offre
+            Job offers matching the search criteria, each one exactly once
+
+        Raises
+        ------
+        TypeError
+            If an unknown search parameter is given.
+        InvalidSearchParametersException
+            If search parameters validation is enabled and a parameter is invalid.
+        FranceTravailException
+            If the API responds with an error.
+
+        Warns
+        -----
+        IncompleteHarvestWarning
+            If a search cannot be split enough to fit within the API limit, in which case only its
+            first 3150 results are returned, or if the searches it was split into miss some of its
+            results.
+
+        See Also
+        --------
+        harvest : Synchronous version, describing how searches are split.
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> async for offre in client.harvest_async(mots_cles="développeur", code_rome="M1805"):
+        ...     print(offre.id)
+        """
+        async for offre in self._harvest_async(mots_cles, search_params, incomplete_searches=[]):
+            yield offre
+
+    def _harvest(
+        self, mots_cles: str, search_params: dict[str, Any], incomplete_searches: list[dict[str, Any]]
+    ) -> Iterator[Offre]:
+        params = self._build_search_params(mots_cles=mots_cles, **search_params)
+        self._validate_search_params(params)
+        partitioner = SearchPartitioner(now=datetime.datetime.now(datetime.UTC))
+        seen_offer_ids: set[str | None] = set()
+        pending_searches: list[tuple[dict[str, Any], SplitCoverage | None]] = [(params, None)]
+        while pending_searches:
+            search, split_coverage = pending_searches.pop()
+            first_range = SearchRange.first()
+            first_page = self._search_page(search, first_range)
+            if split_coverage is not None and split_coverage.add(first_page.count()):
+                self._warn_uncovered_split(split_coverage)
+                incomplete_searches.append(split_coverage.params)
+            if self._exceeds_search_results_limit(first_page):
+                narrower_searches = partitioner.split(search)
+                if narrower_searches:
+                    narrower_coverage = SplitCoverage(search, first_page.count(), len(narrower_searches))
+                    pending_searches.extend(
+                        (narrower_search, narrower_coverage) for narrower_search in reversed(narrower_searches)
+                    )
+                    continue
+                self._warn_incomplete_harvest(search, first_page)
+                incomplete_searches.append(search)
+
+            pages = itertools.chain([first_page], self._iter_search_pages(search, first_page.next_range(first_range)))
+            for page in pages:
+                yield from self._filter_unseen_offres(page, seen_offer_ids)
+
+    async def _harvest_async(
+        self, mots_cles: str, search_params: dict[str, Any], incomplete_searches: list[dict[str, Any]]
+    ) -> AsyncIterator[Offre]:
+        params = self._build_search_params(mots_cles=mots_cles, **search_params)
+        await self._validate_search_params_async(params)
+        partitioner = SearchPartitioner(now=datetime.datetime.now(datetime.UTC))
+        seen_offer_ids: set[str | None] = set()
+        pending_searches: list[tuple[dict[str, Any], SplitCoverage | None]] = [(params, None)]
+        while pending_searches:
+            search, split_coverage = pending_searches.pop()
+            first_range = SearchRange.first()
+            first_page = await self._search_page_async(search, first_range)
+            if split_coverage is not None and split_coverage.add(first_page.count()):
+                self._warn_uncovered_split(split_coverage)
+                incomplete_searches.append(split_coverage.params)
+            if self._exceeds_search_results_limit(first_page):
+                narrower_searches = partitioner.split(search)
+                if narrower_searches:
+                    narrower_coverage = SplitCoverage(search, first_page.count(), len(narrower_searches))
+                    pending_searches.extend(
+                        (narrower_search, narrower_coverage) for narrower_search in reversed(narrower_searches)
+                    )
+                    continue
+                self._warn_incomplete_harvest(search, first_page)
+                incomplete_searches.append(search)
+
+            for offre in self._filter_unseen_offres(first_page, seen_offer_ids):
+                yield offre
+            async for page in self._iter_search_pages_async(search, first_page.next_range(first_range)):
+                for offre in self._filter_unseen_offres(page, seen_offer_ids):
+                    yield offre
 
     def get(self, offer_id: str) -> Offre:
         """Get a job offer by its ID.
@@ -363,6 +893,8 @@ class FranceTravailOffresClient:
         ------
         OffreNotFoundException
             If no job offer with the specified ID exists.
+        FranceTravailException
+            If the API responds with another error.
 
         Examples
         --------
@@ -375,9 +907,7 @@ class FranceTravailOffresClient:
         .. [1] France Travail API Documentation - Offres d'emploi - Consulter un détail d'offre
            https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererOffre
         """
-        url = self._build_get_url(offer_id)
-        response = self._execute_get_request(url)
-        return self._parse_get_response(response, offer_id)
+        return self._decode_offre(self.get_raw(offer_id))
 
     async def get_async(self, offer_id: str) -> Offre:
         """Get a job offer by its ID asynchronously.
@@ -396,6 +926,8 @@ class FranceTravailOffresClient:
         ------
         OffreNotFoundException
             If no job offer with the specified ID exists.
+        FranceTravailException
+            If the API responds with another error.
 
         Examples
         --------
@@ -409,52 +941,315 @@ class FranceTravailOffresClient:
         .. [1] France Travail API Documentation - Offres d'emploi - Consulter un détail d'offre
            https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererOffre
         """
+        return self._decode_offre(await self.get_raw_async(offer_id))
+
+    def get_raw(self, offer_id: str) -> dict[str, Any]:
+        """Get the JSON data of a job offer by its ID, without building an `Offre` object.
+
+        Parameters
+        ----------
+        offer_id : str
+            Job offer ID (e.g., "048KLTP").
+
+        Returns
+        -------
+        dict[str, Any]
+            JSON data of the job offer, as returned by the API.
+
+        Raises
+        ------
+        OffreNotFoundException
+            If no job offer with the specified ID exists.
+        FranceTravailException
+            If the API responds with another error.
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> client.get_raw(offer_id="048KLTP")
+        {'id': '048KLTP', 'intitule': 'Développeur Python (H/F)', ...}
+        """
+        cached_offre_json = self._get_cached_offre_json(offer_id)
+        if cached_offre_json is not None:
+            return cached_offre_json
+        url = self._build_get_url(offer_id)
+        response = self._execute_get_request(url)
+        return self._parse_get_response(response, offer_id)
+
+    async def get_raw_async(self, offer_id: str) -> dict[str, Any]:
+        """Get the JSON data of a job offer by its ID asynchronously, without building an `Offre` object.
+
+        Parameters
+        ----------
+        offer_id : str
+            Job offer ID (e.g., "048KLTP").
+
+        Returns
+        -------
+        dict[str, Any]
+            JSON data of the job offer, as returned by the API.
+
+        Raises
+        ------
+        OffreNotFoundException
+            If no job offer with the specified ID exists.
+        FranceTravailException
+            If the API responds with another error.
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> asyncio.run(client.get_raw_async(offer_id="048KLTP"))
+        {'id': '048KLTP', 'intitule': 'Développeur Python (H/F)', ...}
+        """
+        cached_offre_json = self._get_cached_offre_json(offer_id)
+        if cached_offre_json is not None:
+            return cached_offre_json
         url = self._build_get_url(offer_id)
         response = await self._execute_get_request_async(url)
         return self._parse_get_response(response, offer_id)
 
+    def get_many(
+        self, offer_ids: Iterable[str], max_concurrency: int = 4
+    ) -> Iterator[tuple[str, Offre | OffreNotFoundException]]:
+        """Get several job offers by their IDs, fetching them concurrently.
+
+        Offers are fetched by a pool of threads sharing the access token and connection pool of the
+        client, and yielded as soon as they are fetched, so not necessarily in the order of `offer_ids`.
+
+        Parameters
+        ----------
+        offer_ids : Iterable[str]
+            Job offer IDs (e.g., ["048KLTP", "201WLXK"]). Consumed lazily.
+        max_concurrency : int, optional
+            Maximum number of offers fetched at the same time (default: 4)
+
+        Yields
+        ------
+        tuple[str, Offre | OffreNotFoundException]
+            Job offer ID, with the job offer or the exception telling that it does not exist.
+
+        Raises
+        ------
+        ValueError
+            If the concurrency limit is lower than 1.
+        FranceTravailException
+            If a job offer cannot be fetched for another reason than not existing. Pending
+            fetches are cancelled.
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> for offer_id, offre in client.get_many(["048KLTP", "201WLXK"], max_concurrency=8):
+        ...     if isinstance(offre, OffreNotFoundException):
+        ...         print(f"{offer_id} was removed")
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"Maximum concurrency must be at least 1, got {max_concurrency}")
+        pending_offer_ids = iter(offer_ids)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            fetches: dict[concurrent.futures.Future[Offre], str] = {}
+            try:
+                while True:
+                    for offer_id in itertools.islice(pending_offer_ids, max_concurrency - len(fetches)):
+                        fetches[executor.submit(self.get, offer_id)] = offer_id
+                    if not fetches:
+                        return
+                    done, _ = concurrent.futures.wait(fetches, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for fetch in done:
+                        yield fetches.pop(fetch), self._get_fetch_result(fetch)
+            finally:
+                for fetch in fetches:
+                    fetch.cancel()
+
+    async def get_many_async(
+        self, offer_ids: Iterable[str], max_concurrency: int = 4
+    ) -> AsyncIterator[tuple[str, Offre | OffreNotFoundException]]:
+        """Get several job offers by their IDs asynchronously, fetching them concurrently.
+
+        Offers are yielded as soon as they are fetched, so not necessarily in the order of `offer_ids`.
+
+        Parameters
+        ----------
+        offer_ids : Iterable[str]
+            Job offer IDs (e.g., ["048KLTP", "201WLXK"]). Consumed lazily.
+        max_concurrency : int, optional
+            Maximum number of offers fetched at the same time (default: 4)
+
+        Yields
+        ------
+        tuple[str, Offre | OffreNotFoundException]
+            Job offer ID, with the job offer or the exception telling that it does not exist.
+
+        Raises
+        ------
+        ValueError
+            If the concurrency limit is lower than 1.
+        FranceTravailException
+            If a job offer cannot be fetched for another reason than not existing. Pending
+            fetches are cancelled, and awaited before the exception is raised.
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> async for offer_id, offre in client.get_many_async(tracked_offer_ids, max_concurrency=16):
+        ...     print(offer_id, offre)
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"Maximum concurrency must be at least 1, got {max_concurrency}")
+        pending_offer_ids = iter(offer_ids)
+        fetches: dict[asyncio.Task[Offre], str] = {}
+        try:
+            while True:
+                for offer_id in itertools.islice(pending_offer_ids, max_concurrency - len(fetches)):
+                    fetches[asyncio.create_task(self.get_async(offer_id))] = offer_id
+                if not fetches:
+                    return
+                done, _ = await asyncio.wait(fetches, return_when=asyncio.FIRST_COMPLETED)
+                for fetch in done:
+                    yield fetches.pop(fetch), self._get_fetch_result(fetch)
+        finally:
+            for fetch in fetches:
+                fetch.cancel()
+            # Wait for the cancelled fetches to finish, retrieving their exceptions.
+            await asyncio.gather(*fetches, return_exceptions=True)
+
+    def _get_fetch_result(
+        self, fetch: concurrent.futures.Future[Offre] | asyncio.Task[Offre]
+    ) -> Offre | OffreNotFoundException:
+        exception = fetch.exception()
+        if isinstance(exception, OffreNotFoundException):
+            return exception
+        return fetch.result()
+
     def _build_get_url(self, offer_id: str) -> str:
         return f"{JOB_OFFER_GET_API_URL}/{offer_id}"
 
     def _execute_get_request(self, url: str) -> HTTPResponse:
-        return self._http_client.get(
-            url=url,
-            headers=self._credentials.to_authorization_header(),
-        )
+        return self._authenticated_http_client.get(url)
 
     async def _execute_get_request_async(self, url: str) -> HTTPResponse:
-        return await self._http_client.get_async(
-            url=url,
-            headers=self._credentials.to_authorization_header(),
-        )
+        return await self._authenticated_http_client.get_async(url)
 
-    def _parse_get_response(self, response: HTTPResponse, offer_id: str) -> Offre:
+    def _parse_get_response(self, response: HTTPResponse, offer_id: str) -> dict[str, Any]:
         if response.status_code == http.HTTPStatus.NO_CONTENT:
             raise OffreNotFoundException(
                 f"Job offer with ID '{offer_id}' not found",
                 request_id=response.request_id,
             )
-        return Offre.from_dict(response.body)
+        if not response.status_code.is_success:
+            raise FranceTravailException.from_http_response(response)
+        if self._offre_cache is not None and response.status_code == http.HTTPStatus.OK:
+            self._offre_cache.set(offer_id, response.body)
+        return response.body
+
+    def _get_cached_offre_json(self, offer_id: str) -> dict[str, Any] | None:
+        return self._offre_cache.get(offer_id) if self._offre_cache is not None else None
 
-    def _build_search_url(self, params: dict[str, str | int | bool]) -> str:
+    def _build_search_url(self, params: dict[str, object]) -> str:
         return FranceTravailUrl(
             JOB_OFFER_SEARCH_API_URL,
             special_mappings=self._get_special_param_mappings(),
         ).build(**params)
 
-    def _execute_search_request(self, url: str) -> dict:
-        response = self._http_client.get(
-            url=url,
-            headers=self._credentials.to_authorization_header(),
+    def _execute_search_request(self, url: str, json_decoder: JsonDecoder | None = None) -> HTTPResponse:
+        return self._authenticated_http_client.get(url, json_decoder=json_decoder)
+
+    async def _execute_search_request_async(self, url: str, json_decoder: JsonDecoder | None = None) -> HTTPResponse:
+        return await self._authenticated_http_client.get_async(url, json_decoder=json_decoder)
+
+    def _search_page(self, params: dict, search_range: SearchRange) -> SearchPage:
+        url = self._build_search_url({**params, "range_param": search_range.to_api_value()})
+        return self._parse_search_response(self._execute_search_request(url, self._typed_offre_decoder))
+
+    async def _search_page_async(self, params: dict, search_range: SearchRange) -> SearchPage:
+        url = self._build_search_url({**params, "range_param": search_range.to_api_value()})
+        return self._parse_search_response(await self._execute_search_request_async(url, self._typed_offre_decoder))
+
+    def _iter_search_pages(self, params: dict, search_range: SearchRange | None) -> Iterator[SearchPage]:
+        while search_range is not None:
+            page = self._search_page(params, search_range)
+            yield page
+            search_range = page.next_range(search_range)
+
+    async def _iter_search_pages_async(
+        self, params: dict, search_range: SearchRange | None
+    ) -> AsyncIterator[SearchPage]:
+        while search_range is not None:
+            page = await self._search_page_async(params, search_range)
+            yield page
+            search_range = page.next_range(search_range)
+
+    def _exceeds_search_results_limit(self, page: SearchPage) -> bool:
+        return page.total is not None and page.total > SEARCH_RESULTS_LIMIT
+
+    def _filter_unseen_offres(self, page: SearchPage, seen_offer_ids: set[str | None]) -> list[Offre]:
+        unseen_offres = []
+        for offre in page.offres:
+            if offre.id not in seen_offer_ids:
+                seen_offer_ids.add(offre.id)
+                unseen_offres.append(offre)
+        return unseen_offres
+
+    def _warn_incomplete_harvest(self, params: dict, page: SearchPage) -> None:
+        warnings.warn(
+            f"Search {params} has {page.total} results and cannot be split further: "
+            f"only the first {SEARCH_RESULTS_LIMIT} will be harvested.",
+            IncompleteHarvestWarning,
+            stacklevel=4,
         )
-        return response.body
 
-    async def _execute_search_request_async(self, url: str) -> dict:
-        response = await self._http_client.get_async(
-            url=url,
-            headers=self._credentials.to_authorization_header(),
+    def _warn_uncovered_split(self, split_coverage: SplitCoverage) -> None:
+        warnings.warn(
+            f"Search {split_coverage.params} has {split_coverage.total} results but the searches it was split "
+            f"into only have {split_coverage.covered_total}: the others will not be harvested.",
+            IncompleteHarvestWarning,
+            stacklevel=4,
         )
-        return response.body
+
+    def _parse_search_response(self, response: HTTPResponse) -> SearchPage:
+        if not response.status_code.is_success:
+            raise FranceTravailException.from_http_response(response)
+        resultats = response.body.get("resultats", [])
+        return SearchPage(
+            # The typed decoder already decoded the results from the response body.
+            offres=resultats
+            if self._typed_offre_decoder is not None
+            else [self._decode_offre(offre_json) for offre_json in resultats],
+            total=parse_content_range_total(response.headers),
+        )
+
+    def _parse_raw_search_response(self, response: HTTPResponse) -> list[dict[str, Any]]:
+        if not response.status_code.is_success:
+            raise FranceTravailException.from_http_response(response)
+        return response.body.get("resultats", [])
+
+    def _build_search_params(self, **search_params: Any) -> dict:
+        return self._check_search_params(search_params, self._get_paginated_search_param_names())
+
+    def _build_raw_search_params(self, **search_params: Any) -> dict:
+        return self._check_search_params(search_params, self._get_search_param_names())
+
+    def _check_search_params(self, search_params: dict[str, Any], search_param_names: set[str]) -> dict:
+        unexpected_params = search_params.keys() - search_param_names
+        if unexpected_params:
+            raise TypeError(f"Unexpected search parameters: {', '.join(sorted(unexpected_params))}")
+        return self._convert_enums_to_api_values(search_params)
+
+    def _validate_search_params(self, params: dict) -> None:
+        if self._search_params_validator is not None:
+            self._search_params_validator.validate(params)
+
+    async def _validate_search_params_async(self, params: dict) -> None:
+        if self._search_params_validator is not None:
+            await self._search_params_validator.validate_async(params)
+
+    def _get_search_param_names(self) -> set[str]:
+        return set(inspect.signature(self.search).parameters)
+
+    def _get_paginated_search_param_names(self) -> set[str]:
+        return self._get_search_param_names() - {"range_param"}
 
     def _convert_enums_to_api_values(self, params: dict) -> dict:
         return {key: self._to_api_value(value) for key, value in params.items()}
@@ -0,0 +1,143 @@
+import re
+from dataclasses import dataclass
+
+from france_travail_api.offres.models.offre import Offre
+
+SEARCH_PAGE_SIZE = 150
+SEARCH_RESULTS_LIMIT = 3150
+
+_CONTENT_RANGE_TOTAL_PATTERN = re.compile(r"/(?P<total>\d+)\s*$")
+
+
+@dataclass(frozen=True)
+class SearchRange:
+    """
+    Window of search results, as sent in the `range` query parameter.
+
+    Parameters
+    ----------
+    start : int
+        Index (starting at 0) of the first requested result.
+    end : int
+        Index of the last requested result (inclusive).
+
+    Examples
+    --------
+    >>> SearchRange(start=0, end=149).to_api_value()
+    '0-149'
+    >>> SearchRange(start=0, end=149).next(total=200)
+    SearchRange(start=150, end=199)
+    """
+
+    start: int
+    end: int
+
+    @staticmethod
+    def first(page_size: int = SEARCH_PAGE_SIZE) -> "SearchRange":
+        """
+        Create the first window of a search.
+
+        Parameters
+        ----------
+        page_size : int
+            Number of results per window, between 1 and 150.
+
+        Raises
+        ------
+        ValueError
+            If the page size is out of the range accepted by the API.
+        """
+        if not 1 <= page_size <= SEARCH_PAGE_SIZE:
+            raise ValueError(f"Page size must be between 1 and {SEARCH_PAGE_SIZE}, got {page_size}")
+        return SearchRange(start=0, end=page_size - 1)
+
+    @property
+    def size(self) -> int:
+        return self.end - self.start + 1
+
+    def next(self, total: int | None) -> "SearchRange | None":
+        """
+        Get the window following this one.
+
+        Parameters
+        ----------
+        total : int | None
+            Total number of results of the search, if known.
+
+        Returns
+        -------
+        SearchRange | None
+            Next window, or None if there are no more reachable results.
+        """
+        reachable_results = SEARCH_RESULTS_LIMIT if total is None else min(total, SEARCH_RESULTS_LIMIT)
+        start = self.end + 1
+        if start >= reachable_results:
+            return None
+        return SearchRange(start=start, end=min(start + self.size, reachable_results) - 1)
+
+    def to_api_value(self) -> str:
+        return f"{self.start}-{self.end}"
+
+
+@dataclass(frozen=True)
+class SearchPage:
+    """
+    One window of search results.
+
+    Parameters
+    ----------
+    offres : list[Offre]
+        Job offers of the window.
+    total : int | None
+        Total number of results of the search, as announced by the `Content-Range` header.
+    """
+
+    offres: list[Offre]
+    total: int | None
+
+    def count(self) -> int:
+        """Get the number of results of the search: its total, or the size of this page if it is unknown."""
+        return self.total if self.total is not None else len(self.offres)
+
+    def next_range(self, current: SearchRange) -> SearchRange | None:
+        """Get the window to fetch after this page, or None if the search is exhausted."""
+        if not self.offres:
+            return None
+        return current.next(self.total)
+
+    def following_ranges(self, current: SearchRange) -> list[SearchRange]:
+        """Get all the windows remaining after this page, as announced by its total."""
+        following_ranges = []
+        search_range = self.next_range(current)
+        while search_range is not None:
+            following_ranges.append(search_range)
+            search_range = search_range.next(self.total)
+        return following_ranges
+
+
+def parse_content_range_total(headers: dict[str, str]) -> int | None:
+    """
+    Extract the total number of results from a `Content-Range` header.
+
+    Parameters
+    ----------
+    headers : dict[str, str]
+        Response headers. Lookup is case-insensitive.
+
+    Returns
+    -------
+    int | None
+        Total number of results, or None if the header is missing or malformed.
+
+    Examples
+    --------
+    >>> parse_content_range_total({"content-range": "offres 0-149/3456"})
+    3456
+    >>> parse_content_range_total({"Content-Range": "*/0"})
+    0
+    """
+    content_range = next((value for key, value in headers.items() if key.lower() == "content-range"), None)
+    if content_range is None:
+        return None
+    match = _CONTENT_RANGE_TOTAL_PATTERN.search(content_range)
+    return int(match.group("total")) if match else None
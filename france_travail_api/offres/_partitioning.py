@@ -0,0 +1,193 @@
+import datetime
+from collections.abc import Callable
+from typing import Any
+
+from france_travail_api.offres.models.contrat import CodeTypeContrat
+
+CREATION_DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+OLDEST_CREATION_DATE = datetime.datetime(2000, 1, 1, tzinfo=datetime.UTC)
+MINIMUM_CREATION_DATE_SLICE = datetime.timedelta(seconds=1)
+
+DEPARTEMENTS = (
+    *(f"{number:02d}" for number in range(1, 20)),
+    "2A",
+    "2B",
+    *(f"{number:02d}" for number in range(21, 96)),
+    "971",
+    "972",
+    "973",
+    "974",
+    "976",
+)
+
+_GEOGRAPHIC_PARAMS = ("departement", "commune", "region", "pays_continent")
+
+
+class SearchPartitioner:
+    """
+    Splits a search into narrower searches whose union covers the same job offers.
+
+    Searches are split along the first applicable dimension, in this order:
+
+    1. Départements: a multi-valued `departement` is split into single values, and a search
+       without any geographic filter is split into one search per French département.
+    2. Communes: a multi-valued `commune` is split into single values.
+    3. Contract types: a search without `type_contrat` is split into one search per contract type.
+    4. Creation dates: the `min_creation_date` - `max_creation_date` window is cut in half.
+
+    Parameters
+    ----------
+    now : datetime.datetime
+        Upper bound of the creation date window when `max_creation_date` is not set.
+    oldest_creation_date : datetime.datetime, optional
+        Lower bound of the creation date window when `min_creation_date` is not set.
+
+    Notes
+    -----
+    Parameters are expected in their API form (e.g. `type_contrat="CDI"`), as built by the offres client.
+    Splitting a search without geographic filter by département leaves out offers located outside of
+    the French départements (e.g. abroad), and splitting by contract type leaves out offers whose
+    contract type is not a `CodeTypeContrat`. See `SplitCoverage` to detect them.
+
+    Examples
+    --------
+    >>> partitioner = SearchPartitioner(now=datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC))
+    >>> partitioner.split({"mots_cles": "boulanger", "departement": "75,92"})
+    [{'mots_cles': 'boulanger', 'departement': '75'}, {'mots_cles': 'boulanger', 'departement': '92'}]
+    """
+
+    def __init__(self, now: datetime.datetime, oldest_creation_date: datetime.datetime = OLDEST_CREATION_DATE) -> None:
+        self._now = now
+        self._oldest_creation_date = oldest_creation_date
+
+    def split(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        """
+        Split a search into narrower searches.
+
+        Parameters
+        ----------
+        params : dict[str, Any]
+            Search parameters.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Parameters of the narrower searches, or an empty list if the search cannot be split further.
+        """
+        split_strategies: tuple[Callable[[dict[str, Any]], list[dict[str, Any]]], ...] = (
+            self._split_by_departement,
+            self._split_by_commune,
+            self._split_by_type_contrat,
+            self._split_by_creation_date,
+        )
+        for split_strategy in split_strategies:
+            narrower_searches = split_strategy(params)
+            if narrower_searches:
+                return narrower_searches
+        return []
+
+    def _split_by_departement(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        if params.get("departement"):
+            return self._split_multiple_values(params, "departement")
+        if any(params.get(param) for param in _GEOGRAPHIC_PARAMS):
+            return []
+        return [{**params, "departement": departement} for departement in DEPARTEMENTS]
+
+    def _split_by_commune(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        return self._split_multiple_values(params, "commune") if params.get("commune") else []
+
+    def _split_by_type_contrat(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        if params.get("type_contrat"):
+            return []
+        return [{**params, "type_contrat": type_contrat.to_api_value()} for type_contrat in CodeTypeContrat]
+
+    def _split_by_creation_date(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        min_creation_date = self._parse_creation_date(params.get("min_creation_date"), self._oldest_creation_date)
+        max_creation_date = self._parse_creation_date(params.get("max_creation_date"), self._now)
+        if max_creation_date - min_creation_date < 2 * MINIMUM_CREATION_DATE_SLICE:
+            return []
+
+        middle_creation_date = min_creation_date + (max_creation_date - min_creation_date) / 2
+        return [
+            {
+                **params,
+                "min_creation_date": self._format_creation_date(min_creation_date),
+                "max_creation_date": self._format_creation_date(middle_creation_date),
+            },
+            {
+                **params,
+                "min_creation_date": self._format_creation_date(middle_creation_date),
+                "max_creation_date": self._format_creation_date(max_creation_date),
+            },
+        ]
+
+    def _split_multiple_values(self, params: dict[str, Any], param: str) -> list[dict[str, Any]]:
+        values = [value.strip() for value in str(params[param]).split(",") if value.strip()]
+        if len(values) < 2:
+            return []
+        return [{**params, param: value} for value in values]
+
+    @staticmethod
+    def _parse_creation_date(value: str | None, default: datetime.datetime) -> datetime.datetime:
+        if value is None:
+            return default.replace(microsecond=0)
+        return datetime.datetime.strptime(value, CREATION_DATE_FORMAT).replace(tzinfo=datetime.UTC)
+
+    @staticmethod
+    def _format_creation_date(value: datetime.datetime) -> str:
+        return value.strftime(CREATION_DATE_FORMAT)
+
+
+class SplitCoverage:
+    """
+    Compares the totals of the narrower searches of a split search with its own total.
+
+    Parameters
+    ----------
+    params : dict[str, Any]
+        Parameters of the split search.
+    total : int
+        Total number of results of the split search.
+    narrower_search_count : int
+        Number of narrower searches the search was split into.
+
+    Attributes
+    ----------
+    covered_total : int
+        Sum of the totals of the narrower searches counted so far.
+
+    Examples
+    --------
+    >>> coverage = SplitCoverage({"mots_cles": "boulanger"}, total=4000, narrower_search_count=2)
+    >>> coverage.add(2500)
+    False
+    >>> coverage.add(1000)
+    True
+    >>> coverage.covered_total
+    3500
+    """
+
+    def __init__(self, params: dict[str, Any], total: int, narrower_search_count: int) -> None:
+        self.params = params
+        self.total = total
+        self.covered_total = 0
+        self._remaining_search_count = narrower_search_count
+
+    def add(self, total: int) -> bool:
+        """
+        Count the total of a narrower search.
+
+        Parameters
+        ----------
+        total : int
+            Total number of results of the narrower search.
+
+        Returns
+        -------
+        bool
+            True if it was the last narrower search, and the narrower searches miss some results of
+            the split search.
+        """
+        self.covered_total += total
+        self._remaining_search_count -= 1
+        return self._remaining_search_count == 0 and self.covered_total < self.total
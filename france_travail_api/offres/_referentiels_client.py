@@ -1,126 +1,921 @@
-from typing import Any, cast
+import http
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Generic, Iterator, cast
 
+from france_travail_api.auth._authenticated_http_client import AuthenticatedHttpClient
 from france_travail_api.auth._credentials import FranceTravailCredentials
+from france_travail_api.exceptions import FranceTravailException
 from france_travail_api.http_transport._http_client import HttpClient
 from france_travail_api.http_transport._http_response import HTTPResponse
 from france_travail_api.offres.models.appellation import Appellation
 from france_travail_api.offres.models.metier import Metier
+from france_travail_api.offres.models.referentiels import (
+    CodeNaf,
+    Commune,
+    Continent,
+    Departement,
+    Domaine,
+    LangueReferentiel,
+    NatureContrat,
+    NiveauFormation,
+    Pays,
+    PermisReferentiel,
+    Region,
+    SecteurActivite,
+    Theme,
+    TypeContrat,
+)
+from france_travail_api.offres.referentiel import ItemT, Referentiel
+from france_travail_api.offres.referentiel_cache import CachedReferentiel, ReferentielCache
 
-REFERENTIEL_METIERS_API_URL = "https://api.francetravail.io/partenaire/offresdemploi/v2/referentiel/metiers"
-REFERENTIEL_APPELLATIONS_API_URL = "https://api.francetravail.io/partenaire/offresdemploi/v2/referentiel/appellations"
+REFERENTIEL_API_URL = "https://api.francetravail.io/partenaire/offresdemploi/v2/referentiel"
+REFERENTIEL_METIERS_API_URL = f"{REFERENTIEL_API_URL}/metiers"
+REFERENTIEL_APPELLATIONS_API_URL = f"{REFERENTIEL_API_URL}/appellations"
+
+
+@dataclass(frozen=True)
+class _ReferentielDefinition(Generic[ItemT]):
+    name: str
+    parse_item: Callable[[dict[str, Any]], ItemT]
+
+    @property
+    def url(self) -> str:
+        return f"{REFERENTIEL_API_URL}/{self.name}"
+
+    def parse(self, referentiel_data: list[dict[str, Any]]) -> Referentiel[ItemT]:
+        return Referentiel(self.parse_item(item_json) for item_json in referentiel_data)
+
+
+_APPELLATIONS = _ReferentielDefinition("appellations", Appellation.from_dict)
+_METIERS = _ReferentielDefinition("metiers", Metier.from_dict)
+_COMMUNES = _ReferentielDefinition("communes", Commune.from_dict)
+_CONTINENTS = _ReferentielDefinition("continents", Continent.from_dict)
+_DEPARTEMENTS = _ReferentielDefinition("departements", Departement.from_dict)
+_DOMAINES = _ReferentielDefinition("domaines", Domaine.from_dict)
+_LANGUES = _ReferentielDefinition("langues", LangueReferentiel.from_dict)
+_NAFS = _ReferentielDefinition("nafs", CodeNaf.from_dict)
+_NATURES_CONTRATS = _ReferentielDefinition("naturesContrats", NatureContrat.from_dict)
+_NIVEAUX_FORMATIONS = _ReferentielDefinition("niveauxFormations", NiveauFormation.from_dict)
+_PAYS = _ReferentielDefinition("pays", Pays.from_dict)
+_PERMIS = _ReferentielDefinition("permis", PermisReferentiel.from_dict)
+_REGIONS = _ReferentielDefinition("regions", Region.from_dict)
+_SECTEURS_ACTIVITES = _ReferentielDefinition("secteursActivites", SecteurActivite.from_dict)
+_THEMES = _ReferentielDefinition("themes", Theme.from_dict)
+_TYPES_CONTRATS = _ReferentielDefinition("typesContrats", TypeContrat.from_dict)
+
+_DEFINITIONS_BY_NAME: dict[str, _ReferentielDefinition[Any]] = {
+    definition.name: definition
+    for definition in (
+        _APPELLATIONS,
+        _METIERS,
+        _COMMUNES,
+        _CONTINENTS,
+        _DEPARTEMENTS,
+        _DOMAINES,
+        _LANGUES,
+        _NAFS,
+        _NATURES_CONTRATS,
+        _NIVEAUX_FORMATIONS,
+        _PAYS,
+        _PERMIS,
+        _REGIONS,
+        _SECTEURS_ACTIVITES,
+        _THEMES,
+        _TYPES_CONTRATS,
+    )
+}
 
 
 class ReferentielsClient:
-    def __init__(self, credentials: FranceTravailCredentials, http_client: HttpClient) -> None:
+    def __init__(
+        self,
+        credentials: FranceTravailCredentials,
+        http_client: HttpClient,
+        referentiel_cache: ReferentielCache | None = None,
+    ) -> None:
         self._credentials = credentials
         self._http_client = http_client
+        self._referentiel_cache = referentiel_cache
+        self._authenticated_http_client = AuthenticatedHttpClient(credentials, http_client)
 
-    def metiers(self) -> list[Metier]:
+    def metiers(self) -> Referentiel[Metier]:
         """Get the ROME jobs (métiers) referential.
 
         Returns
         -------
-        list[Metier]
-            List of ROME jobs with their codes and labels
+        Referentiel[Metier]
+            ROME jobs with their codes and labels, indexed by code and label
 
         Examples
         --------
         >>> client = FranceTravailOffresClient(credentials, http_client)
         >>> client.referentiels.metiers()
-        [Metier(code="D1102", libelle="Boulangerie - viennoiserie"), ...]
+        Referentiel([Metier(code='D1102', libelle='Boulangerie - viennoiserie'), ...])
 
         References
         ----------
         .. [1] France Travail API Documentation - Référentiel - Métiers ROME
            https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielMetiers
         """
-        response = self._execute_get_request(REFERENTIEL_METIERS_API_URL)
-        return self._parse_metiers_response(response)
+        return self._fetch_referentiel(_METIERS)
 
-    async def metiers_async(self) -> list[Metier]:
+    async def metiers_async(self) -> Referentiel[Metier]:
         """Get the ROME jobs (métiers) referential asynchronously.
 
         Returns
         -------
-        list[Metier]
-            List of ROME jobs with their codes and labels
+        Referentiel[Metier]
+            ROME jobs with their codes and labels, indexed by code and label
 
         Examples
         --------
         >>> import asyncio
         >>> client = FranceTravailOffresClient(credentials, http_client)
         >>> asyncio.run(client.referentiels.metiers_async())
-        [Metier(code="D1102", libelle="Boulangerie - viennoiserie"), ...]
+        Referentiel([Metier(code='D1102', libelle='Boulangerie - viennoiserie'), ...])
 
         References
         ----------
         .. [1] France Travail API Documentation - Référentiel - Métiers ROME
            https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielMetiers
         """
-        response = await self._execute_get_request_async(REFERENTIEL_METIERS_API_URL)
-        return self._parse_metiers_response(response)
+        return await self._fetch_referentiel_async(_METIERS)
 
-    def appellations(self) -> list[Appellation]:
+    def appellations(self) -> Referentiel[Appellation]:
         """Get the ROME appellations referential.
 
         Returns
         -------
-        list[Appellation]
-            List of ROME appellations with their codes and labels
+        Referentiel[Appellation]
+            ROME appellations with their codes and labels, indexed by code and label
 
         Examples
         --------
         >>> client = FranceTravailOffresClient(credentials, http_client)
-        >>> client.referentiels.appellations()
-        [Appellation(code="11573", libelle="Boulanger / Boulangère"), ...]
+        >>> appellations = client.referentiels.appellations()
+        >>> appellations.search("boulangere")
+        [Appellation(code='11573', libelle='Boulanger / Boulangère'), ...]
 
         References
         ----------
         .. [1] France Travail API Documentation - Référentiel - Appellations ROME
            https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielAppellations
         """
-        response = self._execute_get_request(REFERENTIEL_APPELLATIONS_API_URL)
-        return self._parse_appellations_response(response)
+        return self._fetch_referentiel(_APPELLATIONS)
 
-    async def appellations_async(self) -> list[Appellation]:
+    async def appellations_async(self) -> Referentiel[Appellation]:
         """Get the ROME appellations referential asynchronously.
 
         Returns
         -------
-        list[Appellation]
-            List of ROME appellations with their codes and labels
+        Referentiel[Appellation]
+            ROME appellations with their codes and labels, indexed by code and label
 
         Examples
         --------
         >>> import asyncio
         >>> client = FranceTravailOffresClient(credentials, http_client)
         >>> asyncio.run(client.referentiels.appellations_async())
-        [Appellation(code="11573", libelle="Boulanger / Boulangère"), ...]
+        Referentiel([Appellation(code='11573', libelle='Boulanger / Boulangère'), ...])
 
         References
         ----------
         .. [1] France Travail API Documentation - Référentiel - Appellations ROME
            https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielAppellations
         """
-        response = await self._execute_get_request_async(REFERENTIEL_APPELLATIONS_API_URL)
-        return self._parse_appellations_response(response)
+        return await self._fetch_referentiel_async(_APPELLATIONS)
+
+    def communes(self) -> Referentiel[Commune]:
+        """Get the communes referential.
+
+        Returns
+        -------
+        Referentiel[Commune]
+            Communes, indexed by code and label
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> client.referentiels.communes()
+        Referentiel([Commune(code='75056', libelle='PARIS', code_postal='75001', code_departement='75'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - communes
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielCommunes
+        """
+        return self._fetch_referentiel(_COMMUNES)
+
+    async def communes_async(self) -> Referentiel[Commune]:
+        """Get the communes referential asynchronously.
+
+        Returns
+        -------
+        Referentiel[Commune]
+            Communes, indexed by code and label
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> asyncio.run(client.referentiels.communes_async())
+        Referentiel([Commune(code='75056', libelle='PARIS', code_postal='75001', code_departement='75'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - communes
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielCommunes
+        """
+        return await self._fetch_referentiel_async(_COMMUNES)
+
+    def continents(self) -> Referentiel[Continent]:
+        """Get the continents referential.
+
+        Returns
+        -------
+        Referentiel[Continent]
+            Continents, indexed by code and label
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> client.referentiels.continents()
+        Referentiel([Continent(code='01', libelle='Afrique'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - continents
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielContinents
+        """
+        return self._fetch_referentiel(_CONTINENTS)
+
+    async def continents_async(self) -> Referentiel[Continent]:
+        """Get the continents referential asynchronously.
+
+        Returns
+        -------
+        Referentiel[Continent]
+            Continents, indexed by code and label
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> asyncio.run(client.referentiels.continents_async())
+        Referentiel([Continent(code='01', libelle='Afrique'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - continents
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielContinents
+        """
+        return await self._fetch_referentiel_async(_CONTINENTS)
+
+    def departements(self) -> Referentiel[Departement]:
+        """Get the départements referential.
+
+        Returns
+        -------
+        Referentiel[Departement]
+            Départements, indexed by code and label
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> client.referentiels.departements()
+        Referentiel([Departement(code='01', libelle='Ain', region=Region(code='84', libelle='Auvergne-Rhône-Alpes')), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - departements
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielDepartements
+        """
+        return self._fetch_referentiel(_DEPARTEMENTS)
+
+    async def departements_async(self) -> Referentiel[Departement]:
+        """Get the départements referential asynchronously.
+
+        Returns
+        -------
+        Referentiel[Departement]
+            Départements, indexed by code and label
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> asyncio.run(client.referentiels.departements_async())
+        Referentiel([Departement(code='01', libelle='Ain', region=Region(code='84', libelle='Auvergne-Rhône-Alpes')), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - departements
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielDepartements
+        """
+        return await self._fetch_referentiel_async(_DEPARTEMENTS)
+
+    def domaines(self) -> Referentiel[Domaine]:
+        """Get the professional domains (domaines métiers) referential.
+
+        Returns
+        -------
+        Referentiel[Domaine]
+            Professional domains (domaines métiers), indexed by code and label
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> client.referentiels.domaines()
+        Referentiel([Domaine(code='M18', libelle="Systèmes d'information et de télécommunication"), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - domaines
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielDomainesMetiers
+        """
+        return self._fetch_referentiel(_DOMAINES)
+
+    async def domaines_async(self) -> Referentiel[Domaine]:
+        """Get the professional domains (domaines métiers) referential asynchronously.
+
+        Returns
+        -------
+        Referentiel[Domaine]
+            Professional domains (domaines métiers), indexed by code and label
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> asyncio.run(client.referentiels.domaines_async())
+        Referentiel([Domaine(code='M18', libelle="Systèmes d'information et de télécommunication"), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - domaines
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielDomainesMetiers
+        """
+        return await self._fetch_referentiel_async(_DOMAINES)
+
+    def langues(self) -> Referentiel[LangueReferentiel]:
+        """Get the languages (langues) referential.
+
+        Returns
+        -------
+        Referentiel[LangueReferentiel]
+            Languages (langues), indexed by code and label
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> client.referentiels.langues()
+        Referentiel([LangueReferentiel(code='EN', libelle='Anglais'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - langues
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielLangues
+        """
+        return self._fetch_referentiel(_LANGUES)
+
+    async def langues_async(self) -> Referentiel[LangueReferentiel]:
+        """Get the languages (langues) referential asynchronously.
+
+        Returns
+        -------
+        Referentiel[LangueReferentiel]
+            Languages (langues), indexed by code and label
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> asyncio.run(client.referentiels.langues_async())
+        Referentiel([LangueReferentiel(code='EN', libelle='Anglais'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - langues
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielLangues
+        """
+        return await self._fetch_referentiel_async(_LANGUES)
+
+    def nafs(self) -> Referentiel[CodeNaf]:
+        """Get the NAF codes referential.
+
+        Returns
+        -------
+        Referentiel[CodeNaf]
+            NAF codes, indexed by code and label
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> client.referentiels.nafs()
+        Referentiel([CodeNaf(code='10.71C', libelle='Boulangerie et boulangerie-pâtisserie'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - nafs
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielCodesNAFs
+        """
+        return self._fetch_referentiel(_NAFS)
+
+    async def nafs_async(self) -> Referentiel[CodeNaf]:
+        """Get the NAF codes referential asynchronously.
+
+        Returns
+        -------
+        Referentiel[CodeNaf]
+            NAF codes, indexed by code and label
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> asyncio.run(client.referentiels.nafs_async())
+        Referentiel([CodeNaf(code='10.71C', libelle='Boulangerie et boulangerie-pâtisserie'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - nafs
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielCodesNAFs
+        """
+        return await self._fetch_referentiel_async(_NAFS)
+
+    def natures_contrats(self) -> Referentiel[NatureContrat]:
+        """Get the contract natures (natures de contrats) referential.
+
+        Returns
+        -------
+        Referentiel[NatureContrat]
+            Contract natures (natures de contrats), indexed by code and label
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> client.referentiels.natures_contrats()
+        Referentiel([NatureContrat(code='E1', libelle='Contrat travail'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - naturesContrats
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielNaturesContrats
+        """
+        return self._fetch_referentiel(_NATURES_CONTRATS)
+
+    async def natures_contrats_async(self) -> Referentiel[NatureContrat]:
+        """Get the contract natures (natures de contrats) referential asynchronously.
+
+        Returns
+        -------
+        Referentiel[NatureContrat]
+            Contract natures (natures de contrats), indexed by code and label
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> asyncio.run(client.referentiels.natures_contrats_async())
+        Referentiel([NatureContrat(code='E1', libelle='Contrat travail'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - naturesContrats
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielNaturesContrats
+        """
+        return await self._fetch_referentiel_async(_NATURES_CONTRATS)
+
+    def niveaux_formations(self) -> Referentiel[NiveauFormation]:
+        """Get the education levels (niveaux de formation) referential.
+
+        Returns
+        -------
+        Referentiel[NiveauFormation]
+            Education levels (niveaux de formation), indexed by code and label
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> client.referentiels.niveaux_formations()
+        Referentiel([NiveauFormation(code='NV1', libelle='Bac+5 et plus ou équivalents'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - niveauxFormations
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielNiveauxFormations
+        """
+        return self._fetch_referentiel(_NIVEAUX_FORMATIONS)
+
+    async def niveaux_formations_async(self) -> Referentiel[NiveauFormation]:
+        """Get the education levels (niveaux de formation) referential asynchronously.
+
+        Returns
+        -------
+        Referentiel[NiveauFormation]
+            Education levels (niveaux de formation), indexed by code and label
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> asyncio.run(client.referentiels.niveaux_formations_async())
+        Referentiel([NiveauFormation(code='NV1', libelle='Bac+5 et plus ou équivalents'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - niveauxFormations
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielNiveauxFormations
+        """
+        return await self._fetch_referentiel_async(_NIVEAUX_FORMATIONS)
+
+    def pays(self) -> Referentiel[Pays]:
+        """Get the countries (pays) referential.
+
+        Returns
+        -------
+        Referentiel[Pays]
+            Countries (pays), indexed by code and label
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> client.referentiels.pays()
+        Referentiel([Pays(code='01', libelle='France'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - pays
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielPays
+        """
+        return self._fetch_referentiel(_PAYS)
+
+    async def pays_async(self) -> Referentiel[Pays]:
+        """Get the countries (pays) referential asynchronously.
+
+        Returns
+        -------
+        Referentiel[Pays]
+            Countries (pays), indexed by code and label
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> asyncio.run(client.referentiels.pays_async())
+        Referentiel([Pays(code='01', libelle='France'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - pays
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielPays
+        """
+        return await self._fetch_referentiel_async(_PAYS)
+
+    def permis(self) -> Referentiel[PermisReferentiel]:
+        """Get the driving licenses (permis) referential.
+
+        Returns
+        -------
+        Referentiel[PermisReferentiel]
+            Driving licenses (permis), indexed by code and label
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> client.referentiels.permis()
+        Referentiel([PermisReferentiel(code='B', libelle='B - Véhicule léger'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - permis
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielPermis
+        """
+        return self._fetch_referentiel(_PERMIS)
+
+    async def permis_async(self) -> Referentiel[PermisReferentiel]:
+        """Get the driving licenses (permis) referential asynchronously.
+
+        Returns
+        -------
+        Referentiel[PermisReferentiel]
+            Driving licenses (permis), indexed by code and label
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> asyncio.run(client.referentiels.permis_async())
+        Referentiel([PermisReferentiel(code='B', libelle='B - Véhicule léger'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - permis
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielPermis
+        """
+        return await self._fetch_referentiel_async(_PERMIS)
+
+    def regions(self) -> Referentiel[Region]:
+        """Get the regions referential.
+
+        Returns
+        -------
+        Referentiel[Region]
+            Regions, indexed by code and label
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> client.referentiels.regions()
+        Referentiel([Region(code='84', libelle='Auvergne-Rhône-Alpes'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - regions
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielRegions
+        """
+        return self._fetch_referentiel(_REGIONS)
+
+    async def regions_async(self) -> Referentiel[Region]:
+        """Get the regions referential asynchronously.
+
+        Returns
+        -------
+        Referentiel[Region]
+            Regions, indexed by code and label
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> asyncio.run(client.referentiels.regions_async())
+        Referentiel([Region(code='84', libelle='Auvergne-Rhône-Alpes'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - regions
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielRegions
+        """
+        return await self._fetch_referentiel_async(_REGIONS)
+
+    def secteurs_activites(self) -> Referentiel[SecteurActivite]:
+        """Get the business sectors (secteurs d'activité) referential.
+
+        Returns
+        -------
+        Referentiel[SecteurActivite]
+            Business sectors (secteurs d'activité), indexed by code and label
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> client.referentiels.secteurs_activites()
+        Referentiel([SecteurActivite(code='10', libelle='Industries alimentaires'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - secteursActivites
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielSecteursActivites
+        """
+        return self._fetch_referentiel(_SECTEURS_ACTIVITES)
+
+    async def secteurs_activites_async(self) -> Referentiel[SecteurActivite]:
+        """Get the business sectors (secteurs d'activité) referential asynchronously.
+
+        Returns
+        -------
+        Referentiel[SecteurActivite]
+            Business sectors (secteurs d'activité), indexed by code and label
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> asyncio.run(client.referentiels.secteurs_activites_async())
+        Referentiel([SecteurActivite(code='10', libelle='Industries alimentaires'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - secteursActivites
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielSecteursActivites
+        """
+        return await self._fetch_referentiel_async(_SECTEURS_ACTIVITES)
+
+    def themes(self) -> Referentiel[Theme]:
+        """Get the job offer themes (thèmes) referential.
+
+        Returns
+        -------
+        Referentiel[Theme]
+            Job offer themes (thèmes), indexed by code and label
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> client.referentiels.themes()
+        Referentiel([Theme(code='1', libelle='Agriculture'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - themes
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielThemes
+        """
+        return self._fetch_referentiel(_THEMES)
+
+    async def themes_async(self) -> Referentiel[Theme]:
+        """Get the job offer themes (thèmes) referential asynchronously.
+
+        Returns
+        -------
+        Referentiel[Theme]
+            Job offer themes (thèmes), indexed by code and label
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> asyncio.run(client.referentiels.themes_async())
+        Referentiel([Theme(code='1', libelle='Agriculture'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - themes
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielThemes
+        """
+        return await self._fetch_referentiel_async(_THEMES)
+
+    def types_contrats(self) -> Referentiel[TypeContrat]:
+        """Get the contract types (types de contrats) referential.
+
+        Returns
+        -------
+        Referentiel[TypeContrat]
+            Contract types (types de contrats), indexed by code and label
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> client.referentiels.types_contrats()
+        Referentiel([TypeContrat(code='CDI', libelle='Contrat à durée indéterminée'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - typesContrats
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielTypesContrats
+        """
+        return self._fetch_referentiel(_TYPES_CONTRATS)
+
+    async def types_contrats_async(self) -> Referentiel[TypeContrat]:
+        """Get the contract types (types de contrats) referential asynchronously.
+
+        Returns
+        -------
+        Referentiel[TypeContrat]
+            Contract types (types de contrats), indexed by code and label
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> asyncio.run(client.referentiels.types_contrats_async())
+        Referentiel([TypeContrat(code='CDI', libelle='Contrat à durée indéterminée'), ...])
+
+        References
+        ----------
+        .. [1] France Travail API Documentation - Référentiel - typesContrats
+           https://francetravail.io/produits-partages/catalogue/offres-emploi/documentation#/api-reference/operations/recupererReferentielTypesContrats
+        """
+        return await self._fetch_referentiel_async(_TYPES_CONTRATS)
+
+    def stream(self, name: str) -> Iterator[Any]:
+        """Iterate over the items of a referential, each one yielded as soon as it is received.
+
+        The response is parsed as its bytes arrive, so that memory holds only the item being received
+        instead of the whole referential, e.g. for the large `appellations` and `communes` referentials.
+        Streamed referentials are always downloaded: the referential cache is neither read nor updated.
+
+        Parameters
+        ----------
+        name : str
+            Name of the referential in the API, e.g. `appellations` or `typesContrats`.
+
+        Yields
+        ------
+        Any
+            Items of the referential, of the same type as the ones of the matching method,
+            e.g. `Appellation` for `appellations`.
+
+        Raises
+        ------
+        ValueError
+            If the referential name is unknown.
+        FranceTravailException
+            If the API responds with an error.
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> for appellation in client.referentiels.stream("appellations"):
+        ...     print(appellation.libelle)
+        """
+        definition = _definition_of(name)
+        with self._authenticated_http_client.stream(definition.url) as response:
+            if not response.status_code.is_success:
+                raise FranceTravailException.from_http_response(response.read())
+            for item_json in response.iter_json_array():
+                yield definition.parse_item(item_json)
+
+    async def stream_async(self, name: str) -> AsyncIterator[Any]:
+        """Iterate asynchronously over the items of a referential, each one yielded as soon as it is received.
+
+        Parameters
+        ----------
+        name : str
+            Name of the referential in the API, e.g. `appellations` or `typesContrats`.
+
+        Yields
+        ------
+        Any
+            Items of the referential, of the same type as the ones of the matching method,
+            e.g. `Appellation` for `appellations`.
+
+        Raises
+        ------
+        ValueError
+            If the referential name is unknown.
+        FranceTravailException
+            If the API responds with an error.
+
+        Examples
+        --------
+        >>> client = FranceTravailOffresClient(credentials, http_client)
+        >>> async for appellation in client.referentiels.stream_async("appellations"):
+        ...     print(appellation.libelle)
+        """
+        definition = _definition_of(name)
+        async with self._authenticated_http_client.stream_async(definition.url) as response:
+            if not response.status_code.is_success:
+                raise FranceTravailException.from_http_response(await response.read_async())
+            async for item_json in response.iter_json_array_async():
+                yield definition.parse_item(item_json)
+
+    def _fetch_referentiel(self, definition: _ReferentielDefinition[ItemT]) -> Referentiel[ItemT]:
+        return definition.parse(self._get_referentiel(definition.name, definition.url))
+
+    async def _fetch_referentiel_async(self, definition: _ReferentielDefinition[ItemT]) -> Referentiel[ItemT]:
+        return definition.parse(await self._get_referentiel_async(definition.name, definition.url))
+
+    def _get_referentiel(self, name: str, url: str) -> list[dict[str, Any]]:
+        if self._referentiel_cache is None:
+            return _referentiel_body(self._execute_get_request(url))
+
+        cached_referentiel = self._referentiel_cache.load(name)
+        if cached_referentiel is not None and self._referentiel_cache.is_fresh(cached_referentiel):
+            return cached_referentiel.body
+        headers = cached_referentiel.to_conditional_headers() if cached_referentiel is not None else None
+        response = self._execute_get_request(url, headers)
+        return self._cache_referentiel(name, response, cached_referentiel)
+
+    async def _get_referentiel_async(self, name: str, url: str) -> list[dict[str, Any]]:
+        if self._referentiel_cache is None:
+            return _referentiel_body(await self._execute_get_request_async(url))
+
+        cached_referentiel = self._referentiel_cache.load(name)
+        if cached_referentiel is not None and self._referentiel_cache.is_fresh(cached_referentiel):
+            return cached_referentiel.body
+        headers = cached_referentiel.to_conditional_headers() if cached_referentiel is not None else None
+        response = await self._execute_get_request_async(url, headers)
+        return self._cache_referentiel(name, response, cached_referentiel)
+
+    def _cache_referentiel(
+        self, name: str, response: HTTPResponse, cached_referentiel: CachedReferentiel | None
+    ) -> list[dict[str, Any]]:
+        if response.status_code == http.HTTPStatus.NOT_MODIFIED and cached_referentiel is not None:
+            self._referentiel_cache.touch(name, cached_referentiel)  # type: ignore[union-attr]
+            return cached_referentiel.body
+        if not response.status_code.is_success and cached_referentiel is not None:
+            return cached_referentiel.body
+        body = _referentiel_body(response)
+        if response.status_code == http.HTTPStatus.OK:
+            self._referentiel_cache.save(name, body, response.headers)  # type: ignore[union-attr]
+        return body
+
+    def _execute_get_request(self, url: str, headers: dict[str, str] | None = None) -> HTTPResponse:
+        return self._authenticated_http_client.get(url, headers)
+
+    async def _execute_get_request_async(self, url: str, headers: dict[str, str] | None = None) -> HTTPResponse:
+        return await self._authenticated_http_client.get_async(url, headers)
 
-    def _execute_get_request(self, url: str) -> HTTPResponse:
-        return self._http_client.get(
-            url=url,
-            headers=self._credentials.to_authorization_header(),
-        )
 
-    async def _execute_get_request_async(self, url: str) -> HTTPResponse:
-        return await self._http_client.get_async(
-            url=url,
-            headers=self._credentials.to_authorization_header(),
-        )
+def _referentiel_body(response: HTTPResponse) -> list[dict[str, Any]]:
+    if not response.status_code.is_success:
+        raise FranceTravailException.from_http_response(response)
+    return cast(list[dict[str, Any]], response.body)
 
-    def _parse_metiers_response(self, response: HTTPResponse) -> list[Metier]:
-        metiers_data = cast(list[dict[str, Any]], response.body)
-        return [Metier.from_dict(metier_json) for metier_json in metiers_data]
 
-    def _parse_appellations_response(self, response: HTTPResponse) -> list[Appellation]:
-        appellations_data = cast(list[dict[str, Any]], response.body)
-        return [Appellation.from_dict(appellation_json) for appellation_json in appellations_data]
+def _definition_of(name: str) -> _ReferentielDefinition[Any]:
+    try:
+        return _DEFINITIONS_BY_NAME[name]
+    except KeyError:
+        raise ValueError(f"Unknown referential {name!r}, expected one of {sorted(_DEFINITIONS_BY_NAME)}") from None
@@ -0,0 +1,179 @@
+import collections
+import json
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, Protocol
+
+from france_travail_api.http_transport.json_decoding import JsonDecoder, default_json_decoder
+
+
+class OffreCacheBackend(Protocol):
+    """
+    Storage of job offer details, keyed by job offer ID.
+
+    Implement this protocol to store job offers elsewhere than in memory (SQLite, `shelve`...).
+    Job offers are stored as JSON bytes. Backends are responsible for expiring and evicting their
+    entries.
+
+    Examples
+    --------
+    >>> import shelve
+    >>>
+    >>> class ShelveBackend:
+    ...     def __init__(self, path: str) -> None:
+    ...         self._shelf = shelve.open(path)
+    ...
+    ...     def get(self, key: str) -> bytes | None:
+    ...         return self._shelf.get(key)
+    ...
+    ...     def set(self, key: str, value: bytes) -> None:
+    ...         self._shelf[key] = value
+    """
+
+    def get(self, key: str) -> bytes | None:
+        """Get the JSON representation of a job offer, or None if it is not stored."""
+        ...
+
+    def set(self, key: str, value: bytes) -> None:
+        """Store the JSON representation of a job offer."""
+        ...
+
+
+class LRUCacheBackend:
+    """
+    In-memory job offer storage, evicting least recently used and expired entries.
+
+    Parameters
+    ----------
+    max_size : int (default: 1024)
+        Maximum number of job offers stored.
+    ttl : float (default: 300.0)
+        Seconds during which a stored job offer is served.
+    monotonic : Callable[[], float]
+        Source of the current time in seconds, defaults to `time.monotonic`.
+
+    Examples
+    --------
+    >>> backend = LRUCacheBackend(max_size=10_000, ttl=600.0)
+    >>> backend.set("048KLTP", b'{"id":"048KLTP"}')
+    >>> backend.get("048KLTP")
+    b'{"id":"048KLTP"}'
+    """
+
+    def __init__(
+        self, max_size: int = 1024, ttl: float = 300.0, monotonic: Callable[[], float] = time.monotonic
+    ) -> None:
+        if max_size < 1:
+            raise ValueError(f"Cache size must be at least 1, got {max_size}")
+        self._max_size = max_size
+        self._ttl = ttl
+        self._monotonic = monotonic
+        self._entries: collections.OrderedDict[str, tuple[float, bytes]] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._entries[key] = (self._monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+
+class OffreCache:
+    """
+    Cache of job offer details, so that repeated lookups of the same offer do not reach the API.
+
+    Only found job offers are cached. Hits and misses are counted to monitor the cache efficiency.
+    Job offers are cached as JSON bytes, encoded once when cached and decoded on every hit, so that
+    callers mutating a job offer cannot alter the cached one. Decoding costs less than deep-copying
+    the cached job offer, especially with a fast JSON decoder.
+
+    Parameters
+    ----------
+    backend : OffreCacheBackend | None
+        Storage of the job offers, defaults to an in-memory `LRUCacheBackend`.
+    json_decoder : JsonDecoder | None
+        Decoder of the cached job offers, defaults to the fastest JSON decoder available (see
+        `france_travail_api.http_transport.json_decoding.default_json_decoder`).
+
+    Attributes
+    ----------
+    hits : int
+        Number of job offers served from the cache.
+    misses : int
+        Number of job offers which were not in the cache.
+
+    Examples
+    --------
+    >>> from france_travail_api import FranceTravailClient, OffreCache, Scope
+    >>> from france_travail_api.offres.cache import LRUCacheBackend
+    >>>
+    >>> offre_cache = OffreCache(LRUCacheBackend(max_size=10_000, ttl=600.0))
+    >>> with FranceTravailClient(
+    ...     client_id="your_id",
+    ...     client_secret="your_secret",
+    ...     scopes=[Scope.OFFRES],
+    ...     offre_cache=offre_cache,
+    ... ) as client:
+    ...     client.offres.get("048KLTP")
+    ...     client.offres.get("048KLTP")  # Served from the cache
+    >>> offre_cache.hits, offre_cache.misses
+    (1, 1)
+    """
+
+    def __init__(self, backend: OffreCacheBackend | None = None, json_decoder: JsonDecoder | None = None) -> None:
+        self._backend = backend or LRUCacheBackend()
+        self._json_decoder = json_decoder or default_json_decoder()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, offer_id: str) -> dict[str, Any] | None:
+        """
+        Get a cached job offer.
+
+        Parameters
+        ----------
+        offer_id : str
+            Job offer ID.
+
+        Returns
+        -------
+        dict[str, Any] | None
+            JSON representation of the job offer, decoded anew on every call, or None if it is not
+            cached.
+        """
+        value = self._backend.get(offer_id)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return self._json_decoder.decode(value)  # type: ignore[no-any-return]
+
+    def set(self, offer_id: str, value: dict[str, Any]) -> None:
+        """
+        Cache a job offer.
+
+        Parameters
+        ----------
+        offer_id : str
+            Job offer ID.
+        value : dict[str, Any]
+            JSON representation of the job offer, as returned by the API. It is encoded to JSON
+            bytes, so that later changes to it are not cached.
+        """
+        self._backend.set(offer_id, json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode())
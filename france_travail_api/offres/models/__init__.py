@@ -11,10 +11,27 @@ from .formation import Formation
 from .langue import Langue
 from .lieu_travail import LieuTravail
 from .metier import Metier
-from .offre import Offre
+from .offre import LazyOffre, Offre
 from .origine_offre import CodeOrigineOffre, OrigineOffre, PartenaireOffre
 from .permis import Permis
 from .qualite_pro import QualitePro
+from .referentiels import (
+    CodeNaf,
+    Commune,
+    Continent,
+    Departement,
+    Domaine,
+    LangueReferentiel,
+    NatureContrat,
+    NiveauFormation,
+    Pays,
+    PermisReferentiel,
+    ReferentielEntry,
+    Region,
+    SecteurActivite,
+    Theme,
+    TypeContrat,
+)
 from .salaire import ComplementSalaire, Salaire
 from .search_params import (
     DureeHebdo,
@@ -29,30 +46,46 @@ from .search_params import (
 __all__ = [
     "Agence",
     "Appellation",
+    "CodeNaf",
     "CodeOrigineOffre",
     "CodeTypeContrat",
+    "Commune",
     "Competence",
     "ComplementSalaire",
     "Contact",
     "ContexteTravail",
+    "Continent",
+    "Departement",
+    "Domaine",
     "DureeHebdo",
     "Entreprise",
+    "Exigence",
     "Experience",
     "ExperienceExigee",
-    "Exigence",
     "Formation",
     "Langue",
+    "LangueReferentiel",
+    "LazyOffre",
     "LieuTravail",
     "Metier",
     "ModeSelectionPartenaires",
+    "NatureContrat",
+    "NiveauFormation",
     "Offre",
     "OrigineOffre",
     "OrigineOffreFilter",
     "PartenaireOffre",
+    "Pays",
     "PeriodeSalaire",
     "Permis",
+    "PermisReferentiel",
     "Qualification",
     "QualitePro",
+    "ReferentielEntry",
+    "Region",
     "Salaire",
+    "SecteurActivite",
     "Sort",
+    "Theme",
+    "TypeContrat",
 ]
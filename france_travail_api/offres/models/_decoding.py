@@ -0,0 +1,230 @@
+import dataclasses
+import types
+from collections.abc import Callable, Sequence
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_FIELDS_BY_MODEL: dict[type, tuple["Field", ...]] = {}
+
+
+@dataclasses.dataclass(frozen=True)
+class Field:
+    """
+    Mapping of a JSON key to a dataclass field.
+
+    Parameters
+    ----------
+    name : str
+        Name of the dataclass field.
+    key : str
+        Key of the value in the JSON object.
+    convert : Callable[[Any], Any] | None
+        Conversion applied to the JSON value, skipped for missing and null values.
+    many : bool (default: False)
+        Whether the JSON value is an array, whose items are converted one by one into a list.
+    skip_empty : bool (default: False)
+        Whether empty values (empty string, object or array) are decoded like null values.
+    default_factory : Callable[[], Any] | None
+        Factory of the field value for missing and null values, which are otherwise decoded to None.
+    """
+
+    name: str
+    key: str
+    convert: Callable[[Any], Any] | None = None
+    many: bool = False
+    skip_empty: bool = False
+    default_factory: Callable[[], Any] | None = None
+
+
+def compile_from_dict(cls: type[T], fields: Sequence[Field]) -> Callable[[dict[str, Any]], T]:
+    """
+    Compile a function creating a dataclass instance from JSON data.
+
+    The fields are compiled once into a table of JSON keys and slot setters for the values stored
+    as they are, and a table of JSON keys, slot setters and decoders for the values which need a
+    conversion. Decoding an object then costs a single dictionary lookup per field and a call per
+    converted field, and fills the slots of the instance directly instead of going through the
+    dataclass `__init__` and its `object.__setattr__` call per field of frozen dataclasses.
+
+    Parameters
+    ----------
+    cls : type[T]
+        Dataclass with slots to create. Its `__init__` and `__post_init__` are not called.
+    fields : Sequence[Field]
+        Mapping of every field of the dataclass.
+
+    Returns
+    -------
+    Callable[[dict[str, Any]], T]
+        Function creating a `cls` instance from a JSON object.
+
+    Raises
+    ------
+    ValueError
+        If the fields do not match the fields of the dataclass, or the dataclass has no slots.
+
+    Examples
+    --------
+    >>> @dataclasses.dataclass(frozen=True, slots=True)
+    ... class Agence:
+    ...     telephone: str | None = None
+    >>> decode_agence = compile_from_dict(Agence, [Field("telephone", "telephone")])
+    >>> decode_agence({"telephone": "01 02 03 04 05"})
+    Agence(telephone='01 02 03 04 05')
+    """
+    fields_by_name = {field.name: field for field in fields}
+    dataclass_field_names = {dataclass_field.name for dataclass_field in dataclasses.fields(cls)}  # type: ignore[arg-type]
+    if set(fields_by_name) != dataclass_field_names or len(fields) != len(fields_by_name):
+        raise ValueError(f"Fields of {cls.__name__} must all be mapped exactly once")
+    slots: dict[str, Any] = {name: cls.__dict__.get(name) for name in dataclass_field_names}
+    if not all(isinstance(slot, types.MemberDescriptorType) for slot in slots.values()):
+        raise ValueError(f"{cls.__name__} must be a dataclass with slots")
+
+    raw_values: list[tuple[str, Callable[[Any, Any], None]]] = []
+    decoded_values: list[tuple[str, Callable[[Any, Any], None], Callable[[Any], Any]]] = []
+    for field in fields:
+        set_value = slots[field.name].__set__
+        decode = _value_decoder(field)
+        if decode is None:
+            raw_values.append((field.key, set_value))
+        else:
+            decoded_values.append((field.key, set_value, decode))
+    raw_value_table = tuple(raw_values)
+    decoded_value_table = tuple(decoded_values)
+    new = object.__new__
+
+    def from_dict(data: dict[str, Any]) -> T:
+        get = data.get
+        instance = new(cls)
+        for key, set_value in raw_value_table:
+            set_value(instance, get(key))
+        for key, set_value, decode in decoded_value_table:
+            set_value(instance, decode(get(key)))
+        return instance
+
+    _FIELDS_BY_MODEL[cls] = tuple(fields)
+    from_dict.__qualname__ = f"{cls.__qualname__}.from_dict"
+    return from_dict
+
+
+def model_fields(cls: type) -> tuple[Field, ...]:
+    """
+    Get the mapping of the fields of a dataclass whose `from_dict` was compiled.
+
+    Parameters
+    ----------
+    cls : type
+        Dataclass passed to `compile_from_dict`.
+
+    Returns
+    -------
+    tuple[Field, ...]
+        Mapping of every field of the dataclass.
+
+    Raises
+    ------
+    KeyError
+        If no `from_dict` was compiled for the dataclass.
+    """
+    return _FIELDS_BY_MODEL[cls]
+
+
+def compile_field_decoder(field: Field) -> Callable[[dict[str, Any]], Any]:
+    """
+    Compile a function decoding a single field from JSON data.
+
+    Parameters
+    ----------
+    field : Field
+        Mapping of the field.
+
+    Returns
+    -------
+    Callable[[dict[str, Any]], Any]
+        Function returning the field value decoded from a JSON object.
+
+    Examples
+    --------
+    >>> decode_count = compile_field_decoder(Field("count", "nombre", int))
+    >>> decode_count({"nombre": "3"})
+    3
+    """
+    key = field.key
+    decode = _value_decoder(field)
+    if decode is None:
+        return lambda data: data.get(key)
+    return lambda data: decode(data.get(key))
+
+
+def compile_attributes_decoder(fields: Sequence[Field]) -> Callable[[Any], None] | None:
+    """
+    Compile a function decoding in place the attributes of an object holding raw JSON values.
+
+    Each attribute is named after its field and holds the raw value of its key. Attributes whose
+    field needs no conversion are left untouched.
+
+    Parameters
+    ----------
+    fields : Sequence[Field]
+        Mapping of the attributes.
+
+    Returns
+    -------
+    Callable[[Any], None] | None
+        Function decoding the attributes of an object, or None if no attribute needs decoding.
+
+    Examples
+    --------
+    >>> from types import SimpleNamespace
+    >>> decode_attributes = compile_attributes_decoder([Field("count", "nombre", int)])
+    >>> item = SimpleNamespace(count="3")
+    >>> decode_attributes(item)
+    >>> item.count
+    3
+    """
+    table = tuple((field.name, decode) for field in fields if (decode := _value_decoder(field)) is not None)
+    if not table:
+        return None
+
+    def decode_attributes(obj: Any) -> None:
+        for name, decode in table:
+            setattr(obj, name, decode(getattr(obj, name)))
+
+    return decode_attributes
+
+
+def _value_decoder(field: Field) -> Callable[[Any], Any] | None:
+    """Decoder of the raw JSON value of a field, or None if the raw value is the field value."""
+    convert = field.convert
+    many = field.many
+    skip_empty = field.skip_empty
+    default_factory = field.default_factory
+    if convert is None and not many and not skip_empty and default_factory is None:
+        return None
+
+    convert_value: Callable[[Any], Any]
+    if convert is not None and many:
+
+        def convert_items(values: Any) -> list[Any]:
+            return [convert(value) for value in values]
+
+        convert_value = convert_items
+    elif convert is not None:
+        convert_value = convert
+    elif many:
+        convert_value = list
+    else:
+        convert_value = _identity
+
+    if default_factory is None and skip_empty:
+        return lambda value: convert_value(value) if value else None
+    if default_factory is None:
+        return lambda value: None if value is None else convert_value(value)
+    if skip_empty:
+        return lambda value: convert_value(value) if value else default_factory()
+    return lambda value: default_factory() if value is None else convert_value(value)
+
+
+def _identity(value: Any) -> Any:
+    return value
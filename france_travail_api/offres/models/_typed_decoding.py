@@ -0,0 +1,132 @@
+import dataclasses
+import functools
+import types
+import typing
+from typing import Any
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None  # type: ignore[assignment]
+
+from ._decoding import compile_attributes_decoder, model_fields
+from .offre import Offre
+
+
+class TypedOffreDecoder:
+    """
+    Decoder of job offers typed with `msgspec`, from the raw bytes of responses to `Offre`.
+
+    The JSON document is decoded in a single pass into structures mirroring the models, with the same
+    keys and conversions as `Offre.from_dict`, which are then converted to `Offre` without going
+    through dictionaries.
+
+    Requires the `msgspec` extra: `pip install france-travail-api[msgspec]`.
+
+    Raises
+    ------
+    ImportError
+        If `msgspec` is not installed.
+
+    Notes
+    -----
+    Values are validated against the types of the models: a value of an unexpected type or an unknown
+    code raises `msgspec.ValidationError`, a `ValueError`, for the whole document. Nested objects whose
+    keys are all missing or null are decoded to None, like empty objects, whereas `Offre.from_dict`
+    only decodes empty objects to None: `{"contact": {"nom": null}}` gives `contact=None` here but a
+    `Contact` whose attributes are all None there.
+
+    Examples
+    --------
+    >>> decoder = TypedOffreDecoder()
+    >>> decoder.decode(b'{"resultats": [{"id": "048KLTP", "typeContrat": "CDD"}]}')
+    {'resultats': [Offre(id='048KLTP', ..., type_contrat=<CodeTypeContrat.CDD: 'CDD'>, ...)]}
+    >>> decoder.from_dict({"id": "048KLTP"}).id
+    '048KLTP'
+    """
+
+    def __init__(self) -> None:
+        if msgspec is None:
+            raise ImportError("Typed decoding requires the `msgspec` extra: pip install france-travail-api[msgspec]")
+        offre_struct = _struct_of(Offre)
+        search_page_struct = msgspec.defstruct(
+            "_SearchPageStruct",
+            [("resultats", types.GenericAlias(list, offre_struct), msgspec.field(default_factory=list))],
+        )
+        self._offre_struct = offre_struct
+        self._search_page_decoder: msgspec.json.Decoder[Any] = msgspec.json.Decoder(search_page_struct)
+
+    def decode(self, content: bytes) -> dict[str, Any]:
+        """
+        Decode the body of a job offers search response.
+
+        Parameters
+        ----------
+        content : bytes
+            Raw body of the response.
+
+        Returns
+        -------
+        dict[str, Any]
+            Body of the response, whose `resultats` are `Offre` objects.
+        """
+        search_page = self._search_page_decoder.decode(content)
+        return {"resultats": msgspec.convert(search_page.resultats, list[Offre], from_attributes=True)}
+
+    def from_dict(self, data: dict[str, Any]) -> Offre:
+        """
+        Create an Offre from JSON data.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            JSON data from the France Travail API
+
+        Returns
+        -------
+        Offre
+            Job offer object
+        """
+        return msgspec.convert(msgspec.convert(data, self._offre_struct), Offre, from_attributes=True)
+
+
+@functools.cache
+def _struct_of(model: Any) -> Any:
+    """Create the `msgspec` structure mirroring a model, decoding its JSON keys with the conversions of its fields."""
+    hints = typing.get_type_hints(model)
+    struct_fields = []
+    fields = []
+    for field in model_fields(model):
+        struct_type = _struct_type_of(hints[field.name])
+        if struct_type is not Any:
+            # Nested models are decoded by their own structure.
+            field = dataclasses.replace(field, convert=None)
+        struct_fields.append((field.name, struct_type, None))
+        fields.append(field)
+
+    empty_values = (None,) * len(fields)
+    namespace = {
+        "__post_init__": compile_attributes_decoder(fields),
+        "__bool__": lambda struct: msgspec.structs.astuple(struct) != empty_values,
+    }
+    return msgspec.defstruct(
+        f"_{model.__name__}Struct",
+        struct_fields,
+        kw_only=True,
+        rename={field.name: field.key for field in fields},
+        namespace={name: value for name, value in namespace.items() if value is not None},
+    )
+
+
+def _struct_type_of(hint: Any) -> Any:
+    """Type of a field in a structure: the structure of nested models, else any raw JSON value."""
+    if isinstance(hint, types.UnionType):
+        hint = next(arg for arg in typing.get_args(hint) if arg is not type(None))
+    if typing.get_origin(hint) is list:
+        (item_hint,) = typing.get_args(hint)
+        return types.GenericAlias(list, _struct_of(item_hint)) | None if _is_model(item_hint) else Any
+    return _struct_of(hint) | None if _is_model(hint) else Any
+
+
+def _is_model(hint: Any) -> bool:
+    return isinstance(hint, type) and dataclasses.is_dataclass(hint)
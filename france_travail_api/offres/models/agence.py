@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 from typing import Any
 
+from ._decoding import Field, compile_from_dict
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Agence:
     """
     France Travail agency
@@ -25,7 +27,13 @@ class Agence:
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "Agence":
         """Create an Agence from JSON data."""
-        return Agence(
-            telephone=data.get("telephone"),
-            courriel=data.get("courriel"),
-        )
+        return _decode_agence(data)
+
+
+_decode_agence = compile_from_dict(
+    Agence,
+    [
+        Field("telephone", "telephone"),
+        Field("courriel", "courriel"),
+    ],
+)
@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from typing import Any
 
+from ._decoding import Field, compile_from_dict
 from .exigence import Exigence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Competence:
     """
     Attributes
@@ -24,9 +25,18 @@ class Competence:
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "Competence":
         """Create a Competence from JSON data."""
-        exigence_value = data.get("exigence")
-        return Competence(
-            code=data.get("code"),
-            libelle=data.get("libelle"),
-            exigence=Exigence.from_code(exigence_value) if isinstance(exigence_value, str) else None,
-        )
+        return _decode_competence(data)
+
+
+def _parse_exigence(exigence_value: object) -> Exigence | None:
+    return Exigence.from_code(exigence_value) if isinstance(exigence_value, str) else None
+
+
+_decode_competence = compile_from_dict(
+    Competence,
+    [
+        Field("code", "code"),
+        Field("libelle", "libelle"),
+        Field("exigence", "exigence", _parse_exigence),
+    ],
+)
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 from typing import Any
 
+from ._decoding import Field, compile_from_dict
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Contact:
     """
     Attributes
@@ -44,14 +46,20 @@ class Contact:
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "Contact":
         """Create a Contact from JSON data."""
-        return Contact(
-            nom=data.get("nom"),
-            coordonnees1=data.get("coordonnees1"),
-            coordonnees2=data.get("coordonnees2"),
-            coordonnees3=data.get("coordonnees3"),
-            telephone=data.get("telephone"),
-            courriel=data.get("courriel"),
-            commentaire=data.get("commentaire"),
-            url_recruteur=data.get("urlRecruteur"),
-            url_postulation=data.get("urlPostulation"),
-        )
+        return _decode_contact(data)
+
+
+_decode_contact = compile_from_dict(
+    Contact,
+    [
+        Field("nom", "nom"),
+        Field("coordonnees1", "coordonnees1"),
+        Field("coordonnees2", "coordonnees2"),
+        Field("coordonnees3", "coordonnees3"),
+        Field("telephone", "telephone"),
+        Field("courriel", "courriel"),
+        Field("commentaire", "commentaire"),
+        Field("url_recruteur", "urlRecruteur"),
+        Field("url_postulation", "urlPostulation"),
+    ],
+)
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 from typing import Any
 
+from ._decoding import Field, compile_from_dict
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ContexteTravail:
     """
     Work context (hours and conditions)
@@ -25,9 +27,13 @@ class ContexteTravail:
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "ContexteTravail":
         """Create a ContexteTravail from JSON data."""
-        return ContexteTravail(
-            horaires=list(data["horaires"]) if data.get("horaires") is not None else None,
-            conditions_exercice=list(data["conditionsExercice"])
-            if data.get("conditionsExercice") is not None
-            else None,
-        )
+        return _decode_contexte_travail(data)
+
+
+_decode_contexte_travail = compile_from_dict(
+    ContexteTravail,
+    [
+        Field("horaires", "horaires", many=True),
+        Field("conditions_exercice", "conditionsExercice", many=True),
+    ],
+)
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 from typing import Any
 
+from ._decoding import Field, compile_from_dict
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Entreprise:
     """
     Attributes
@@ -32,10 +34,16 @@ class Entreprise:
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "Entreprise":
         """Create an Entreprise from JSON data."""
-        return Entreprise(
-            nom=data.get("nom"),
-            description=data.get("description"),
-            logo=data.get("logo"),
-            url=data.get("url"),
-            entreprise_adaptee=data.get("entrepriseAdaptee"),
-        )
+        return _decode_entreprise(data)
+
+
+_decode_entreprise = compile_from_dict(
+    Entreprise,
+    [
+        Field("nom", "nom"),
+        Field("description", "description"),
+        Field("logo", "logo"),
+        Field("url", "url"),
+        Field("entreprise_adaptee", "entrepriseAdaptee"),
+    ],
+)
@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from typing import Any
 
+from ._decoding import Field, compile_from_dict
 from .exigence import Exigence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Formation:
     """
     Attributes
@@ -30,11 +31,16 @@ class Formation:
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "Formation":
         """Create a Formation from JSON data."""
-        exigence_code = data.get("exigence")
-        return Formation(
-            code_formation=data.get("codeFormation"),
-            domaine_libelle=data.get("domaineLibelle"),
-            niveau_libelle=data.get("niveauLibelle"),
-            commentaire=data.get("commentaire"),
-            exigence=Exigence.from_code(exigence_code) if exigence_code is not None else None,
-        )
+        return _decode_formation(data)
+
+
+_decode_formation = compile_from_dict(
+    Formation,
+    [
+        Field("code_formation", "codeFormation"),
+        Field("domaine_libelle", "domaineLibelle"),
+        Field("niveau_libelle", "niveauLibelle"),
+        Field("commentaire", "commentaire"),
+        Field("exigence", "exigence", Exigence.from_code),
+    ],
+)
@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from typing import Any
 
+from ._decoding import Field, compile_from_dict
 from .exigence import Exigence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Langue:
     """
     Attributes
@@ -21,8 +22,13 @@ class Langue:
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "Langue":
         """Create a Langue from JSON data."""
-        exigence_code = data.get("exigence")
-        return Langue(
-            libelle=data.get("libelle"),
-            exigence=Exigence.from_code(exigence_code) if exigence_code is not None else None,
-        )
+        return _decode_langue(data)
+
+
+_decode_langue = compile_from_dict(
+    Langue,
+    [
+        Field("libelle", "libelle"),
+        Field("exigence", "exigence", Exigence.from_code),
+    ],
+)
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 from typing import Any
 
+from ._decoding import Field, compile_from_dict
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class LieuTravail:
     """
     Attributes
@@ -32,10 +34,16 @@ class LieuTravail:
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "LieuTravail":
         """Create a LieuTravail from JSON data."""
-        return LieuTravail(
-            libelle=data.get("libelle"),
-            latitude=data.get("latitude"),
-            longitude=data.get("longitude"),
-            code_postal=data.get("codePostal"),
-            commune=data.get("commune"),
-        )
+        return _decode_lieu_travail(data)
+
+
+_decode_lieu_travail = compile_from_dict(
+    LieuTravail,
+    [
+        Field("libelle", "libelle"),
+        Field("latitude", "latitude"),
+        Field("longitude", "longitude"),
+        Field("code_postal", "codePostal"),
+        Field("commune", "commune"),
+    ],
+)
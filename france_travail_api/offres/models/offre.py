@@ -1,7 +1,9 @@
 import datetime
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
+from ._decoding import Field, compile_field_decoder, compile_from_dict
 from .agence import Agence
 from .competence import Competence
 from .contact import Contact
@@ -23,7 +25,7 @@ def _parse_date(date_str: str) -> datetime.datetime:
     return datetime.datetime.fromisoformat(date_str.replace("Z", "+00:00"))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Offre:
     """
     Job offer
@@ -202,56 +204,136 @@ class Offre:
         Offre
             Job offer object
         """
-        return Offre(
-            id=data.get("id"),
-            intitule=data.get("intitule"),
-            description=data.get("description"),
-            date_creation=_parse_date(data["dateCreation"]) if data.get("dateCreation") else None,
-            date_actualisation=_parse_date(data["dateActualisation"]) if data.get("dateActualisation") else None,
-            lieu_travail=LieuTravail.from_dict(data["lieuTravail"]) if data.get("lieuTravail") else None,
-            rome_code=data.get("romeCode"),
-            rome_libelle=data.get("romeLibelle"),
-            appellation_libelle=data.get("appellationlibelle"),
-            entreprise=Entreprise.from_dict(data["entreprise"]) if data.get("entreprise") else None,
-            type_contrat=CodeTypeContrat(data["typeContrat"]) if data.get("typeContrat") else None,
-            type_contrat_libelle=data.get("typeContratLibelle"),
-            nature_contrat=data.get("natureContrat"),
-            experience_exige=ExperienceExigee.from_code(data["experienceExige"])
-            if data.get("experienceExige")
-            else None,
-            experience_libelle=data.get("experienceLibelle"),
-            experience_commentaire=data.get("experienceCommentaire"),
-            formations=[Formation.from_dict(formation_dict) for formation_dict in data.get("formations", [])],
-            langues=[Langue.from_dict(langue_dict) for langue_dict in data.get("langues", [])],
-            permis=[Permis.from_dict(permis_dict) for permis_dict in data.get("permis", [])],
-            competences=[Competence.from_dict(competence_dict) for competence_dict in data.get("competences", [])],
-            outils_bureautiques=data.get("outilsBureautiques", []),
-            salaire=Salaire.from_dict(data["salaire"]) if data.get("salaire") else None,
-            duree_travail_libelle=data.get("dureeTravailLibelle"),
-            duree_travail_libelle_converti=data.get("dureeTravailLibelleConverti"),
-            complement_exercice=data.get("complementExercice"),
-            condition_exercice=data.get("conditionExercice"),
-            alternance=data.get("alternance"),
-            contact=Contact.from_dict(data["contact"]) if data.get("contact") else None,
-            agence=Agence.from_dict(data["agence"]) if data.get("agence") else None,
-            nombre_postes=data.get("nombrePostes"),
-            accessible_th=data.get("accessibleTH"),
-            deplacement_code=data.get("deplacementCode"),
-            deplacement_libelle=data.get("deplacementLibelle"),
-            qualification_code=data.get("qualificationCode"),
-            qualification_libelle=data.get("qualificationLibelle"),
-            code_naf=data.get("codeNAF"),
-            secteur_activite=data.get("secteurActivite"),
-            secteur_activite_libelle=data.get("secteurActiviteLibelle"),
-            qualites_professionnelles=[
-                QualitePro.from_dict(qualite_pro_dict) for qualite_pro_dict in data.get("qualitesProfessionnelles", [])
-            ],
-            tranche_effectif_etab=data.get("trancheEffectifEtab"),
-            origine_offre=OrigineOffre.from_dict(data["origineOffre"]) if data.get("origineOffre") else None,
-            offres_manque_candidats=data.get("offresManqueCandidats"),
-            contexte_travail=ContexteTravail.from_dict(data["contexteTravail"])
-            if data.get("contexteTravail")
-            else None,
-            entreprise_adaptee=data.get("entrepriseAdaptee"),
-            employeur_handi_engage=data.get("employeurHandiEngage"),
-        )
+        return _decode_offre(data)
+
+
+_OFFRE_FIELDS = (
+    Field("id", "id"),
+    Field("intitule", "intitule"),
+    Field("description", "description"),
+    Field("date_creation", "dateCreation", _parse_date, skip_empty=True),
+    Field("date_actualisation", "dateActualisation", _parse_date, skip_empty=True),
+    Field("lieu_travail", "lieuTravail", LieuTravail.from_dict, skip_empty=True),
+    Field("rome_code", "romeCode"),
+    Field("rome_libelle", "romeLibelle"),
+    Field("appellation_libelle", "appellationlibelle"),
+    Field("entreprise", "entreprise", Entreprise.from_dict, skip_empty=True),
+    Field("type_contrat", "typeContrat", CodeTypeContrat, skip_empty=True),
+    Field("type_contrat_libelle", "typeContratLibelle"),
+    Field("nature_contrat", "natureContrat"),
+    Field("experience_exige", "experienceExige", ExperienceExigee.from_code, skip_empty=True),
+    Field("experience_libelle", "experienceLibelle"),
+    Field("experience_commentaire", "experienceCommentaire"),
+    Field("formations", "formations", Formation.from_dict, many=True, default_factory=list),
+    Field("langues", "langues", Langue.from_dict, many=True, default_factory=list),
+    Field("permis", "permis", Permis.from_dict, many=True, default_factory=list),
+    Field("outils_bureautiques", "outilsBureautiques", default_factory=list),
+    Field("competences", "competences", Competence.from_dict, many=True, default_factory=list),
+    Field("salaire", "salaire", Salaire.from_dict, skip_empty=True),
+    Field("duree_travail_libelle", "dureeTravailLibelle"),
+    Field("duree_travail_libelle_converti", "dureeTravailLibelleConverti"),
+    Field("complement_exercice", "complementExercice"),
+    Field("condition_exercice", "conditionExercice"),
+    Field("alternance", "alternance"),
+    Field("contact", "contact", Contact.from_dict, skip_empty=True),
+    Field("agence", "agence", Agence.from_dict, skip_empty=True),
+    Field("nombre_postes", "nombrePostes"),
+    Field("accessible_th", "accessibleTH"),
+    Field("deplacement_code", "deplacementCode"),
+    Field("deplacement_libelle", "deplacementLibelle"),
+    Field("qualification_code", "qualificationCode"),
+    Field("qualification_libelle", "qualificationLibelle"),
+    Field("code_naf", "codeNAF"),
+    Field("secteur_activite", "secteurActivite"),
+    Field("secteur_activite_libelle", "secteurActiviteLibelle"),
+    Field(
+        "qualites_professionnelles",
+        "qualitesProfessionnelles",
+        QualitePro.from_dict,
+        many=True,
+        default_factory=list,
+    ),
+    Field("tranche_effectif_etab", "trancheEffectifEtab"),
+    Field("origine_offre", "origineOffre", OrigineOffre.from_dict, skip_empty=True),
+    Field("offres_manque_candidats", "offresManqueCandidats"),
+    Field("contexte_travail", "contexteTravail", ContexteTravail.from_dict, skip_empty=True),
+    Field("entreprise_adaptee", "entrepriseAdaptee"),
+    Field("employeur_handi_engage", "employeurHandiEngage"),
+)
+
+_decode_offre = compile_from_dict(Offre, _OFFRE_FIELDS)
+
+
+class _LazyField:
+    """Offre field decoded from the raw JSON data on first access, then stored in its slot."""
+
+    __slots__ = ("_slot", "_decode")
+
+    def __init__(self, slot: Any, decode: Callable[[dict[str, Any]], Any]) -> None:
+        self._slot = slot
+        self._decode = decode
+
+    def __get__(self, instance: "LazyOffre | None", owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        try:
+            return self._slot.__get__(instance, owner)
+        except AttributeError:
+            value = self._decode(instance._data)
+            self._slot.__set__(instance, value)
+            return value
+
+    def __set__(self, instance: "LazyOffre", value: Any) -> None:
+        self._slot.__set__(instance, value)
+
+
+class LazyOffre(Offre):
+    """
+    Job offer decoded lazily from the JSON data of the France Travail API.
+
+    Creating a `LazyOffre` only retains the JSON data: each attribute, including nested objects and
+    dates, is decoded on first access then kept. Use it when only a few attributes of each offer are
+    read, e.g. `id`, `intitule` and `date_creation` of wide search results.
+
+    A `LazyOffre` is an `Offre`, with the same attributes and immutability.
+
+    Notes
+    -----
+    A `LazyOffre` compares equal to other lazy offers with the same attributes, but not to an
+    `Offre`. The JSON data must not be modified once the offer is created.
+
+    Examples
+    --------
+    >>> offre = LazyOffre.from_dict({"id": "048KLTP", "dateCreation": "2022-10-23T08:15:42.000Z"})
+    >>> offre.id
+    '048KLTP'
+    >>> offre.date_creation
+    datetime.datetime(2022, 10, 23, 8, 15, 42, tzinfo=datetime.timezone.utc)
+    """
+
+    __slots__ = ("_data",)
+
+    _data: dict[str, Any]
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> "LazyOffre":
+        """Create a LazyOffre retaining JSON data, decoded on attribute access.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            JSON data from the France Travail API
+
+        Returns
+        -------
+        LazyOffre
+            Job offer object
+        """
+        offre = object.__new__(LazyOffre)
+        object.__setattr__(offre, "_data", data)
+        return offre
+
+
+for _field in _OFFRE_FIELDS:
+    setattr(LazyOffre, _field.name, _LazyField(Offre.__dict__[_field.name], compile_field_decoder(_field)))
+del _field
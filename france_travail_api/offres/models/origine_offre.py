@@ -2,8 +2,10 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
+from ._decoding import Field, compile_from_dict
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class PartenaireOffre:
     """
     Attributes
@@ -39,7 +41,7 @@ class CodeOrigineOffre(Enum):
         return mapping[code]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrigineOffre:
     """
     Attributes
@@ -63,20 +65,23 @@ class OrigineOffre:
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "OrigineOffre":
         """Create an OrigineOffre from JSON data."""
-        partenaires_data = data.get("partenaires")
-        return OrigineOffre(
-            origine=CodeOrigineOffre.from_code(data["origine"]) if data.get("origine") else None,
-            url_origine=data.get("urlOrigine"),
-            partenaires=(
-                [
-                    PartenaireOffre(
-                        nom=partenaire.get("nom"),
-                        url=partenaire.get("url"),
-                        logo=partenaire.get("logo"),
-                    )
-                    for partenaire in partenaires_data
-                ]
-                if partenaires_data is not None
-                else None
-            ),
-        )
+        return _decode_origine_offre(data)
+
+
+_decode_partenaire_offre = compile_from_dict(
+    PartenaireOffre,
+    [
+        Field("nom", "nom"),
+        Field("url", "url"),
+        Field("logo", "logo"),
+    ],
+)
+
+_decode_origine_offre = compile_from_dict(
+    OrigineOffre,
+    [
+        Field("origine", "origine", CodeOrigineOffre.from_code, skip_empty=True),
+        Field("url_origine", "urlOrigine"),
+        Field("partenaires", "partenaires", _decode_partenaire_offre, many=True),
+    ],
+)
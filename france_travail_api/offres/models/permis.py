@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from typing import Any
 
+from ._decoding import Field, compile_from_dict
 from .exigence import Exigence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Permis:
     """
     Driving license information
@@ -23,8 +24,13 @@ class Permis:
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "Permis":
         """Create a Permis from JSON data."""
-        exigence_code = data.get("exigence")
-        return Permis(
-            libelle=data.get("libelle"),
-            exigence=Exigence.from_code(exigence_code) if exigence_code is not None else None,
-        )
+        return _decode_permis(data)
+
+
+_decode_permis = compile_from_dict(
+    Permis,
+    [
+        Field("libelle", "libelle"),
+        Field("exigence", "exigence", Exigence.from_code),
+    ],
+)
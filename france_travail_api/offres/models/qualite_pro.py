@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 from typing import Any
 
+from ._decoding import Field, compile_from_dict
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class QualitePro:
     """
     Attributes
@@ -19,7 +21,13 @@ class QualitePro:
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "QualitePro":
         """Create a QualitePro from JSON data."""
-        return QualitePro(
-            libelle=data.get("libelle"),
-            description=data.get("description"),
-        )
+        return _decode_qualite_pro(data)
+
+
+_decode_qualite_pro = compile_from_dict(
+    QualitePro,
+    [
+        Field("libelle", "libelle"),
+        Field("description", "description"),
+    ],
+)
@@ -0,0 +1,164 @@
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+ReferentielEntryT = TypeVar("ReferentielEntryT", bound="ReferentielEntry")
+
+
+@dataclass(frozen=True, slots=True)
+class ReferentielEntry:
+    """
+    Entry of a France Travail referential, identified by a code.
+
+    Attributes
+    ----------
+    code : str | None = None
+        Entry code (e.g., "CDI")
+    libelle : str | None = None
+        Entry label (e.g., "Contrat à durée indéterminée")
+    """
+
+    code: str | None = None
+    libelle: str | None = None
+
+    @classmethod
+    def from_dict(cls: type[ReferentielEntryT], data: dict[str, Any]) -> ReferentielEntryT:
+        """
+        Create a referential entry from JSON data.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            Dictionary containing the entry data from France Travail API
+
+        Returns
+        -------
+        ReferentielEntryT
+            Entry of the referential it is called on
+        """
+        return cls(
+            code=data.get("code"),
+            libelle=data.get("libelle"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CodeNaf(ReferentielEntry):
+    """NAF code of a business activity (e.g., "10.71C" for Boulangerie et boulangerie-pâtisserie)."""
+
+
+@dataclass(frozen=True, slots=True)
+class Continent(ReferentielEntry):
+    """Continent (e.g., "01" for Afrique)."""
+
+
+@dataclass(frozen=True, slots=True)
+class Domaine(ReferentielEntry):
+    """Professional domain of ROME jobs (e.g., "M18" for Systèmes d'information et de télécommunication)."""
+
+
+@dataclass(frozen=True, slots=True)
+class LangueReferentiel(ReferentielEntry):
+    """Language which can be required by job offers (e.g., "EN" for Anglais)."""
+
+
+@dataclass(frozen=True, slots=True)
+class NatureContrat(ReferentielEntry):
+    """Nature of an employment contract (e.g., "E1" for Contrat travail)."""
+
+
+@dataclass(frozen=True, slots=True)
+class NiveauFormation(ReferentielEntry):
+    """Education level (e.g., "NV1" for Bac+5 et plus ou équivalents)."""
+
+
+@dataclass(frozen=True, slots=True)
+class Pays(ReferentielEntry):
+    """Country (e.g., "01" for France)."""
+
+
+@dataclass(frozen=True, slots=True)
+class PermisReferentiel(ReferentielEntry):
+    """Driving license which can be required by job offers (e.g., "B" for B - Véhicule léger)."""
+
+
+@dataclass(frozen=True, slots=True)
+class Region(ReferentielEntry):
+    """French region (e.g., "84" for Auvergne-Rhône-Alpes)."""
+
+
+@dataclass(frozen=True, slots=True)
+class SecteurActivite(ReferentielEntry):
+    """Business sector (e.g., "10" for Industries alimentaires)."""
+
+
+@dataclass(frozen=True, slots=True)
+class Theme(ReferentielEntry):
+    """Job offer theme (e.g., "1" for Agriculture)."""
+
+
+@dataclass(frozen=True, slots=True)
+class TypeContrat(ReferentielEntry):
+    """Type of employment contract (e.g., "CDI" for Contrat à durée indéterminée)."""
+
+
+@dataclass(frozen=True, slots=True)
+class Commune:
+    """
+    French commune.
+
+    Attributes
+    ----------
+    code : str | None = None
+        INSEE code of the commune (e.g., "75056" for Paris)
+    libelle : str | None = None
+        Name of the commune (e.g., "PARIS")
+    code_postal : str | None = None
+        Postal code of the commune (e.g., "75001")
+    code_departement : str | None = None
+        Code of the département of the commune (e.g., "75")
+    """
+
+    code: str | None = None
+    libelle: str | None = None
+    code_postal: str | None = None
+    code_departement: str | None = None
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> "Commune":
+        """Create a Commune from JSON data."""
+        return Commune(
+            code=data.get("code"),
+            libelle=data.get("libelle"),
+            code_postal=data.get("codePostal"),
+            code_departement=data.get("codeDepartement"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Departement:
+    """
+    French département.
+
+    Attributes
+    ----------
+    code : str | None = None
+        Code of the département (e.g., "01")
+    libelle : str | None = None
+        Name of the département (e.g., "Ain")
+    region : Region | None = None
+        Region of the département
+    """
+
+    code: str | None = None
+    libelle: str | None = None
+    region: Region | None = None
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> "Departement":
+        """Create a Departement from JSON data."""
+        region_data = data.get("region")
+        return Departement(
+            code=data.get("code"),
+            libelle=data.get("libelle"),
+            region=Region.from_dict(region_data) if region_data is not None else None,
+        )
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 from typing import Any
 
+from ._decoding import Field, compile_from_dict
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ComplementSalaire:
     """
     Attributes
@@ -21,7 +23,7 @@ class ComplementSalaire:
     libelle: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Salaire:
     """
     Attributes
@@ -51,21 +53,24 @@ class Salaire:
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "Salaire":
         """Create a Salaire from JSON data."""
-        liste_complements_data = data.get("listeComplements")
-        return Salaire(
-            libelle=data.get("libelle"),
-            commentaire=data.get("commentaire"),
-            complement1=data.get("complement1"),
-            complement2=data.get("complement2"),
-            liste_complements=(
-                [
-                    ComplementSalaire(
-                        code=complement.get("code"),
-                        libelle=complement.get("libelle"),
-                    )
-                    for complement in liste_complements_data
-                ]
-                if liste_complements_data is not None
-                else None
-            ),
-        )
+        return _decode_salaire(data)
+
+
+_decode_complement_salaire = compile_from_dict(
+    ComplementSalaire,
+    [
+        Field("code", "code"),
+        Field("libelle", "libelle"),
+    ],
+)
+
+_decode_salaire = compile_from_dict(
+    Salaire,
+    [
+        Field("libelle", "libelle"),
+        Field("commentaire", "commentaire"),
+        Field("complement1", "complement1"),
+        Field("complement2", "complement2"),
+        Field("liste_complements", "listeComplements", _decode_complement_salaire, many=True),
+    ],
+)
@@ -0,0 +1,202 @@
+import re
+import unicodedata
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Generic, Protocol, TypeVar, overload
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+class ReferentielItem(Protocol):
+    """Item of a referentiel, identified by a code and described by a label."""
+
+    @property
+    def code(self) -> str | None: ...
+
+    @property
+    def libelle(self) -> str | None: ...
+
+
+ItemT = TypeVar("ItemT", bound=ReferentielItem)
+
+
+def normalize_label(label: str) -> str:
+    """
+    Normalize a label for accent and case insensitive matching.
+
+    Parameters
+    ----------
+    label : str
+        Label to normalize.
+
+    Returns
+    -------
+    str
+        Label without accents, case folded, with words separated by single spaces.
+
+    Examples
+    --------
+    >>> normalize_label("Boulanger / Boulangère")
+    'boulanger boulangere'
+    """
+    decomposed_label = unicodedata.normalize("NFKD", label.casefold())
+    unaccented_label = "".join(character for character in decomposed_label if not unicodedata.combining(character))
+    return " ".join(_WORD_PATTERN.findall(unaccented_label))
+
+
+class _TrieNode:
+    __slots__ = ("children", "item_indexes")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.item_indexes: list[int] = []
+
+
+class Referentiel(Sequence[ItemT], Generic[ItemT]):
+    """
+    Immutable sequence of referentiel items, indexed for fast lookups.
+
+    Items can be looked up by code in constant time, and searched by label prefix in time
+    proportional to the length of the query, ignoring accents and case.
+
+    Parameters
+    ----------
+    items : Iterable[ItemT]
+        Items of the referentiel, in the order of the API.
+
+    Notes
+    -----
+    A `Referentiel` compares equal to a list holding the same items, in the same order.
+
+    The methods of `client.offres.referentiels` return a `Referentiel` rather than a `list`. It is a
+    read-only sequence: code mutating the result (`append`, `sort`...), concatenating it with `+` or
+    checking `isinstance(result, list)` must first convert it with `list(result)`.
+
+    Examples
+    --------
+    >>> appellations = client.offres.referentiels.appellations()
+    >>> appellations.get("11573")
+    Appellation(code='11573', libelle='Boulanger / Boulangère')
+    >>> appellations.search("boulangere", limit=1)
+    [Appellation(code='11573', libelle='Boulanger / Boulangère')]
+    """
+
+    def __init__(self, items: Iterable[ItemT]) -> None:
+        self._items = tuple(items)
+        self._items_by_code = {item.code: item for item in self._items if item.code is not None}
+        self._normalized_labels = tuple(normalize_label(item.libelle or "") for item in self._items)
+        self._trie_root = _TrieNode()
+        for item_index, item in enumerate(self._items):
+            for word in {*self._normalized_labels[item_index].split(), *normalize_label(item.code or "").split()}:
+                self._index_word(word, item_index)
+
+    def get(self, code: str) -> ItemT | None:
+        """
+        Get an item by its code.
+
+        Parameters
+        ----------
+        code : str
+            Code of the item (e.g. "M1805").
+
+        Returns
+        -------
+        ItemT | None
+            Item with this code, or None if there is none.
+        """
+        return self._items_by_code.get(code)
+
+    def has_code(self, code: str) -> bool:
+        """
+        Tell whether an item has a given code.
+
+        Parameters
+        ----------
+        code : str
+            Code of the item (e.g. "M1805").
+
+        Returns
+        -------
+        bool
+            True if an item has this code.
+        """
+        return code in self._items_by_code
+
+    def search(self, query: str, limit: int | None = 10) -> list[ItemT]:
+        """
+        Search items whose label or code has words starting with the words of a query.
+
+        Matching ignores accents, case and punctuation: "boulangere" matches "Boulanger / Boulangère",
+        and "dev back" matches "Développeur / Développeuse back-end".
+
+        Parameters
+        ----------
+        query : str
+            Words, or beginnings of words, to search for.
+        limit : int | None (default: 10)
+            Maximum number of items returned, None for no limit.
+
+        Returns
+        -------
+        list[ItemT]
+            Matching items, those whose label starts with the query first, then in referentiel order.
+        """
+        query_words = normalize_label(query).split()
+        if not query_words:
+            return []
+        candidate_indexes = self._find_item_indexes(query_words[0])
+        matching_indexes = [
+            item_index
+            for item_index in candidate_indexes
+            if all(self._has_word_starting_with(item_index, query_word) for query_word in query_words[1:])
+        ]
+        normalized_query = " ".join(query_words)
+        matching_indexes.sort(
+            key=lambda item_index: (not self._normalized_labels[item_index].startswith(normalized_query), item_index)
+        )
+        return [self._items[item_index] for item_index in matching_indexes[:limit]]
+
+    @overload
+    def __getitem__(self, index: int) -> ItemT: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[ItemT]: ...
+
+    def __getitem__(self, index: int | slice) -> ItemT | Sequence[ItemT]:
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[ItemT]:
+        return iter(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Referentiel):
+            return self._items == other._items
+        if isinstance(other, list):
+            return list(self._items) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Referentiel({list(self._items)!r})"
+
+    def _index_word(self, word: str, item_index: int) -> None:
+        node = self._trie_root
+        for character in word:
+            node = node.children.setdefault(character, _TrieNode())
+            if not node.item_indexes or node.item_indexes[-1] != item_index:
+                node.item_indexes.append(item_index)
+
+    def _find_item_indexes(self, word_prefix: str) -> list[int]:
+        node = self._trie_root
+        for character in word_prefix:
+            child = node.children.get(character)
+            if child is None:
+                return []
+            node = child
+        return node.item_indexes
+
+    def _has_word_starting_with(self, item_index: int, word_prefix: str) -> bool:
+        return any(word.startswith(word_prefix) for word in self._normalized_labels[item_index].split())
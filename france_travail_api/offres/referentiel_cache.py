@@ -0,0 +1,198 @@
+import json
+import os
+import pathlib
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from france_travail_api._cache_directory import user_cache_directory
+
+
+@dataclass(frozen=True)
+class CachedReferentiel:
+    """
+    Referentiel payload stored by a `ReferentielCache`, with its HTTP validators.
+
+    Parameters
+    ----------
+    body : list[dict[str, Any]]
+        JSON payload of the referentiel, as returned by the API.
+    stored_at : float
+        Time at which the payload was downloaded or last revalidated, in seconds since the epoch.
+    etag : str | None
+        `ETag` header of the response, if any.
+    last_modified : str | None
+        `Last-Modified` header of the response, if any.
+    """
+
+    body: list[dict[str, Any]]
+    stored_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def to_conditional_headers(self) -> dict[str, str]:
+        """
+        Build the headers revalidating the payload with the API.
+
+        Returns
+        -------
+        dict[str, str]
+            `If-None-Match` and `If-Modified-Since` headers, for the validators which are known.
+        """
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ReferentielCache:
+    """
+    On-disk cache of referentiels, shared between processes and restarts.
+
+    Cached referentiels younger than `max_age` are served without any request. Older ones are
+    revalidated with a conditional request when the API sent an `ETag` or `Last-Modified` header,
+    so that they are only downloaded again if they changed, and downloaded again otherwise.
+    When the API responds with an error, the cached copy is served however old it is.
+
+    Parameters
+    ----------
+    directory : str | os.PathLike[str] | None
+        Directory where referentiels are stored, defaults to a `france-travail-api/referentiels`
+        directory in the cache directory of the current user (e.g. `~/.cache`).
+    max_age : float (default: 86400.0)
+        Seconds during which a cached referentiel is served without contacting the API.
+    clock : Callable[[], float]
+        Source of the current time in seconds since the epoch, defaults to `time.time`.
+
+    Examples
+    --------
+    >>> from france_travail_api import FranceTravailClient, ReferentielCache, Scope
+    >>>
+    >>> with FranceTravailClient(
+    ...     client_id="your_id",
+    ...     client_secret="your_secret",
+    ...     scopes=[Scope.OFFRES],
+    ...     referentiel_cache=ReferentielCache("/var/cache/my-app", max_age=3600.0),
+    ... ) as client:
+    ...     appellations = client.offres.referentiels.appellations()  # Read from disk once cached
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] | None = None,
+        max_age: float = 86_400.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._directory = pathlib.Path(directory or user_cache_directory("referentiels"))
+        self._max_age = max_age
+        self._clock = clock
+
+    def load(self, name: str) -> CachedReferentiel | None:
+        """
+        Load a cached referentiel.
+
+        Parameters
+        ----------
+        name : str
+            Name of the referentiel (e.g. "metiers").
+
+        Returns
+        -------
+        CachedReferentiel | None
+            Cached referentiel, or None if there is none or it cannot be read.
+        """
+        try:
+            cached_json = json.loads(self._path(name).read_text())
+            return CachedReferentiel(
+                body=cached_json["body"],
+                stored_at=cached_json["stored_at"],
+                etag=cached_json.get("etag"),
+                last_modified=cached_json.get("last_modified"),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, name: str, body: list[dict[str, Any]], headers: dict[str, str]) -> CachedReferentiel:
+        """
+        Cache a referentiel downloaded from the API, atomically replacing any previous version.
+
+        Parameters
+        ----------
+        name : str
+            Name of the referentiel (e.g. "metiers").
+        body : list[dict[str, Any]]
+            JSON payload of the referentiel.
+        headers : dict[str, str]
+            Headers of the response, providing its validators.
+
+        Returns
+        -------
+        CachedReferentiel
+            Cached referentiel.
+        """
+        lowercase_headers = {header.lower(): value for header, value in headers.items()}
+        cached_referentiel = CachedReferentiel(
+            body=body,
+            stored_at=self._clock(),
+            etag=lowercase_headers.get("etag"),
+            last_modified=lowercase_headers.get("last-modified"),
+        )
+        self._write(name, cached_referentiel)
+        return cached_referentiel
+
+    def touch(self, name: str, cached_referentiel: CachedReferentiel) -> None:
+        """
+        Mark a cached referentiel as revalidated by the API, restarting its `max_age`.
+
+        Parameters
+        ----------
+        name : str
+            Name of the referentiel (e.g. "metiers").
+        cached_referentiel : CachedReferentiel
+            Cached referentiel which the API reported as not modified.
+        """
+        self._write(
+            name,
+            CachedReferentiel(
+                body=cached_referentiel.body,
+                stored_at=self._clock(),
+                etag=cached_referentiel.etag,
+                last_modified=cached_referentiel.last_modified,
+            ),
+        )
+
+    def is_fresh(self, cached_referentiel: CachedReferentiel) -> bool:
+        """
+        Tell whether a cached referentiel can be served without contacting the API.
+
+        Parameters
+        ----------
+        cached_referentiel : CachedReferentiel
+            Cached referentiel.
+
+        Returns
+        -------
+        bool
+            True if the referentiel is younger than `max_age`.
+        """
+        return self._clock() - cached_referentiel.stored_at < self._max_age
+
+    def _write(self, name: str, cached_referentiel: CachedReferentiel) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        cached_json = {
+            "body": cached_referentiel.body,
+            "stored_at": cached_referentiel.stored_at,
+            "etag": cached_referentiel.etag,
+            "last_modified": cached_referentiel.last_modified,
+        }
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        with os.fdopen(file_descriptor, "w") as temporary_file:
+            json.dump(cached_json, temporary_file)
+        os.replace(temporary_path, self._path(name))
+
+    def _path(self, name: str) -> pathlib.Path:
+        return self._directory / f"{name}.json"
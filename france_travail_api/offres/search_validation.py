@@ -0,0 +1,130 @@
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from france_travail_api.exceptions import InvalidSearchParametersException
+from france_travail_api.offres._referentiels_client import ReferentielsClient
+from france_travail_api.offres.referentiel import Referentiel
+
+
+@dataclass(frozen=True)
+class _MultiValuedParam:
+    name: str
+    max_values: int
+    fetch_referentiel: Callable[[ReferentielsClient], Referentiel[Any]]
+    fetch_referentiel_async: Callable[[ReferentielsClient], Awaitable[Referentiel[Any]]]
+
+
+_MULTI_VALUED_PARAMS = (
+    _MultiValuedParam("code_rome", 200, ReferentielsClient.metiers, ReferentielsClient.metiers_async),
+    _MultiValuedParam(
+        "secteur_activite", 2, ReferentielsClient.secteurs_activites, ReferentielsClient.secteurs_activites_async
+    ),
+    _MultiValuedParam("code_naf", 2, ReferentielsClient.nafs, ReferentielsClient.nafs_async),
+    _MultiValuedParam("commune", 5, ReferentielsClient.communes, ReferentielsClient.communes_async),
+    _MultiValuedParam("departement", 5, ReferentielsClient.departements, ReferentielsClient.departements_async),
+)
+
+
+class SearchParamsValidator:
+    """
+    Validates multi-valued search parameters locally, before any search request is sent.
+
+    The comma-separated values of `code_rome`, `secteur_activite`, `code_naf`, `commune` and
+    `departement` are checked against the number of values documented by the API, then against the
+    codes of the matching referentiel. Invalid searches fail right away, instead of costing a
+    request answered with an HTTP 400 Bad Request.
+
+    Parameters
+    ----------
+    referentiels : ReferentielsClient
+        Client used to fetch the referentiels holding the valid codes.
+
+    Notes
+    -----
+    Each referentiel is fetched the first time one of its codes is validated, then kept in memory
+    for the lifetime of the validator. Configure a `ReferentielCache` to avoid downloading them
+    again in every process.
+
+    Examples
+    --------
+    >>> validator = SearchParamsValidator(client.offres.referentiels)
+    >>> validator.validate({"mots_cles": "boulanger", "commune": "75056,99999"})
+    Traceback (most recent call last):
+    ...
+    InvalidSearchParametersException: Invalid search parameters: commune: unknown codes 99999
+    """
+
+    def __init__(self, referentiels: ReferentielsClient) -> None:
+        self._referentiels = referentiels
+        self._referentiels_by_param: dict[str, Referentiel[Any]] = {}
+
+    def validate(self, params: dict[str, Any]) -> None:
+        """
+        Validate search parameters.
+
+        Parameters
+        ----------
+        params : dict[str, Any]
+            Search parameters, in their API form.
+
+        Raises
+        ------
+        InvalidSearchParametersException
+            If a parameter has too many values, or values missing from its referentiel.
+        """
+        values_by_param = self._split_values(params)
+        self._check_cardinalities(values_by_param)
+        for param in values_by_param:
+            if param.name not in self._referentiels_by_param:
+                self._referentiels_by_param[param.name] = param.fetch_referentiel(self._referentiels)
+        self._check_codes(values_by_param)
+
+    async def validate_async(self, params: dict[str, Any]) -> None:
+        """
+        Validate search parameters, fetching missing referentiels asynchronously.
+
+        Parameters
+        ----------
+        params : dict[str, Any]
+            Search parameters, in their API form.
+
+        Raises
+        ------
+        InvalidSearchParametersException
+            If a parameter has too many values, or values missing from its referentiel.
+        """
+        values_by_param = self._split_values(params)
+        self._check_cardinalities(values_by_param)
+        for param in values_by_param:
+            if param.name not in self._referentiels_by_param:
+                self._referentiels_by_param[param.name] = await param.fetch_referentiel_async(self._referentiels)
+        self._check_codes(values_by_param)
+
+    @staticmethod
+    def _split_values(params: dict[str, Any]) -> dict[_MultiValuedParam, list[str]]:
+        return {
+            param: [value.strip() for value in str(params[param.name]).split(",")]
+            for param in _MULTI_VALUED_PARAMS
+            if params.get(param.name) is not None
+        }
+
+    @staticmethod
+    def _check_cardinalities(values_by_param: dict[_MultiValuedParam, list[str]]) -> None:
+        errors = [
+            f"{param.name}: at most {param.max_values} values are allowed, got {len(values)}"
+            for param, values in values_by_param.items()
+            if len(values) > param.max_values
+        ]
+        if errors:
+            raise InvalidSearchParametersException(errors)
+
+    def _check_codes(self, values_by_param: dict[_MultiValuedParam, list[str]]) -> None:
+        errors = []
+        for param, values in values_by_param.items():
+            referentiel = self._referentiels_by_param[param.name]
+            unknown_codes = [value for value in values if not referentiel.has_code(value)]
+            if unknown_codes:
+                errors.append(f"{param.name}: unknown codes {', '.join(unknown_codes)}")
+        if errors:
+            raise InvalidSearchParametersException(errors)
@@ -0,0 +1,423 @@
+import datetime
+import hashlib
+import json
+import math
+import os
+import pathlib
+import tempfile
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Protocol
+
+from france_travail_api._cache_directory import user_cache_directory
+from france_travail_api.auth.clock import Clock, MonotonicClock
+from france_travail_api.offres.models.offre import Offre
+
+if TYPE_CHECKING:
+    from france_travail_api.offres._client import FranceTravailOffresClient
+
+PUBLIEE_DEPUIS_VALUES = (1, 3, 7, 14, 31)
+_RESERVED_SEARCH_PARAMS = frozenset({"publiee_depuis"})
+
+
+class SyncEventType(Enum):
+    """
+    Kind of change of a job offer reported by a synchronization.
+
+    Attributes
+    ----------
+    INSERT : Job offer synchronized for the first time
+    UPDATE : Job offer updated since it was last synchronized
+    DELETE : Job offer no longer published
+    """
+
+    INSERT = "insert"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+@dataclass(frozen=True, slots=True)
+class SyncEvent:
+    """
+    Change of a job offer since the previous synchronization.
+
+    Parameters
+    ----------
+    type : SyncEventType
+        Kind of change: a new job offer, an updated one, or one which is no longer published.
+    offer_id : str
+        ID of the job offer.
+    offre : Offre | None
+        Job offer as currently published, None for deletions.
+    """
+
+    type: SyncEventType
+    offer_id: str
+    offre: Offre | None = None
+
+
+@dataclass(frozen=True)
+class SyncState:
+    """
+    State of the synchronization of a search, persisted between runs by a `SyncStateStore`.
+
+    Parameters
+    ----------
+    high_water_mark : datetime.datetime | None
+        Most recent update (or creation) date of the job offers synchronized so far.
+    reconciled_at : datetime.datetime | None
+        Time of the last run which fetched every job offer of the search, detecting deletions.
+    offer_versions : dict[str, str]
+        Update (or creation) date of each job offer synchronized so far, keyed by job offer ID.
+    """
+
+    high_water_mark: datetime.datetime | None = None
+    reconciled_at: datetime.datetime | None = None
+    offer_versions: dict[str, str] = field(default_factory=dict)
+
+
+class SyncStateStore(Protocol):
+    """
+    Storage of the synchronization states of searches.
+
+    Implement this protocol to store states elsewhere than in files (database, object storage...).
+    """
+
+    def load(self, key: str) -> SyncState | None:
+        """Load a synchronization state, or return None if there is none."""
+        ...
+
+    def save(self, key: str, state: SyncState) -> None:
+        """Save a synchronization state, replacing any previous one."""
+        ...
+
+
+class FileSyncStateStore:
+    """
+    Synchronization state store persisting states as JSON files.
+
+    Parameters
+    ----------
+    directory : str | os.PathLike[str] | None
+        Directory where states are stored, defaults to a `france-travail-api/sync` directory in the
+        cache directory of the current user (e.g. `~/.cache`).
+
+    Examples
+    --------
+    >>> store = FileSyncStateStore("/var/lib/my-app/sync")
+    >>> store.save("boulanger", SyncState())
+    >>> store.load("boulanger")
+    SyncState(high_water_mark=None, reconciled_at=None, offer_versions={})
+    """
+
+    def __init__(self, directory: str | os.PathLike[str] | None = None) -> None:
+        self._directory = pathlib.Path(directory or user_cache_directory("sync"))
+
+    def load(self, key: str) -> SyncState | None:
+        """
+        Load a synchronization state.
+
+        Parameters
+        ----------
+        key : str
+            Key of the synchronized search.
+
+        Returns
+        -------
+        SyncState | None
+            Synchronization state, or None if there is none or it cannot be read.
+        """
+        try:
+            state_json = json.loads(self._path(key).read_text())
+            return SyncState(
+                high_water_mark=_parse_optional_datetime(state_json["high_water_mark"]),
+                reconciled_at=_parse_optional_datetime(state_json["reconciled_at"]),
+                offer_versions=state_json["offer_versions"],
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, key: str, state: SyncState) -> None:
+        """
+        Save a synchronization state, atomically replacing any previous one.
+
+        Parameters
+        ----------
+        key : str
+            Key of the synchronized search.
+        state : SyncState
+            Synchronization state.
+        """
+        self._directory.mkdir(parents=True, exist_ok=True)
+        state_json = {
+            "high_water_mark": _format_optional_datetime(state.high_water_mark),
+            "reconciled_at": _format_optional_datetime(state.reconciled_at),
+            "offer_versions": state.offer_versions,
+        }
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        with os.fdopen(file_descriptor, "w") as temporary_file:
+            json.dump(state_json, temporary_file)
+        os.replace(temporary_path, self._path(key))
+
+    def _path(self, key: str) -> pathlib.Path:
+        return self._directory / f"{key}.json"
+
+
+class OffreSynchronizer:
+    """
+    Incremental synchronization of the job offers of a search with a local copy.
+
+    Each run reports the job offers inserted, updated and deleted since the previous run, so that
+    a mirror of the catalogue only transfers the changes instead of downloading every job offer again:
+
+    - Incremental runs harvest the job offers published within the last days covering the time
+      elapsed since the high-water mark of the previous runs (`publiee_depuis`). Job offers are
+      told apart by ID and by their update date: unknown IDs are inserted, known IDs with another
+      update date are updated.
+    - Reconciliation runs harvest every job offer of the search, and report the ones synchronized
+      before but no longer published as deleted. They happen on the first run, every
+      `reconciliation_interval`, and when the high-water mark is older than the largest
+      `publiee_depuis` window (31 days).
+
+    Parameters
+    ----------
+    offres_client : FranceTravailOffresClient
+        Client searching job offers.
+    state_store : SyncStateStore
+        Storage of the state of each synchronized search between runs.
+    reconciliation_interval : datetime.timedelta (default: 1 day)
+        Maximum time between two reconciliation runs.
+    clock : Clock | None
+        Source of the current time, defaults to a `MonotonicClock`.
+
+    Raises
+    ------
+    ValueError
+        If the reconciliation interval is not positive.
+
+    Notes
+    -----
+    The state of a search is saved once all the events of a run have been consumed: a run which is
+    interrupted is replayed by the next one, so events must be applied idempotently.
+
+    Deletions are only detected by reconciliation runs, like updates which the API does not report
+    as published again. When a harvest misses job offers of the search (see
+    `IncompleteHarvestWarning`), the run reports no deletions and does not save the state, so the
+    next run starts over from the same state.
+
+    Examples
+    --------
+    >>> synchronizer = OffreSynchronizer(client.offres, FileSyncStateStore("/var/lib/my-app/sync"))
+    >>> for event in synchronizer.sync(mots_cles="boulanger", departement="75"):
+    ...     if event.type is SyncEventType.DELETE:
+    ...         database.delete(event.offer_id)
+    ...     else:
+    ...         database.upsert(event.offre)
+    """
+
+    def __init__(
+        self,
+        offres_client: "FranceTravailOffresClient",
+        state_store: SyncStateStore,
+        reconciliation_interval: datetime.timedelta = datetime.timedelta(days=1),
+        clock: Clock | None = None,
+    ) -> None:
+        if reconciliation_interval <= datetime.timedelta(0):
+            raise ValueError(f"Reconciliation interval must be positive, got {reconciliation_interval}")
+        self._offres_client = offres_client
+        self._state_store = state_store
+        self._reconciliation_interval = reconciliation_interval
+        self._clock = clock or MonotonicClock()
+
+    def sync(self, mots_cles: str, **search_params: Any) -> Iterator[SyncEvent]:
+        """
+        Synchronize the job offers of a search.
+
+        Parameters
+        ----------
+        mots_cles : str
+            Keywords to search for
+        **search_params : Any
+            Any other parameter accepted by `FranceTravailOffresClient.harvest`, except
+            `publiee_depuis`
+
+        Yields
+        ------
+        SyncEvent
+            Job offers inserted, updated and deleted since the previous run.
+
+        Raises
+        ------
+        TypeError
+            If a search parameter is unknown or set by the synchronization.
+        InvalidSearchParametersException
+            If search parameters validation is enabled and a parameter is invalid.
+        FranceTravailException
+            If the API responds with an error. The state of the search is then left unchanged.
+
+        Warns
+        -----
+        IncompleteHarvestWarning
+            If a harvest misses job offers of the search. The run then reports no deletions and
+            leaves the state of the search unchanged.
+        """
+        key = sync_key(mots_cles, **search_params)
+        run = _SyncRun(self._state_store.load(key) or SyncState(), self._clock.now(), self._reconciliation_interval)
+        for window in run.windows(search_params):
+            for offre in self._offres_client._harvest(mots_cles, window, run.incomplete_searches):
+                event = run.record(offre)
+                if event is not None:
+                    yield event
+        if run.incomplete_searches:
+            return
+        yield from run.deletions()
+        self._state_store.save(key, run.state())
+
+    async def sync_async(self, mots_cles: str, **search_params: Any) -> AsyncIterator[SyncEvent]:
+        """
+        Synchronize the job offers of a search asynchronously.
+
+        Parameters
+        ----------
+        mots_cles : str
+            Keywords to search for
+        **search_params : Any
+            Any other parameter accepted by `FranceTravailOffresClient.harvest_async`, except
+            `publiee_depuis`
+
+        Yields
+        ------
+        SyncEvent
+            Job offers inserted, updated and deleted since the previous run.
+
+        Raises
+        ------
+        TypeError
+            If a search parameter is unknown or set by the synchronization.
+        InvalidSearchParametersException
+            If search parameters validation is enabled and a parameter is invalid.
+        FranceTravailException
+            If the API responds with an error. The state of the search is then left unchanged.
+
+        Warns
+        -----
+        IncompleteHarvestWarning
+            If a harvest misses job offers of the search. The run then reports no deletions and
+            leaves the state of the search unchanged.
+        """
+        key = sync_key(mots_cles, **search_params)
+        run = _SyncRun(self._state_store.load(key) or SyncState(), self._clock.now(), self._reconciliation_interval)
+        for window in run.windows(search_params):
+            async for offre in self._offres_client._harvest_async(mots_cles, window, run.incomplete_searches):
+                event = run.record(offre)
+                if event is not None:
+                    yield event
+        if run.incomplete_searches:
+            return
+        for event in run.deletions():
+            yield event
+        self._state_store.save(key, run.state())
+
+
+def sync_key(mots_cles: str, **search_params: Any) -> str:
+    """
+    Key of the state of a synchronized search in a `SyncStateStore`.
+
+    Parameters
+    ----------
+    mots_cles : str
+        Keywords to search for
+    **search_params : Any
+        Any other search parameter
+
+    Returns
+    -------
+    str
+        Hash of the search parameters, the same whatever their order.
+    """
+    params = {"mots_cles": mots_cles, **search_params}
+    canonical_params = json.dumps({name: str(value) for name, value in params.items()}, sort_keys=True)
+    return hashlib.sha256(canonical_params.encode()).hexdigest()[:32]
+
+
+class _SyncRun:
+    """Changes found by a synchronization run, compared to the state left by the previous run."""
+
+    def __init__(self, state: SyncState, now: datetime.datetime, reconciliation_interval: datetime.timedelta) -> None:
+        self._state = state
+        self._now = now
+        self._is_reconciliation = _is_reconciliation_due(state, now, reconciliation_interval)
+        self._high_water_mark = state.high_water_mark
+        self._versions = dict(state.offer_versions)
+        self._seen_offer_ids: set[str] = set()
+        self.incomplete_searches: list[dict[str, Any]] = []
+
+    def windows(self, search_params: dict[str, Any]) -> list[dict[str, Any]]:
+        """Search parameters of the harvests of the run."""
+        reserved_params = search_params.keys() & _RESERVED_SEARCH_PARAMS
+        if reserved_params:
+            raise TypeError(f"Search parameters set by the synchronization: {', '.join(sorted(reserved_params))}")
+        if self._is_reconciliation or self._high_water_mark is None:
+            return [search_params]
+        return [{**search_params, "publiee_depuis": _publiee_depuis_covering(self._now - self._high_water_mark)}]
+
+    def record(self, offre: Offre) -> SyncEvent | None:
+        """Record a harvested job offer, returning its change if it is new or updated."""
+        if offre.id is None:
+            return None
+        self._seen_offer_ids.add(offre.id)
+        offre_date = offre.date_actualisation or offre.date_creation
+        if offre_date is not None:
+            offre_date = offre_date if offre_date.tzinfo is not None else offre_date.replace(tzinfo=datetime.UTC)
+            if self._high_water_mark is None or offre_date > self._high_water_mark:
+                self._high_water_mark = offre_date
+        version = offre_date.isoformat() if offre_date is not None else ""
+        previous_version = self._versions.get(offre.id)
+        if version == previous_version:
+            return None
+        self._versions[offre.id] = version
+        return SyncEvent(SyncEventType.INSERT if previous_version is None else SyncEventType.UPDATE, offre.id, offre)
+
+    def deletions(self) -> list[SyncEvent]:
+        """Changes of the job offers synchronized before but missing from a reconciliation run."""
+        if not self._is_reconciliation:
+            return []
+        deleted_offer_ids = [offer_id for offer_id in self._versions if offer_id not in self._seen_offer_ids]
+        for offer_id in deleted_offer_ids:
+            del self._versions[offer_id]
+        return [SyncEvent(SyncEventType.DELETE, offer_id) for offer_id in deleted_offer_ids]
+
+    def state(self) -> SyncState:
+        """State left by the run, for the next one."""
+        return SyncState(
+            # Without any job offer yet, the next run looks for the ones created since this one.
+            high_water_mark=self._high_water_mark or self._now,
+            reconciled_at=self._now if self._is_reconciliation else self._state.reconciled_at,
+            offer_versions=self._versions,
+        )
+
+
+def _is_reconciliation_due(
+    state: SyncState, now: datetime.datetime, reconciliation_interval: datetime.timedelta
+) -> bool:
+    return (
+        state.high_water_mark is None
+        or state.reconciled_at is None
+        or now - state.reconciled_at >= reconciliation_interval
+        or now - state.high_water_mark > datetime.timedelta(days=PUBLIEE_DEPUIS_VALUES[-1])
+    )
+
+
+def _publiee_depuis_covering(elapsed: datetime.timedelta) -> int:
+    """Smallest `publiee_depuis` value, in days, covering the time elapsed since the high-water mark."""
+    elapsed_days = max(1, math.ceil(elapsed / datetime.timedelta(days=1)))
+    return next(days for days in PUBLIEE_DEPUIS_VALUES if days >= elapsed_days)
+
+
+def _parse_optional_datetime(value: str | None) -> datetime.datetime | None:
+    return datetime.datetime.fromisoformat(value) if value is not None else None
+
+
+def _format_optional_datetime(value: datetime.datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
@@ -1,21 +1,31 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
 import http
 import os
+import time
 import uuid
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
 from france_travail_api.auth._credentials import FranceTravailCredentials
 from france_travail_api.auth._token import Token
 from france_travail_api.auth.scope import Scope
+from france_travail_api.auth.token_refresh import TokenRefreshSchedule
+from france_travail_api.auth.token_store import TokenStore
 from france_travail_api.client import FranceTravailClient
+from france_travail_api.exceptions import OffreNotFoundException
 from france_travail_api.http_transport._http_client import HttpClient
 from france_travail_api.http_transport._http_response import HTTPResponse
 from france_travail_api.offres._client import FranceTravailOffresClient
+from france_travail_api.offres.cache import OffreCache
 from france_travail_api.offres.models.metier import Metier
 from france_travail_api.offres.models.offre import Offre
+from france_travail_api.offres.referentiel_cache import ReferentielCache
+from france_travail_api.offres.sync import OffreSynchronizer, SyncEvent, SyncStateStore
+from tests.test_doubles.fake_clock import FakeClock
 from tests.test_doubles.fake_http_client import FakeHttpClient
 
 
@@ -25,15 +35,27 @@ class Scenario:
         default_factory=lambda: datetime.datetime(2025, 12, 25, 10, 0, 0, tzinfo=datetime.UTC)
     )
     _http_client: HttpClient | FakeHttpClient | None = None
+    _clock: FakeClock | None = None
+    _token_store: TokenStore | None = None
+    _offre_cache: OffreCache | None = None
+    _referentiel_cache: ReferentielCache | None = None
+    _validate_search_params: bool = False
+    _lazy_decoding: bool = False
+    _typed_decoding: bool = False
     _credentials: FranceTravailCredentials | None = None
     _offres_client: FranceTravailOffresClient | None = None
     _client: FranceTravailClient | None = None
     _captured_exception: Exception | None = None
     _token: Token | None = None
+    _tokens: list[Token] | None = None
     _authorization_header: dict[str, str] | None = None
     _offers: list[Offre] | None = None
     _offre: Offre | None = None
-    _metiers: list[Metier] | None = None
+    _raw_offres: list[dict[str, Any]] | None = None
+    _offre_results: dict[str, Offre | OffreNotFoundException] | None = None
+    _metiers: Sequence[Metier] | None = None
+    _offre_synchronizer: OffreSynchronizer | None = None
+    _sync_events: list[SyncEvent] | None = None
 
     def unit(self) -> "Scenario":
         self._http_client = FakeHttpClient()
@@ -58,7 +80,22 @@ class Scenario:
     def with_credentials(self, client_id: str, client_secret: str, scopes: list[Scope]) -> "Scenario":
         if self._http_client is None:
             self._http_client = HttpClient()
-        self._credentials = FranceTravailCredentials(client_id, client_secret, scopes, self._http_client)  # type: ignore[arg-type]
+        self._credentials = FranceTravailCredentials(
+            client_id,
+            client_secret,
+            scopes,
+            self._http_client,  # type: ignore[arg-type]
+            self._clock,
+            self._token_store,
+        )
+        return self
+
+    def with_token_store(self, token_store: TokenStore) -> "Scenario":
+        self._token_store = token_store
+        return self
+
+    def with_clock(self) -> "Scenario":
+        self._clock = FakeClock(self.now)
         return self
 
     def with_live_credentials(self, scopes: list[Scope]) -> "Scenario":
@@ -104,12 +141,54 @@ class Scenario:
         self._http_client.add_response(response)
         return self
 
+    def with_offre_cache(self, offre_cache: OffreCache) -> "Scenario":
+        self._offre_cache = offre_cache
+        return self
+
+    def with_referentiel_cache(self, referentiel_cache: ReferentielCache) -> "Scenario":
+        self._referentiel_cache = referentiel_cache
+        return self
+
+    def with_search_params_validation(self) -> "Scenario":
+        self._validate_search_params = True
+        return self
+
+    def with_lazy_decoding(self) -> "Scenario":
+        self._lazy_decoding = True
+        return self
+
+    def with_typed_decoding(self) -> "Scenario":
+        self._typed_decoding = True
+        return self
+
     def with_offres_client(self) -> "Scenario":
         if self._credentials is None:
             raise ValueError("Credentials must be configured before offres client")
         if self._http_client is None:
             raise ValueError("HTTP client must be configured before offres client")
-        self._offres_client = FranceTravailOffresClient(self._credentials, self._http_client)  # type: ignore[arg-type]
+        self._offres_client = FranceTravailOffresClient(
+            self._credentials,
+            self._http_client,  # type: ignore[arg-type]
+            self._offre_cache,
+            self._referentiel_cache,
+            self._validate_search_params,
+            self._lazy_decoding,
+            self._typed_decoding,
+        )
+        return self
+
+    def with_offre_synchronizer(
+        self, state_store: SyncStateStore, reconciliation_interval: datetime.timedelta = datetime.timedelta(days=1)
+    ) -> "Scenario":
+        self._require_offres_client()
+        if self._clock is None:
+            self.with_clock()
+        self._offre_synchronizer = OffreSynchronizer(
+            self._offres_client,  # type: ignore[arg-type]
+            state_store,
+            reconciliation_interval,
+            self._clock,
+        )
         return self
 
     def when_get_token(self) -> "Scenario":
@@ -121,6 +200,70 @@ class Scenario:
             self._captured_exception = exc
         return self
 
+    def when_get_token_from_clock(self) -> "Scenario":
+        if self._credentials is None:
+            raise ValueError("Credentials must be configured before requesting token")
+        self._token = self._credentials.get_token()
+        return self
+
+    def when_time_passes(self, seconds: float) -> "Scenario":
+        if self._clock is None:
+            raise ValueError("Clock must be configured before time passes")
+        self._clock.advance(seconds)
+        return self
+
+    def when_renewing_token(self, rejected_token: Token) -> "Scenario":
+        if self._credentials is None:
+            raise ValueError("Credentials must be configured before renewing token")
+        self._token = self._credentials.renew_token(rejected_token)
+        return self
+
+    async def when_get_token_async(self) -> "Scenario":
+        if self._credentials is None:
+            raise ValueError("Credentials must be configured before requesting token")
+        self._token = await self._credentials.get_token_async(self.now)
+        return self
+
+    async def when_get_tokens_concurrently_async(self, count: int) -> "Scenario":
+        if self._credentials is None:
+            raise ValueError("Credentials must be configured before requesting token")
+        self._tokens = await asyncio.gather(*(self._credentials.get_token_async(self.now) for _ in range(count)))
+        return self
+
+    def when_background_refresh_runs(self, schedule: TokenRefreshSchedule, until_token_requests: int) -> "Scenario":
+        if self._credentials is None:
+            raise ValueError("Credentials must be configured before refreshing token")
+        self._credentials.start_background_refresh(schedule)
+        try:
+            self._wait_for_token_requests(until_token_requests)
+        finally:
+            self._credentials.stop_background_refresh()
+        return self
+
+    def when_background_refresh_starts(self, schedule: TokenRefreshSchedule) -> "Scenario":
+        if self._credentials is None:
+            raise ValueError("Credentials must be configured before refreshing token")
+        self._credentials.start_background_refresh(schedule)
+        return self
+
+    def when_background_refresh_stops(self) -> "Scenario":
+        if self._credentials is None:
+            raise ValueError("Credentials must be configured before refreshing token")
+        self._credentials.stop_background_refresh()
+        return self
+
+    async def when_background_refresh_runs_async(
+        self, schedule: TokenRefreshSchedule, until_token_requests: int
+    ) -> "Scenario":
+        if self._credentials is None:
+            raise ValueError("Credentials must be configured before refreshing token")
+        await self._credentials.start_background_refresh_async(schedule)
+        try:
+            await self._wait_for_token_requests_async(until_token_requests)
+        finally:
+            await self._credentials.stop_background_refresh_async()
+        return self
+
     def when_authorization_header(self) -> "Scenario":
         if self._credentials is None:
             raise ValueError("Credentials must be configured before requesting header")
@@ -139,6 +282,91 @@ class Scenario:
         self._offers = await self._offres_client.search_async(**kwargs)
         return self
 
+    def when_searching_raw_offres(self, **kwargs: Any) -> "Scenario":
+        self._require_offres_client()
+        self._raw_offres = self._offres_client.search_raw(**kwargs)  # type: ignore[union-attr]
+        return self
+
+    async def when_searching_raw_offres_async(self, **kwargs: Any) -> "Scenario":
+        self._require_offres_client()
+        self._raw_offres = await self._offres_client.search_raw_async(**kwargs)  # type: ignore[union-attr]
+        return self
+
+    def when_getting_raw_offre(self, offer_id: str) -> "Scenario":
+        self._require_offres_client()
+        self._raw_offres = [self._offres_client.get_raw(offer_id)]  # type: ignore[union-attr]
+        return self
+
+    async def when_getting_raw_offre_async(self, offer_id: str) -> "Scenario":
+        self._require_offres_client()
+        self._raw_offres = [await self._offres_client.get_raw_async(offer_id)]  # type: ignore[union-attr]
+        return self
+
+    def when_modifying_raw_offres(self, **values: Any) -> "Scenario":
+        if self._raw_offres is None:
+            raise AssertionError("Expected raw offers to be present")
+        for raw_offre in self._raw_offres:
+            raw_offre.update(values)
+        return self
+
+    def when_iterating_offres(self, **kwargs: Any) -> "Scenario":
+        if self._offres_client is None:
+            raise ValueError("Offres client must be configured before search")
+        self._offers = list(self._offres_client.search_iter(**kwargs))
+        return self
+
+    async def when_iterating_offres_async(self, **kwargs: Any) -> "Scenario":
+        if self._offres_client is None:
+            raise ValueError("Offres client must be configured before search")
+        self._offers = [offre async for offre in self._offres_client.search_iter_async(**kwargs)]
+        return self
+
+    def when_streaming_offres(self, **kwargs: Any) -> "Scenario":
+        self._require_offres_client()
+        try:
+            self._offers = list(self._offres_client.search_stream(**kwargs))  # type: ignore[union-attr]
+        except Exception as exc:
+            self._captured_exception = exc
+        return self
+
+    async def when_streaming_offres_async(self, **kwargs: Any) -> "Scenario":
+        self._require_offres_client()
+        try:
+            self._offers = [offre async for offre in self._offres_client.search_stream_async(**kwargs)]  # type: ignore[union-attr]
+        except Exception as exc:
+            self._captured_exception = exc
+        return self
+
+    def when_synchronizing_offres(self, **kwargs: Any) -> "Scenario":
+        if self._offre_synchronizer is None:
+            raise ValueError("Offre synchronizer must be configured before synchronizing")
+        self._sync_events = list(self._offre_synchronizer.sync(**kwargs))
+        return self
+
+    async def when_synchronizing_offres_async(self, **kwargs: Any) -> "Scenario":
+        if self._offre_synchronizer is None:
+            raise ValueError("Offre synchronizer must be configured before synchronizing")
+        self._sync_events = [event async for event in self._offre_synchronizer.sync_async(**kwargs)]
+        return self
+
+    async def when_searching_all_offres_async(self, **kwargs: Any) -> "Scenario":
+        if self._offres_client is None:
+            raise ValueError("Offres client must be configured before search")
+        self._offers = await self._offres_client.search_all_async(**kwargs)
+        return self
+
+    def when_harvesting_offres(self, **kwargs: Any) -> "Scenario":
+        if self._offres_client is None:
+            raise ValueError("Offres client must be configured before search")
+        self._offers = list(self._offres_client.harvest(**kwargs))
+        return self
+
+    async def when_harvesting_offres_async(self, **kwargs: Any) -> "Scenario":
+        if self._offres_client is None:
+            raise ValueError("Offres client must be configured before search")
+        self._offers = [offre async for offre in self._offres_client.harvest_async(**kwargs)]
+        return self
+
     def when_searching_offres_e2e(self, **kwargs: Any) -> "Scenario":
         if self._client is None:
             raise ValueError("Client must be configured before search")
@@ -155,6 +383,19 @@ class Scenario:
         await self._capture_offre_result_async(lambda: self._offres_client.get_async(offer_id))  # type: ignore[union-attr]
         return self
 
+    def when_getting_many_offres(self, offer_ids: list[str], max_concurrency: int = 4) -> "Scenario":
+        self._require_offres_client()
+        self._offre_results = dict(self._offres_client.get_many(offer_ids, max_concurrency))  # type: ignore[union-attr]
+        return self
+
+    async def when_getting_many_offres_async(self, offer_ids: list[str], max_concurrency: int = 4) -> "Scenario":
+        self._require_offres_client()
+        self._offre_results = {
+            offer_id: result
+            async for offer_id, result in self._offres_client.get_many_async(offer_ids, max_concurrency)  # type: ignore[union-attr]
+        }
+        return self
+
     def when_getting_offre_e2e(self, offer_id: str) -> "Scenario":
         self._require_e2e_client()
         self._capture_offre_result(lambda: self._client.offres.get(offer_id))  # type: ignore[union-attr]
@@ -165,6 +406,21 @@ class Scenario:
         self._metiers = self._client.offres.referentiels.metiers()  # type: ignore[union-attr]
         return self
 
+    def _wait_for_token_requests(self, count: int, timeout: float = 5.0) -> None:
+        deadline = time.monotonic() + timeout
+        while self._count_token_requests() < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    async def _wait_for_token_requests_async(self, count: int, timeout: float = 5.0) -> None:
+        deadline = time.monotonic() + timeout
+        while self._count_token_requests() < count and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+
+    def _count_token_requests(self) -> int:
+        if not isinstance(self._http_client, FakeHttpClient):
+            raise AssertionError("Expected fake HTTP client for request assertions")
+        return len(self._http_client.post_urls)
+
     def _require_offres_client(self) -> None:
         if self._offres_client is None:
             raise ValueError("Offres client must be configured before get")
@@ -189,6 +445,23 @@ class Scenario:
         assert self._token == expected
         return self
 
+    def then_all_tokens_are(self, expected: Token) -> "Scenario":
+        if self._tokens is None:
+            raise AssertionError("Expected tokens to be present")
+        assert all(token == expected for token in self._tokens)
+        return self
+
+    def then_token_requests_count_is(self, expected: int) -> "Scenario":
+        assert self._count_token_requests() == expected
+        return self
+
+    def then_current_access_token_is(self, expected: str) -> "Scenario":
+        if self._credentials is None:
+            raise AssertionError("Expected credentials to be present")
+        assert self._credentials._token is not None
+        assert self._credentials._token.access_token == expected
+        return self
+
     def then_token_has_access_token(self) -> "Scenario":
         if self._token is None:
             raise AssertionError("Expected token to be present")
@@ -233,6 +506,34 @@ class Scenario:
         assert expected in self._http_client.last_get_url
         return self
 
+    def then_last_get_headers_are(self, expected: dict[str, str]) -> "Scenario":
+        if not isinstance(self._http_client, FakeHttpClient):
+            raise AssertionError("Expected fake HTTP client for header assertions")
+        assert {
+            header: value for header, value in self._http_client.get_headers[-1].items() if header != "Authorization"
+        } == expected
+        return self
+
+    def then_requested_get_urls_contain(self, expected: list[str]) -> "Scenario":
+        if not isinstance(self._http_client, FakeHttpClient):
+            raise AssertionError("Expected fake HTTP client for URL assertions")
+        assert len(self._http_client.get_urls) == len(expected)
+        for url, expected_fragment in zip(self._http_client.get_urls, expected):
+            assert expected_fragment in url
+        return self
+
+    def then_max_concurrent_requests_is(self, expected: int) -> "Scenario":
+        if not isinstance(self._http_client, FakeHttpClient):
+            raise AssertionError("Expected fake HTTP client for concurrency assertions")
+        assert self._http_client.max_concurrent_async_gets == expected
+        return self
+
+    def then_sync_events_are(self, expected: list[tuple[str, str]]) -> "Scenario":
+        if self._sync_events is None:
+            raise AssertionError("Expected sync events to be present")
+        assert [(event.type.value, event.offer_id) for event in self._sync_events] == expected
+        return self
+
     def then_all_offers_are(self, expected_type: type) -> "Scenario":
         if self._offers is None:
             raise AssertionError("Expected offers to be present")
@@ -245,12 +546,36 @@ class Scenario:
         assert self._offers == expected
         return self
 
+    def then_raw_offres_are(self, expected: list[dict[str, Any]]) -> "Scenario":
+        if self._raw_offres is None:
+            raise AssertionError("Expected raw offers to be present")
+        assert self._raw_offres == expected
+        return self
+
     def then_offre_should_be(self, expected: Offre) -> "Scenario":
         if self._offre is None:
             raise AssertionError("Expected offre to be present")
         assert self._offre == expected
         return self
 
+    def then_offre_results_are(self, expected: dict[str, Offre | type[OffreNotFoundException]]) -> "Scenario":
+        if self._offre_results is None:
+            raise AssertionError("Expected offre results to be present")
+        assert self._offre_results.keys() == expected.keys()
+        for offer_id, result in self._offre_results.items():
+            expected_result = expected[offer_id]
+            if isinstance(expected_result, type):
+                assert isinstance(result, expected_result)
+            else:
+                assert result == expected_result
+        return self
+
+    def then_offre_cache_counts_are(self, hits: int, misses: int) -> "Scenario":
+        if self._offre_cache is None:
+            raise AssertionError("Expected offre cache to be configured")
+        assert (self._offre_cache.hits, self._offre_cache.misses) == (hits, misses)
+        return self
+
     def then_offre_should_be_instance_of(self, expected_type: type) -> "Scenario":
         if self._offre is None:
             raise AssertionError("Expected offre to be present")
@@ -0,0 +1,12 @@
+import datetime
+
+
+class FakeClock:
+    def __init__(self, now: datetime.datetime) -> None:
+        self.current_time = now
+
+    def now(self) -> datetime.datetime:
+        return self.current_time
+
+    def advance(self, seconds: float) -> None:
+        self.current_time += datetime.timedelta(seconds=seconds)
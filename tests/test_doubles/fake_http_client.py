@@ -1,29 +1,104 @@
-from france_travail_api.http_transport._http_response import HTTPResponse
+import asyncio
+import contextlib
+import dataclasses
+import json
+from collections.abc import AsyncIterator, Iterator
+
+import httpx
+
+from france_travail_api.http_transport._http_response import HTTPResponse, HTTPStreamResponse
+from france_travail_api.http_transport.json_decoding import JsonDecoder
 
 
 class FakeHttpClient:
     def __init__(self) -> None:
         self.responses: list[HTTPResponse] = []
         self.last_get_url: str | None = None
+        self.get_urls: list[str] = []
+        self.get_headers: list[dict[str, str]] = []
+        self.max_concurrent_async_gets = 0
+        self._concurrent_async_gets = 0
         self.last_post_url: str | None = None
+        self.post_urls: list[str] = []
+        self.stream_chunk_size = 7
 
     def add_response(self, response: HTTPResponse) -> None:
         self.responses.append(response)
 
-    def get(self, url: str, headers: dict[str, str] | None = None) -> HTTPResponse:
+    def get(
+        self, url: str, headers: dict[str, str] | None = None, json_decoder: JsonDecoder | None = None
+    ) -> HTTPResponse:
         self.last_get_url = url
-        return self.responses.pop(0)
+        self.get_urls.append(url)
+        self.get_headers.append(headers or {})
+        return self._decode_response(self.responses.pop(0), json_decoder)
 
-    async def get_async(self, url: str, headers: dict[str, str] | None = None) -> HTTPResponse:
+    async def get_async(
+        self, url: str, headers: dict[str, str] | None = None, json_decoder: JsonDecoder | None = None
+    ) -> HTTPResponse:
         self.last_get_url = url
-        return self.responses.pop(0)
+        self.get_urls.append(url)
+        self.get_headers.append(headers or {})
+        response = self._decode_response(self.responses.pop(0), json_decoder)
+        self._concurrent_async_gets += 1
+        self.max_concurrent_async_gets = max(self.max_concurrent_async_gets, self._concurrent_async_gets)
+        await asyncio.sleep(0)
+        self._concurrent_async_gets -= 1
+        return response
+
+    @contextlib.contextmanager
+    def stream(self, url: str, headers: dict[str, str] | None = None) -> Iterator[HTTPStreamResponse]:
+        self.last_get_url = url
+        self.get_urls.append(url)
+        self.get_headers.append(headers or {})
+        response = self.responses.pop(0)
+        yield self._stream_response(url, response, iter(self._chunks(response)))
+
+    @contextlib.asynccontextmanager
+    async def stream_async(self, url: str, headers: dict[str, str] | None = None) -> AsyncIterator[HTTPStreamResponse]:
+        self.last_get_url = url
+        self.get_urls.append(url)
+        self.get_headers.append(headers or {})
+        response = self.responses.pop(0)
+        chunks = self._chunks(response)
+
+        async def receive_chunks() -> AsyncIterator[bytes]:
+            for chunk in chunks:
+                await asyncio.sleep(0)
+                yield chunk
+
+        yield self._stream_response(url, response, receive_chunks())
 
     def post(self, url: str, payload: dict[str, str], headers: dict[str, str] | None = None) -> HTTPResponse:
         self.last_post_url = url
+        self.post_urls.append(url)
         return self.responses.pop(0)
 
     async def post_async(
         self, url: str, payload: dict[str, str], headers: dict[str, str] | None = None
     ) -> HTTPResponse:
+        await asyncio.sleep(0)
         self.last_post_url = url
+        self.post_urls.append(url)
         return self.responses.pop(0)
+
+    @staticmethod
+    def _decode_response(response: HTTPResponse, json_decoder: JsonDecoder | None) -> HTTPResponse:
+        if json_decoder is None or not response.body or not response.status_code.is_success:
+            return response
+        return dataclasses.replace(response, body=json_decoder.decode(json.dumps(response.body).encode()))
+
+    def _chunks(self, response: HTTPResponse) -> list[bytes]:
+        content = json.dumps(response.body).encode() if response.body else b""
+        return [
+            content[start : start + self.stream_chunk_size] for start in range(0, len(content), self.stream_chunk_size)
+        ]
+
+    @staticmethod
+    def _stream_response(
+        url: str, response: HTTPResponse, chunks: Iterator[bytes] | AsyncIterator[bytes]
+    ) -> HTTPStreamResponse:
+        request = httpx.Request("GET", url, headers={"X-Request-Id": str(response.request_id)})
+        return HTTPStreamResponse(
+            httpx.Response(response.status_code, headers=response.headers, content=chunks, request=request)
+        )
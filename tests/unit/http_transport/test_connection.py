@@ -0,0 +1,34 @@
+import httpx
+import pytest
+
+from france_travail_api.http_transport._http_client import HttpClient
+from france_travail_api.http_transport.connection import ConnectionOptions
+
+
+def test_should_build_connection_pool_limits() -> None:
+    options = ConnectionOptions(max_connections=200, max_keepalive_connections=50, keepalive_expiry=30.0)
+
+    assert options.to_httpx_limits() == httpx.Limits(
+        max_connections=200, max_keepalive_connections=50, keepalive_expiry=30.0
+    )
+
+
+def test_should_build_per_phase_timeouts() -> None:
+    options = ConnectionOptions(connect_timeout=2.0, pool_timeout=60.0)
+
+    assert options.to_httpx_timeout(default_timeout=30.0) == httpx.Timeout(30.0, connect=2.0, read=30.0, pool=60.0)
+
+
+def test_should_require_h2_package_for_http2(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+
+    with pytest.raises(ImportError, match=r"pip install france-travail-api\[http2\]"):
+        ConnectionOptions(http2=True)
+
+
+def test_should_configure_http_clients_with_connection_options() -> None:
+    client = HttpClient(timeout=10.0, connection_options=ConnectionOptions(read_timeout=60.0))
+
+    assert client.sync_client.timeout == httpx.Timeout(10.0, read=60.0)
+    assert client.async_client.timeout == httpx.Timeout(10.0, read=60.0)
+    client.close()
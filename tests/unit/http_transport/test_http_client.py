@@ -0,0 +1,239 @@
+import asyncio
+import http
+
+import httpx
+import pytest
+
+from france_travail_api.http_transport._http_client import HttpClient
+from france_travail_api.http_transport.retry import RetryPolicy
+
+URL = "https://api.francetravail.io/partenaire/offresdemploi/v2/offres/123ABC"
+
+
+class FlakyServer:
+    def __init__(self, *outcomes: int | Exception) -> None:
+        self._outcomes = list(outcomes)
+        self.requests_count = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests_count += 1
+        outcome = self._outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome, json={"id": "123ABC"}, request=request)
+
+
+def _http_client(server: FlakyServer, retry_policy: RetryPolicy | None) -> HttpClient:
+    client = HttpClient(retry_policy=retry_policy)
+    client._sync_client = httpx.Client(transport=httpx.MockTransport(server))
+    client._async_client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+    return client
+
+
+def test_should_retry_transient_errors_until_success() -> None:
+    server = FlakyServer(503, httpx.ConnectError("Connection refused"), 200)
+
+    response = _http_client(server, RetryPolicy(backoff_base=0)).get(URL)
+
+    assert response.status_code == http.HTTPStatus.OK
+    assert server.requests_count == 3
+
+
+class GatewayErrorServer(FlakyServer):
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        response = super().__call__(request)
+        if response.is_success:
+            return response
+        return httpx.Response(
+            response.status_code,
+            content=b"<html><body>503 Service Temporarily Unavailable</body></html>",
+            headers={"Content-Type": "text/html"},
+            request=request,
+        )
+
+
+def test_should_retry_gateway_errors_with_html_body() -> None:
+    server = GatewayErrorServer(503, 502, 200)
+
+    response = _http_client(server, RetryPolicy(backoff_base=0)).get(URL)
+
+    assert response.status_code == http.HTTPStatus.OK
+    assert response.body == {"id": "123ABC"}
+    assert server.requests_count == 3
+
+
+def test_should_return_gateway_error_with_html_body_as_empty_body() -> None:
+    server = GatewayErrorServer(504)
+
+    response = _http_client(server, retry_policy=None).get(URL)
+
+    assert response.status_code == http.HTTPStatus.GATEWAY_TIMEOUT
+    assert response.body == {}
+
+
+@pytest.mark.asyncio
+async def test_should_retry_gateway_errors_with_html_body_before_streaming_response_async() -> None:
+    server = GatewayErrorServer(503, 200)
+
+    async with _http_client(server, RetryPolicy(backoff_base=0)).stream_async(URL) as response:
+        body = (await response.read_async()).body
+
+    assert body == {"id": "123ABC"}
+    assert server.requests_count == 2
+
+
+def test_should_return_last_response_when_attempts_are_exhausted() -> None:
+    server = FlakyServer(429, 429)
+
+    response = _http_client(server, RetryPolicy(max_attempts=2, backoff_base=0)).post(URL, payload={})
+
+    assert response.status_code == http.HTTPStatus.TOO_MANY_REQUESTS
+    assert server.requests_count == 2
+
+
+def test_should_raise_connection_error_when_attempts_are_exhausted() -> None:
+    server = FlakyServer(httpx.ConnectError("Connection refused"), httpx.ConnectError("Connection refused"))
+
+    with pytest.raises(httpx.ConnectError):
+        _http_client(server, RetryPolicy(max_attempts=2, backoff_base=0)).get(URL)
+
+
+def test_should_not_retry_without_retry_policy() -> None:
+    server = FlakyServer(503, 200)
+
+    response = _http_client(server, retry_policy=None).get(URL)
+
+    assert response.status_code == http.HTTPStatus.SERVICE_UNAVAILABLE
+    assert server.requests_count == 1
+
+
+@pytest.mark.asyncio
+async def test_should_retry_transient_errors_until_success_async() -> None:
+    server = FlakyServer(502, httpx.ReadTimeout("Timed out"), 200)
+
+    response = await _http_client(server, RetryPolicy(backoff_base=0)).get_async(URL)
+
+    assert response.status_code == http.HTTPStatus.OK
+    assert server.requests_count == 3
+
+
+@pytest.mark.asyncio
+async def test_should_not_retry_client_errors_async() -> None:
+    server = FlakyServer(400, 200)
+
+    response = await _http_client(server, RetryPolicy(backoff_base=0)).post_async(URL, payload={})
+
+    assert response.status_code == http.HTTPStatus.BAD_REQUEST
+    assert server.requests_count == 1
+
+
+def test_should_retry_transient_errors_until_streamed_response_succeeds() -> None:
+    server = FlakyServer(503, httpx.ConnectError("Connection refused"), 200)
+
+    with _http_client(server, RetryPolicy(backoff_base=0)).stream(URL) as response:
+        body = response.read().body
+
+    assert response.status_code == http.HTTPStatus.OK
+    assert body == {"id": "123ABC"}
+    assert server.requests_count == 3
+
+
+@pytest.mark.asyncio
+async def test_should_stream_json_array_items_async() -> None:
+    client = HttpClient()
+    client._async_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=b'{"resultats": [1, {"a": [2]}]}'))
+    )
+
+    async with client.stream_async(URL) as response:
+        items = [item async for item in response.iter_json_array_async("resultats")]
+
+    assert items == [1, {"a": [2]}]
+
+
+def test_should_not_open_connection_pools_before_first_request() -> None:
+    client = HttpClient()
+
+    assert client._sync_client is None
+    assert client._async_client is None
+
+
+def test_should_open_only_the_connection_pool_in_use() -> None:
+    client = _http_client(FlakyServer(200), retry_policy=None)
+    client._async_client = None
+
+    client.get(URL)
+
+    assert client._async_client is None
+
+
+def test_should_close_every_open_connection_pool() -> None:
+    client = _http_client(FlakyServer(), retry_policy=None)
+
+    client.close()
+
+    assert client._sync_client is not None and client._sync_client.is_closed
+    assert client._async_client is not None and client._async_client.is_closed
+
+
+def test_should_refuse_requests_once_closed() -> None:
+    client = HttpClient()
+
+    client.close()
+
+    with pytest.raises(RuntimeError, match="client has been closed"):
+        client.get(URL)
+    assert client._sync_client is None
+
+
+@pytest.mark.asyncio
+async def test_should_close_every_open_connection_pool_async() -> None:
+    client = _http_client(FlakyServer(), retry_policy=None)
+
+    await client.close_async()
+
+    assert client._sync_client is not None and client._sync_client.is_closed
+    assert client._async_client is not None and client._async_client.is_closed
+
+
+class EventLoopBoundTransport(httpx.MockTransport):
+    """Transport whose connections, like the ones of `httpcore`, belong to the event loop which opened them."""
+
+    def __init__(self, server: FlakyServer) -> None:
+        super().__init__(server)
+        self._event_loop: asyncio.AbstractEventLoop | None = None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._event_loop = asyncio.get_running_loop()
+        return await super().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        if self._event_loop is not None and self._event_loop.is_closed():
+            raise RuntimeError("Event loop is closed")
+
+
+def test_should_close_after_asynchronous_requests_of_a_finished_event_loop() -> None:
+    server = FlakyServer(200, 200)
+    client = _http_client(server, retry_policy=None)
+    client._async_client = httpx.AsyncClient(transport=EventLoopBoundTransport(server))
+    asyncio.run(client.get_async(URL))
+    client.get(URL)
+
+    client.close()
+
+    assert client._sync_client is not None and client._sync_client.is_closed
+
+
+class TaggingJsonDecoder:
+    def decode(self, content: bytes) -> dict[str, str]:
+        return {"decoded_by": "request decoder"}
+
+
+@pytest.mark.parametrize(
+    ("status_code", "expected_body"),
+    [(200, {"decoded_by": "request decoder"}), (400, {"id": "123ABC"})],
+)
+def test_should_decode_only_successful_responses_with_request_decoder(status_code: int, expected_body: dict) -> None:
+    response = _http_client(FlakyServer(status_code), retry_policy=None).get(URL, json_decoder=TaggingJsonDecoder())
+
+    assert response.body == expected_body
@@ -0,0 +1,65 @@
+import importlib.util
+import uuid
+
+import httpx
+import pytest
+
+from france_travail_api.http_transport._http_response import HTTPResponse
+from france_travail_api.http_transport.json_decoding import (
+    JsonDecoder,
+    MsgspecJsonDecoder,
+    OrjsonDecoder,
+    StdlibJsonDecoder,
+    default_json_decoder,
+)
+from tests.dsl import expect
+
+HAS_ORJSON = importlib.util.find_spec("orjson") is not None
+HAS_MSGSPEC = importlib.util.find_spec("msgspec") is not None
+
+JSON_DECODERS = [
+    pytest.param(StdlibJsonDecoder, id="stdlib"),
+    pytest.param(OrjsonDecoder, id="orjson", marks=pytest.mark.skipif(not HAS_ORJSON, reason="orjson missing")),
+    pytest.param(
+        MsgspecJsonDecoder, id="msgspec", marks=pytest.mark.skipif(not HAS_MSGSPEC, reason="msgspec missing")
+    ),
+]
+
+
+def _httpx_response(content: bytes) -> httpx.Response:
+    request = httpx.Request("GET", "https://api.francetravail.io", headers={"X-Request-Id": str(uuid.uuid4())})
+    return httpx.Response(200, content=content, request=request)
+
+
+@pytest.mark.parametrize("json_decoder_type", JSON_DECODERS)
+def test_json_decoder_should_decode_bytes(json_decoder_type: type[JsonDecoder]) -> None:
+    json_decoder = json_decoder_type()
+
+    expect(json_decoder.decode('{"intitule": "Boulanger / Boulangère", "nombrePostes": 2}'.encode())).to_equal(
+        {"intitule": "Boulanger / Boulangère", "nombrePostes": 2}
+    )
+
+
+@pytest.mark.parametrize("json_decoder_type", JSON_DECODERS)
+def test_json_decoder_should_raise_value_error_on_invalid_json(json_decoder_type: type[JsonDecoder]) -> None:
+    json_decoder = json_decoder_type()
+
+    expect(lambda: json_decoder.decode(b"{not json")).to_raise(ValueError)
+
+
+@pytest.mark.skipif(not HAS_ORJSON, reason="orjson missing")
+def test_default_json_decoder_should_prefer_orjson() -> None:
+    expect(default_json_decoder()).to_be_instance_of(OrjsonDecoder)
+
+
+@pytest.mark.parametrize("json_decoder_type", JSON_DECODERS)
+def test_http_response_should_decode_body_with_the_given_decoder(json_decoder_type: type[JsonDecoder]) -> None:
+    response = HTTPResponse.from_httpx_response(_httpx_response(b'{"id": "048KLTP"}'), json_decoder_type())
+
+    expect(response.body).to_equal({"id": "048KLTP"})
+
+
+def test_http_response_should_have_an_empty_body_without_content() -> None:
+    response = HTTPResponse.from_httpx_response(_httpx_response(b""))
+
+    expect(response.body).to_equal({})
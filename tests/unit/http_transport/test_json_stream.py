@@ -0,0 +1,107 @@
+import json
+import random
+from typing import Any
+
+import pytest
+
+from france_travail_api.http_transport._json_stream import JsonArrayParser
+
+ITEMS: list[Any] = [
+    {"id": "048KLTP", "intitule": 'Boulanger [H/F] "confirmé" {CDI}', "salaire": {"libelle": "Mensuel"}},
+    {"id": "048KLTQ", "description": "Pâtisserie\nviennoiserie \\ 🥐", "competences": [{"code": "1"}, {}]},
+    12.5,
+    -3,
+    -2.5e3,
+    1.5e-7,
+    0,
+    100,
+    "texte",
+    True,
+    None,
+    [],
+    [1, [2, [3]]],
+]
+
+
+def _parse(content: bytes, key: str | None, chunk_sizes: list[int]) -> list[Any]:
+    parser = JsonArrayParser(key)
+    items: list[Any] = []
+    position = 0
+    for chunk_size in chunk_sizes:
+        items += parser.feed(content[position : position + chunk_size])
+        position += chunk_size
+    items += parser.feed(content[position:])
+    return items + parser.close()
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_should_parse_array_items_whatever_the_chunks_boundaries(seed: int) -> None:
+    content = json.dumps(
+        {"filtresPossibles": [{"resultats": [0]}], "resultats": ITEMS, "total": {"resultats": []}}, ensure_ascii=False
+    ).encode()
+    chunk_sizes = [random.Random(seed).randint(1, 16) for _ in range(len(content))]
+
+    assert _parse(content, "resultats", chunk_sizes) == ITEMS
+
+
+def test_should_parse_top_level_array_byte_by_byte() -> None:
+    content = json.dumps(ITEMS, ensure_ascii=False, indent=2).encode()
+
+    assert _parse(content, None, [1] * len(content)) == ITEMS
+
+
+def test_should_yield_items_as_soon_as_they_are_received() -> None:
+    parser = JsonArrayParser("resultats")
+
+    assert parser.feed(b'{"resultats": [{"id": 1}, {"id"') == [{"id": 1}]
+    assert parser.feed(b": 2}, 3") == [{"id": 2}]
+    assert parser.feed(b"4]}") == [34]
+    assert parser.close() == []
+
+
+@pytest.mark.parametrize(
+    ("chunks", "expected"),
+    [
+        ([b"[-2.", b"5e3]"], [-2.5e3]),
+        ([b"[1.5E", b"+3]"], [1.5e3]),
+        ([b"[1", b"0, 2", b"e", b"-1 ,3.", b"25]"], [10, 0.2, 3.25]),
+        ([b"[tr", b"ue, -", b"1]"], [True, -1]),
+    ],
+)
+def test_should_wait_for_the_end_of_numbers_split_across_chunks(chunks: list[bytes], expected: list[Any]) -> None:
+    parser = JsonArrayParser()
+
+    items = [item for chunk in chunks for item in parser.feed(chunk)]
+
+    assert items + parser.close() == expected
+
+
+@pytest.mark.parametrize(
+    ("content", "key"),
+    [
+        (b"[]", None),
+        (b"  [ ]  ", None),
+        (b'{"resultats": []}', "resultats"),
+        (b'{"total": 0}', "resultats"),
+        (b"", None),
+    ],
+)
+def test_should_parse_empty_or_missing_array(content: bytes, key: str | None) -> None:
+    assert _parse(content, key, []) == []
+
+
+@pytest.mark.parametrize(
+    ("content", "key"),
+    [
+        (b'{"resultats": [{"id": 1}', "resultats"),
+        (b'{"resultats": [{"id": 1}, {"id"', "resultats"),
+        (b"[1, 2", None),
+        (b'{"resultats"', "resultats"),
+        (b"[1 2]", None),
+        (b"[1, }", None),
+        (b'{"id": 1}', None),
+    ],
+)
+def test_should_reject_truncated_or_invalid_document(content: bytes, key: str | None) -> None:
+    with pytest.raises(ValueError):
+        _parse(content, key, [])
@@ -0,0 +1,92 @@
+import pytest
+
+from france_travail_api.http_transport._rate_limiter import RateLimiter, TokenBucket
+from france_travail_api.http_transport.rate_limit import EndpointFamily, RateLimits
+
+SEARCH_URL = "https://api.francetravail.io/partenaire/offresdemploi/v2/offres/search?motsCles=python"
+GET_URL = "https://api.francetravail.io/partenaire/offresdemploi/v2/offres/123ABC"
+REFERENTIEL_URL = "https://api.francetravail.io/partenaire/offresdemploi/v2/referentiel/metiers"
+TOKEN_URL = "https://entreprise.francetravail.fr/connexion/oauth2/access_token?realm=%2Fpartenaire"
+
+
+class FakeMonotonic:
+    def __init__(self) -> None:
+        self.seconds = 0.0
+
+    def __call__(self) -> float:
+        return self.seconds
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        (SEARCH_URL, EndpointFamily.SEARCH),
+        (GET_URL, EndpointFamily.GET),
+        (REFERENTIEL_URL, EndpointFamily.REFERENTIEL),
+        (TOKEN_URL, EndpointFamily.TOKEN),
+    ],
+)
+def test_should_find_endpoint_family_of_url(url: str, expected: EndpointFamily) -> None:
+    assert EndpointFamily.from_url(url) == expected
+
+
+def test_should_reject_non_positive_rate_limit() -> None:
+    with pytest.raises(ValueError, match="Rate limit of search endpoints must be positive, got 0"):
+        RateLimits(search=0)
+
+
+def test_should_not_delay_burst_within_capacity() -> None:
+    bucket = TokenBucket(rate=4.0, monotonic=FakeMonotonic())
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.0, 0.0]
+
+
+def test_should_space_calls_once_bucket_is_empty() -> None:
+    bucket = TokenBucket(rate=4.0, monotonic=FakeMonotonic())
+    for _ in range(4):
+        bucket.reserve()
+
+    assert [bucket.reserve() for _ in range(3)] == [0.25, 0.5, 0.75]
+
+
+def test_should_refill_bucket_over_time() -> None:
+    monotonic = FakeMonotonic()
+    bucket = TokenBucket(rate=4.0, monotonic=monotonic)
+    for _ in range(4):
+        bucket.reserve()
+
+    monotonic.seconds += 0.5
+
+    assert [bucket.reserve(), bucket.reserve(), bucket.reserve()] == [0.0, 0.0, 0.25]
+
+
+def test_should_not_refill_bucket_beyond_capacity() -> None:
+    monotonic = FakeMonotonic()
+    bucket = TokenBucket(rate=2.0, monotonic=monotonic)
+
+    monotonic.seconds += 60
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.5]
+
+
+def test_should_limit_each_endpoint_family_independently() -> None:
+    rate_limiter = RateLimiter(RateLimits(search=1.0, get=1.0), monotonic=FakeMonotonic())
+
+    assert [rate_limiter.reserve(SEARCH_URL), rate_limiter.reserve(SEARCH_URL)] == [0.0, 1.0]
+    assert rate_limiter.reserve(GET_URL) == 0.0
+
+
+def test_should_not_delay_endpoint_family_without_rate_limit() -> None:
+    rate_limiter = RateLimiter(RateLimits(token=None), monotonic=FakeMonotonic())
+
+    assert [rate_limiter.reserve(TOKEN_URL) for _ in range(100)] == [0.0] * 100
+
+
+@pytest.mark.asyncio
+async def test_should_not_wait_async_within_capacity() -> None:
+    rate_limiter = RateLimiter(RateLimits(search=2.0), monotonic=FakeMonotonic())
+
+    await rate_limiter.wait_async(SEARCH_URL)
+    await rate_limiter.wait_async(SEARCH_URL)
+
+    assert rate_limiter.reserve(SEARCH_URL) == 0.5
@@ -0,0 +1,104 @@
+import datetime
+import http
+import random
+import uuid
+
+import pytest
+
+from france_travail_api.http_transport._http_response import HTTPResponse
+from france_travail_api.http_transport._retrier import Retrier
+from france_travail_api.http_transport.retry import RetryPolicy, parse_retry_after
+
+NOW = datetime.datetime(2025, 12, 25, 10, 0, 0, tzinfo=datetime.UTC)
+
+
+def _response(status_code: http.HTTPStatus, headers: dict[str, str] | None = None) -> HTTPResponse:
+    return HTTPResponse(status_code=status_code, body={}, request_id=uuid.uuid4(), headers=headers or {})
+
+
+def test_should_reject_policy_without_attempt() -> None:
+    with pytest.raises(ValueError, match="Max attempts must be at least 1, got 0"):
+        RetryPolicy(max_attempts=0)
+
+
+@pytest.mark.parametrize(("retry_number", "expected_max"), [(1, 0.5), (2, 1.0), (3, 2.0), (10, 30.0)])
+def test_should_draw_backoff_with_full_jitter(retry_number: int, expected_max: float) -> None:
+    random_generator = random.Random(42)
+    backoffs = [RetryPolicy().backoff(retry_number, random_generator) for _ in range(100)]
+
+    assert all(0 <= backoff <= expected_max for backoff in backoffs)
+    assert max(backoffs) > expected_max / 2
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({"retry-after": "3"}, 3.0),
+        ({"Retry-After": "Thu, 25 Dec 2025 10:00:05 GMT"}, 5.0),
+        ({"retry-after": "Thu, 25 Dec 2025 09:00:00 GMT"}, 0.0),
+        ({"retry-after": "soon"}, None),
+        ({}, None),
+    ],
+)
+def test_should_parse_retry_after(headers: dict[str, str], expected: float | None) -> None:
+    assert parse_retry_after(headers, NOW) == expected
+
+
+@pytest.mark.parametrize(
+    "status_code",
+    [http.HTTPStatus.TOO_MANY_REQUESTS, http.HTTPStatus.BAD_GATEWAY, http.HTTPStatus.SERVICE_UNAVAILABLE],
+)
+def test_should_retry_transient_status(status_code: http.HTTPStatus) -> None:
+    retrier = Retrier(RetryPolicy(backoff_base=0))
+
+    assert retrier.delay_before_retry(attempt=1, response=_response(status_code)) == 0.0
+
+
+@pytest.mark.parametrize("status_code", [http.HTTPStatus.OK, http.HTTPStatus.BAD_REQUEST, http.HTTPStatus.NOT_FOUND])
+def test_should_not_retry_other_status(status_code: http.HTTPStatus) -> None:
+    retrier = Retrier(RetryPolicy())
+
+    assert retrier.delay_before_retry(attempt=1, response=_response(status_code)) is None
+
+
+def test_should_retry_connection_error() -> None:
+    retrier = Retrier(RetryPolicy(backoff_base=0))
+
+    assert retrier.delay_before_retry(attempt=1) == 0.0
+
+
+def test_should_not_retry_connection_error_when_disabled() -> None:
+    retrier = Retrier(RetryPolicy(retry_on_connection_errors=False))
+
+    assert retrier.delay_before_retry(attempt=1) is None
+
+
+def test_should_stop_retrying_after_max_attempts() -> None:
+    retrier = Retrier(RetryPolicy(max_attempts=3, backoff_base=0))
+
+    assert [retrier.delay_before_retry(attempt) for attempt in (1, 2, 3)] == [0.0, 0.0, None]
+
+
+def test_should_wait_for_retry_after_delay() -> None:
+    retrier = Retrier(RetryPolicy())
+    response = _response(http.HTTPStatus.TOO_MANY_REQUESTS, {"retry-after": "2"})
+
+    assert retrier.delay_before_retry(attempt=1, response=response) == 2.0
+
+
+def test_should_not_retry_when_retry_after_exceeds_maximum() -> None:
+    retrier = Retrier(RetryPolicy(max_retry_after=60))
+    response = _response(http.HTTPStatus.SERVICE_UNAVAILABLE, {"retry-after": "3600"})
+
+    assert retrier.delay_before_retry(attempt=1, response=response) is None
+
+
+def test_should_stop_retrying_when_retry_budget_is_spent() -> None:
+    retrier = Retrier(RetryPolicy(backoff_base=0, retry_budget=2, retry_budget_ratio=0.5))
+
+    assert [retrier.delay_before_retry(attempt=1) for _ in range(3)] == [0.0, 0.0, None]
+
+    retrier.record_request()
+    retrier.record_request()
+
+    assert [retrier.delay_before_retry(attempt=1) for _ in range(2)] == [0.0, None]
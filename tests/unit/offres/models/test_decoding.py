@@ -0,0 +1,115 @@
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+
+import pytest
+
+from france_travail_api.offres.models import Offre
+from france_travail_api.offres.models._decoding import (
+    Field,
+    compile_attributes_decoder,
+    compile_from_dict,
+    model_fields,
+)
+from tests.dsl import expect
+
+
+@dataclass(frozen=True, slots=True)
+class Item:
+    code: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Model:
+    name: str | None = None
+    count: int | None = None
+    item: Item | None = None
+    items: list[Item] | None = None
+    tags: list[str] = field(default_factory=list)
+
+
+_decode_item = compile_from_dict(Item, [Field("code", "code")])
+
+_decode_model = compile_from_dict(
+    Model,
+    [
+        Field("name", "name"),
+        Field("count", "count", int),
+        Field("item", "item", _decode_item, skip_empty=True),
+        Field("items", "items", _decode_item, many=True),
+        Field("tags", "tags", many=True, default_factory=list),
+    ],
+)
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        (
+            {"name": "model", "count": "3", "item": {"code": "A"}, "items": [{"code": "B"}], "tags": ["x"]},
+            Model(name="model", count=3, item=Item(code="A"), items=[Item(code="B")], tags=["x"]),
+        ),
+        ({}, Model(name=None, count=None, item=None, items=None, tags=[])),
+        ({"count": None, "item": {}, "items": [], "tags": None}, Model(item=None, items=[], tags=[])),
+    ],
+)
+def test_compiled_from_dict_should_create_dataclass(data: dict, expected: Model) -> None:
+    expect(_decode_model(data)).to_equal(expected)
+
+
+def test_compiled_from_dict_should_not_share_default_values() -> None:
+    first_model = _decode_model({})
+    second_model = _decode_model({})
+
+    assert first_model.tags is not second_model.tags
+
+
+def test_compile_from_dict_should_reject_unmapped_fields() -> None:
+    expect(lambda: compile_from_dict(Model, [Field("name", "name")])).to_raise(
+        ValueError, match="Fields of Model must all be mapped exactly once"
+    )
+
+
+def test_compile_from_dict_should_reject_fields_mapped_twice() -> None:
+    expect(lambda: compile_from_dict(Item, [Field("code", "code"), Field("code", "codeItem")])).to_raise(
+        ValueError, match="Fields of Item must all be mapped exactly once"
+    )
+
+
+def test_compile_from_dict_should_reject_dataclasses_without_slots() -> None:
+    @dataclass(frozen=True)
+    class UnslottedItem:
+        code: str | None = None
+
+    expect(lambda: compile_from_dict(UnslottedItem, [Field("code", "code")])).to_raise(
+        ValueError, match="UnslottedItem must be a dataclass with slots"
+    )
+
+
+def test_compiled_attributes_decoder_should_decode_attributes_in_place() -> None:
+    decode_attributes = compile_attributes_decoder(model_fields(Model))
+    model = SimpleNamespace(name="model", count="3", item={}, items=[{"code": "B"}], tags=None)
+
+    assert decode_attributes is not None
+    decode_attributes(model)
+
+    expect(model).to_equal(SimpleNamespace(name="model", count=3, item=None, items=[Item(code="B")], tags=[]))
+
+
+def test_compile_attributes_decoder_should_skip_attributes_without_conversion() -> None:
+    assert compile_attributes_decoder([Field("name", "name")]) is None
+
+
+def test_offre_from_dict_should_default_missing_lists_and_skip_empty_objects() -> None:
+    offre = Offre.from_dict({"id": "048KLTP", "agence": {}, "dateCreation": ""})
+
+    expect(offre).to_equal(
+        Offre(
+            id="048KLTP",
+            formations=[],
+            langues=[],
+            permis=[],
+            outils_bureautiques=[],
+            competences=[],
+            qualites_professionnelles=[],
+        )
+    )
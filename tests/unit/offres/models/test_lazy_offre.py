@@ -0,0 +1,68 @@
+import dataclasses
+import datetime
+
+import pytest
+
+from france_travail_api.offres.models import LazyOffre, LieuTravail, Offre
+from tests.dsl import expect
+
+
+@pytest.fixture
+def offre_json() -> dict:
+    return {
+        "id": "048KLTP",
+        "intitule": "Boulanger / Boulangère (H/F)",
+        "dateCreation": "2022-10-23T08:15:42.000Z",
+        "lieuTravail": {"libelle": "74 - ANNECY", "codePostal": "74000", "commune": "74010"},
+        "entreprise": {"nom": "Boulanger austral", "entrepriseAdaptee": False},
+        "typeContrat": "CDD",
+        "experienceExige": "D",
+        "competences": [{"code": "483320", "libelle": "Faire preuve d'autonomie", "exigence": "E"}],
+        "salaire": {"libelle": "Mensuel de 1923.00 Euros sur 12 mois"},
+        "origineOffre": {"origine": "1"},
+        "contexteTravail": {"horaires": ["35H Travail le samedi"]},
+    }
+
+
+def test_lazy_offre_should_have_the_attributes_of_offre(offre_json: dict) -> None:
+    lazy_offre = LazyOffre.from_dict(offre_json)
+
+    expect(dataclasses.asdict(lazy_offre)).to_equal(dataclasses.asdict(Offre.from_dict(offre_json)))
+
+
+def test_lazy_offre_should_be_an_offre(offre_json: dict) -> None:
+    expect(LazyOffre.from_dict(offre_json)).to_be_instance_of(Offre)
+
+
+def test_lazy_offre_should_decode_attributes_on_first_access() -> None:
+    offre_json = {
+        "id": "048KLTP",
+        "dateCreation": "2022-10-23T08:15:42.000Z",
+        "lieuTravail": {"libelle": "74 - ANNECY", "commune": "74010"},
+        "typeContrat": "not a contract type",
+    }
+
+    lazy_offre = LazyOffre.from_dict(offre_json)
+
+    expect(lazy_offre.id).to_equal("048KLTP")
+    expect(lazy_offre.date_creation).to_equal(datetime.datetime(2022, 10, 23, 8, 15, 42, tzinfo=datetime.UTC))
+    expect(lazy_offre.lieu_travail).to_equal(LieuTravail(libelle="74 - ANNECY", commune="74010"))
+    expect(lambda: lazy_offre.type_contrat).to_raise(ValueError, match="not a contract type")
+
+
+def test_lazy_offre_should_decode_each_attribute_once(offre_json: dict) -> None:
+    lazy_offre = LazyOffre.from_dict(offre_json)
+
+    assert lazy_offre.lieu_travail is lazy_offre.lieu_travail
+
+
+def test_lazy_offre_should_stay_immutable(offre_json: dict) -> None:
+    lazy_offre = LazyOffre.from_dict(offre_json)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        lazy_offre.intitule = "Boulanger"  # type: ignore[misc]
+
+
+def test_lazy_offres_should_compare_by_attributes(offre_json: dict) -> None:
+    expect(LazyOffre.from_dict(offre_json)).to_equal(LazyOffre.from_dict(dict(offre_json)))
+    expect(dataclasses.replace(LazyOffre.from_dict(offre_json), id="other").id).to_equal("other")
@@ -0,0 +1,40 @@
+import pytest
+
+from france_travail_api.offres.models.referentiels import Commune, Departement, Region, TypeContrat
+from tests.dsl import expect
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        (
+            {"code": "CDI", "libelle": "Contrat à durée indéterminée"},
+            TypeContrat(code="CDI", libelle="Contrat à durée indéterminée"),
+        ),
+        ({}, TypeContrat(code=None, libelle=None)),
+    ],
+)
+def test_from_dict_should_create_referentiel_entry(data: dict, expected: TypeContrat) -> None:
+    expect(TypeContrat.from_dict(data)).to_equal(expected)
+
+
+def test_from_dict_should_create_commune() -> None:
+    data = {"code": "21704", "libelle": "VILLIERS LE DUC", "codePostal": "21400", "codeDepartement": "21"}
+
+    expect(Commune.from_dict(data)).to_equal(
+        Commune(code="21704", libelle="VILLIERS LE DUC", code_postal="21400", code_departement="21")
+    )
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        (
+            {"code": "01", "libelle": "Ain", "region": {"code": "84", "libelle": "Auvergne-Rhône-Alpes"}},
+            Departement(code="01", libelle="Ain", region=Region(code="84", libelle="Auvergne-Rhône-Alpes")),
+        ),
+        ({"code": "01", "libelle": "Ain"}, Departement(code="01", libelle="Ain", region=None)),
+    ],
+)
+def test_from_dict_should_create_departement(data: dict, expected: Departement) -> None:
+    expect(Departement.from_dict(data)).to_equal(expected)
@@ -0,0 +1,21 @@
+import dataclasses
+
+import pytest
+
+from france_travail_api.offres import models
+
+MODELS = [model for model in vars(models).values() if isinstance(model, type) and dataclasses.is_dataclass(model)]
+
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda model: model.__name__)
+def test_model_instances_should_not_have_a_dict(model: type) -> None:
+    assert not hasattr(model(), "__dict__")
+
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda model: model.__name__)
+def test_model_instances_should_stay_immutable(model: type) -> None:
+    instance = model()
+    first_field = dataclasses.fields(instance)[0]
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        setattr(instance, first_field.name, None)
@@ -0,0 +1,76 @@
+import json
+from typing import Any
+
+import pytest
+
+from france_travail_api.offres.models import Offre
+from france_travail_api.offres.models._typed_decoding import TypedOffreDecoder
+from tests.dsl import expect
+
+pytest.importorskip("msgspec")
+
+OFFRE_JSON: dict[str, Any] = {
+    "id": "201WLXK",
+    "intitule": "Développeur backend Python/Django (H/F)",
+    "dateCreation": "2025-12-23T16:01:23.690Z",
+    "dateActualisation": "2025-12-24T09:03:02.003Z",
+    "lieuTravail": {"libelle": "72 - Le Mans", "latitude": 48.007462, "longitude": 0.197404, "codePostal": "72000"},
+    "appellationlibelle": "Développeur / Développeuse back-end",
+    "entreprise": {"nom": "HOLENEK INGENIERIE", "entrepriseAdaptee": False},
+    "typeContrat": "CDI",
+    "experienceExige": "E",
+    "formations": [{"codeFormation": "31054", "niveauLibelle": "Bac+5 et plus ou équivalents", "exigence": "S"}],
+    "langues": [{"libelle": "Anglais", "exigence": "S"}],
+    "permis": [{"libelle": "B - Véhicule léger", "exigence": "E"}],
+    "outilsBureautiques": ["Tableur"],
+    "competences": [{"code": "120735", "libelle": "Concevoir une application web", "exigence": "E"}],
+    "salaire": {"libelle": "Annuel de 38000.0 Euros", "listeComplements": [{"code": "17", "libelle": "Mutuelle"}]},
+    "contact": {"nom": "Mme Dupont", "urlPostulation": "https://taleez.com/apply"},
+    "nombrePostes": 1,
+    "accessibleTH": True,
+    "codeNAF": "62.02A",
+    "qualitesProfessionnelles": [{"libelle": "Autonomie", "description": "Capacité à travailler seul."}],
+    "origineOffre": {"origine": "2", "partenaires": [{"nom": "TALEEZ", "url": "https://taleez.com"}]},
+    "contexteTravail": {"horaires": ["35H Travail en journée"]},
+    "champInconnu": "ignored",
+}
+
+
+def _search_page(*offres_json: dict[str, Any]) -> bytes:
+    return json.dumps({"resultats": list(offres_json), "filtresPossibles": []}).encode()
+
+
+@pytest.mark.parametrize(
+    "offre_json",
+    [
+        OFFRE_JSON,
+        {},
+        {"id": "048KLTP", "agence": {}, "dateCreation": "", "typeContrat": "", "formations": None},
+        {"competences": [{"code": "120735", "exigence": None}], "outilsBureautiques": None},
+    ],
+)
+def test_typed_decoder_should_decode_search_page_like_from_dict(offre_json: dict[str, Any]) -> None:
+    body = TypedOffreDecoder().decode(_search_page(offre_json))
+
+    expect(body).to_equal({"resultats": [Offre.from_dict(offre_json)]})
+
+
+def test_typed_decoder_should_decode_empty_search_page() -> None:
+    expect(TypedOffreDecoder().decode(b"{}")).to_equal({"resultats": []})
+
+
+def test_typed_decoder_should_create_offre_from_dict() -> None:
+    expect(TypedOffreDecoder().from_dict(OFFRE_JSON)).to_equal(Offre.from_dict(OFFRE_JSON))
+
+
+def test_typed_decoder_should_decode_nested_objects_whose_keys_are_all_null_to_none() -> None:
+    offre_json = {"id": "048KLTP", "contact": {"nom": None}, "salaire": {"listeComplements": None}}
+
+    body = TypedOffreDecoder().decode(_search_page(offre_json))
+
+    expect(body).to_equal({"resultats": [Offre.from_dict({"id": "048KLTP"})]})
+
+
+@pytest.mark.parametrize("offre_json", [{"nombrePostes": "beaucoup"}, {"typeContrat": "XYZ"}])
+def test_typed_decoder_should_reject_the_whole_page_for_an_invalid_value(offre_json: dict[str, Any]) -> None:
+    expect(lambda: TypedOffreDecoder().decode(_search_page({"id": "048KLTP"}, offre_json))).to_raise(ValueError)
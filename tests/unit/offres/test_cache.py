@@ -0,0 +1,82 @@
+import pytest
+
+from france_travail_api.http_transport.json_decoding import StdlibJsonDecoder
+from france_travail_api.offres.cache import LRUCacheBackend, OffreCache
+
+
+class FakeMonotonic:
+    def __init__(self) -> None:
+        self.seconds = 0.0
+
+    def __call__(self) -> float:
+        return self.seconds
+
+
+def test_should_get_stored_value() -> None:
+    backend = LRUCacheBackend()
+    backend.set("048KLTP", b'{"id":"048KLTP"}')
+
+    assert backend.get("048KLTP") == b'{"id":"048KLTP"}'
+    assert backend.get("201WLXK") is None
+
+
+def test_should_expire_value_after_ttl() -> None:
+    monotonic = FakeMonotonic()
+    backend = LRUCacheBackend(ttl=60.0, monotonic=monotonic)
+    backend.set("048KLTP", b'{"id":"048KLTP"}')
+
+    monotonic.seconds = 59.0
+    assert backend.get("048KLTP") == b'{"id":"048KLTP"}'
+    monotonic.seconds = 60.0
+    assert backend.get("048KLTP") is None
+
+
+def test_should_evict_least_recently_used_value() -> None:
+    backend = LRUCacheBackend(max_size=2)
+    backend.set("1", b'{"id":"1"}')
+    backend.set("2", b'{"id":"2"}')
+    backend.get("1")
+
+    backend.set("3", b'{"id":"3"}')
+
+    assert backend.get("1") == b'{"id":"1"}'
+    assert backend.get("2") is None
+    assert backend.get("3") == b'{"id":"3"}'
+
+
+def test_should_reject_empty_cache() -> None:
+    with pytest.raises(ValueError, match="Cache size must be at least 1, got 0"):
+        LRUCacheBackend(max_size=0)
+
+
+def test_should_count_hits_and_misses() -> None:
+    offre_cache = OffreCache()
+    offre_cache.get("048KLTP")
+    offre_cache.set("048KLTP", {"id": "048KLTP"})
+    offre_cache.get("048KLTP")
+    offre_cache.get("048KLTP")
+
+    assert (offre_cache.hits, offre_cache.misses) == (2, 1)
+
+
+def test_should_not_let_callers_mutate_cached_value() -> None:
+    offre_cache = OffreCache()
+    offre_json = {"id": "048KLTP", "lieuTravail": {"commune": "75056"}}
+    offre_cache.set("048KLTP", offre_json)
+    offre_json["lieuTravail"]["commune"] = "69123"
+
+    cached_offre_json = offre_cache.get("048KLTP")
+    assert cached_offre_json is not None
+    cached_offre_json["lieuTravail"]["commune"] = "13055"
+
+    assert offre_cache.get("048KLTP") == {"id": "048KLTP", "lieuTravail": {"commune": "75056"}}
+
+
+def test_should_cache_offre_as_json_bytes() -> None:
+    backend = LRUCacheBackend()
+    offre_cache = OffreCache(backend, StdlibJsonDecoder())
+
+    offre_cache.set("048KLTP", {"id": "048KLTP", "intitule": "Développeur"})
+
+    assert backend.get("048KLTP") == '{"id":"048KLTP","intitule":"Développeur"}'.encode()
+    assert offre_cache.get("048KLTP") == {"id": "048KLTP", "intitule": "Développeur"}
@@ -1,12 +1,16 @@
+import asyncio
 import datetime
 import http
+import importlib.util
 import uuid
 
 import pytest
 
 from france_travail_api.auth.scope import Scope
-from france_travail_api.exceptions import OffreNotFoundException
+from france_travail_api.exceptions import FranceTravailException, IncompleteHarvestWarning, OffreNotFoundException
 from france_travail_api.http_transport._http_response import HTTPResponse
+from france_travail_api.http_transport.json_decoding import JsonDecoder
+from france_travail_api.offres.cache import OffreCache
 from france_travail_api.offres.models import (
     CodeOrigineOffre,
     CodeTypeContrat,
@@ -18,6 +22,7 @@ from france_travail_api.offres.models import (
     ExperienceExigee,
     Formation,
     Langue,
+    LazyOffre,
     LieuTravail,
     Offre,
     OrigineOffre,
@@ -27,6 +32,26 @@ from france_travail_api.offres.models import (
 )
 from france_travail_api.offres.models.agence import Agence
 from tests.dsl import scenario
+from tests.test_doubles.fake_http_client import FakeHttpClient
+
+
+class StalledHttpClient(FakeHttpClient):
+    """Fake HTTP client never answering requests for job offers whose ID starts with STALLED, until cancelled."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.cancelled_gets = 0
+
+    async def get_async(
+        self, url: str, headers: dict[str, str] | None = None, json_decoder: JsonDecoder | None = None
+    ) -> HTTPResponse:
+        if "/STALLED" in url:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.cancelled_gets += 1
+                raise
+        return await super().get_async(url, headers, json_decoder)
 
 
 def test_should_search_job_offers() -> None:
@@ -723,3 +748,740 @@ async def test_should_raise_exception_when_job_offer_not_found_async() -> None:
 
     await flow.when_getting_offre_async(offer_id="INVALID_ID")
     flow.then_exception_is(exception_type=OffreNotFoundException, match="Job offer with ID 'INVALID_ID' not found")
+
+
+def _search_page_response(offer_ids: list[str], content_range: str) -> HTTPResponse:
+    return HTTPResponse(
+        status_code=http.HTTPStatus.PARTIAL_CONTENT,
+        body={"resultats": [{"id": offer_id} for offer_id in offer_ids]},
+        request_id=uuid.uuid4(),
+        headers={"content-range": content_range},
+    )
+
+
+def test_should_iterate_over_all_search_result_windows() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_search_page_response(["1", "2"], "offres 0-1/5"))
+        .with_http_response(_search_page_response(["3", "4"], "offres 2-3/5"))
+        .with_http_response(_search_page_response(["5"], "offres 4-4/5"))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    flow.when_iterating_offres(mots_cles="boulanger", page_size=2, departement="75")
+
+    flow.then_offres_should_be_equal(
+        [Offre(id=offer_id, outils_bureautiques=[], competences=[]) for offer_id in "12345"]
+    )
+    flow.then_requested_get_urls_contain(["range=0-1", "range=2-3", "range=4-4"])
+    flow.then_last_get_url_contains("departement=75")
+
+
+def test_should_stop_iterating_at_search_results_limit() -> None:
+    flow = scenario().unit().with_token_response()
+    for start in range(0, 3150, 150):
+        flow.with_http_response(_search_page_response([str(start)], f"offres {start}-{start + 149}/10000"))
+    flow.with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+    flow.with_offres_client()
+
+    flow.when_iterating_offres(mots_cles="boulanger")
+
+    flow.then_requested_get_urls_contain([f"range={start}-{start + 149}" for start in range(0, 3150, 150)])
+
+
+def test_should_stop_iterating_when_search_has_no_results() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(
+            HTTPResponse(
+                status_code=http.HTTPStatus.NO_CONTENT,
+                body={},
+                request_id=uuid.uuid4(),
+                headers={"content-range": "*/0"},
+            )
+        )
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    flow.when_iterating_offres(mots_cles="boulanger").then_offres_should_be_equal([])
+
+
+def test_should_raise_api_error_when_iterating_search_results() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_error_response(description="Paramètre invalide")
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    with pytest.raises(FranceTravailException, match="Paramètre invalide"):
+        flow.when_iterating_offres(mots_cles="boulanger")
+
+
+def test_should_reject_range_param_when_iterating_search_results() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    with pytest.raises(TypeError, match="range_param"):
+        flow.when_iterating_offres(mots_cles="boulanger", range_param="0-149")
+
+
+@pytest.mark.asyncio
+async def test_should_iterate_over_all_search_result_windows_async() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_search_page_response(["1", "2"], "offres 0-1/3"))
+        .with_http_response(_search_page_response(["3"], "offres 2-2/3"))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    await flow.when_iterating_offres_async(mots_cles="boulanger", page_size=2)
+
+    flow.then_offres_should_be_equal(
+        [Offre(id=offer_id, outils_bureautiques=[], competences=[]) for offer_id in "123"]
+    )
+    flow.then_requested_get_urls_contain(["range=0-1", "range=2-2"])
+
+
+@pytest.mark.asyncio
+async def test_should_fetch_remaining_search_windows_concurrently() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_search_page_response(["1", "2"], "offres 0-1/7"))
+        .with_http_response(_search_page_response(["3", "4"], "offres 2-3/7"))
+        .with_http_response(_search_page_response(["5", "6"], "offres 4-5/7"))
+        .with_http_response(_search_page_response(["7"], "offres 6-6/7"))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    await flow.when_searching_all_offres_async(mots_cles="boulanger", page_size=2, max_concurrency=2)
+
+    flow.then_offres_should_be_equal(
+        [Offre(id=offer_id, outils_bureautiques=[], competences=[]) for offer_id in "1234567"]
+    )
+    flow.then_requested_get_urls_contain(["range=0-1", "range=2-3", "range=4-5", "range=6-6"])
+    flow.then_max_concurrent_requests_is(2)
+
+
+@pytest.mark.asyncio
+async def test_should_fetch_remaining_search_windows_sequentially_when_total_is_unknown() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_search_page_response(["1", "2"], "offres 0-1"))
+        .with_http_response(_search_page_response(["3"], "offres 2-2"))
+        .with_http_response(_search_page_response([], "offres 4-5"))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    await flow.when_searching_all_offres_async(mots_cles="boulanger", page_size=2)
+
+    flow.then_offres_should_be_equal(
+        [Offre(id=offer_id, outils_bureautiques=[], competences=[]) for offer_id in "123"]
+    )
+    flow.then_max_concurrent_requests_is(1)
+
+
+@pytest.mark.asyncio
+async def test_should_raise_api_error_when_searching_all_result_windows_async() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_search_page_response(["1", "2"], "offres 0-1/3"))
+        .with_error_response(status_code=http.HTTPStatus.INTERNAL_SERVER_ERROR, description="Erreur interne")
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    with pytest.raises(FranceTravailException, match="Erreur interne"):
+        await flow.when_searching_all_offres_async(mots_cles="boulanger", page_size=2)
+
+
+def test_should_harvest_over_limit_search_by_splitting_it_and_deduplicating_offers() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_search_page_response(["1"], "offres 0-149/4000"))
+        .with_http_response(_search_page_response(["1", "2"], "offres 0-149/2000"))
+        .with_http_response(_search_page_response([], "offres 150-299/2000"))
+        .with_http_response(_search_page_response(["2", "3"], "offres 0-149/2000"))
+        .with_http_response(_search_page_response([], "offres 150-299/2000"))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    flow.when_harvesting_offres(mots_cles="boulanger", departement="75,92")
+
+    flow.then_offres_should_be_equal(
+        [Offre(id=offer_id, outils_bureautiques=[], competences=[]) for offer_id in "123"]
+    )
+    flow.then_requested_get_urls_contain(
+        ["departement=75,92", "departement=75", "range=150-299", "departement=92", "range=150-299"]
+    )
+
+
+def test_should_warn_when_harvest_cannot_split_search_further() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_search_page_response(["1"], "offres 0-0/4000"))
+        .with_http_response(_search_page_response([], "offres 150-299/4000"))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    with pytest.warns(IncompleteHarvestWarning, match="cannot be split further"):
+        flow.when_harvesting_offres(
+            mots_cles="boulanger",
+            commune="75056",
+            type_contrat=CodeTypeContrat.CDI,
+            min_creation_date="2025-12-01T00:00:00Z",
+            max_creation_date="2025-12-01T00:00:01Z",
+        )
+
+    flow.then_offres_should_be_equal([Offre(id="1", outils_bureautiques=[], competences=[])])
+
+
+def test_should_warn_when_split_searches_miss_results_of_harvested_search() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_search_page_response(["1"], "offres 0-149/4000"))
+        .with_http_response(_search_page_response(["1", "2"], "offres 0-1/2"))
+        .with_http_response(_search_page_response(["2", "3"], "offres 0-1/2"))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    with pytest.warns(
+        IncompleteHarvestWarning, match="has 4000 results but the searches it was split into only have 4"
+    ):
+        flow.when_harvesting_offres(mots_cles="boulanger", departement="75,92")
+
+    flow.then_offres_should_be_equal(
+        [Offre(id=offer_id, outils_bureautiques=[], competences=[]) for offer_id in "123"]
+    )
+
+
+def test_should_raise_api_error_when_harvesting_split_search() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_search_page_response(["1"], "offres 0-149/4000"))
+        .with_http_response(_search_page_response(["1", "2"], "offres 0-1/2"))
+        .with_error_response(description="Paramètre invalide")
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    with pytest.raises(FranceTravailException, match="Paramètre invalide"):
+        flow.when_harvesting_offres(mots_cles="boulanger", departement="75,92")
+
+
+@pytest.mark.asyncio
+async def test_should_harvest_over_limit_search_by_splitting_it_and_deduplicating_offers_async() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_search_page_response(["1"], "offres 0-149/4000"))
+        .with_http_response(_search_page_response(["1", "2"], "offres 0-149/2000"))
+        .with_http_response(_search_page_response([], "offres 150-299/2000"))
+        .with_http_response(_search_page_response(["2", "3"], "offres 0-149/2000"))
+        .with_http_response(_search_page_response([], "offres 150-299/2000"))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    await flow.when_harvesting_offres_async(mots_cles="boulanger", departement="75,92")
+
+    flow.then_offres_should_be_equal(
+        [Offre(id=offer_id, outils_bureautiques=[], competences=[]) for offer_id in "123"]
+    )
+
+
+def test_should_renew_token_and_replay_request_when_token_is_rejected() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response(access_token="my_token1")
+        .with_error_response(status_code=http.HTTPStatus.UNAUTHORIZED, error="invalid_token")
+        .with_token_response(access_token="my_token2")
+        .with_http_response(
+            HTTPResponse(
+                status_code=http.HTTPStatus.OK,
+                body={"id": "048KLTP"},
+                request_id=uuid.uuid4(),
+                headers={},
+            )
+        )
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    flow.when_getting_offre(offer_id="048KLTP")
+
+    flow.then_offre_should_be(Offre(id="048KLTP", outils_bureautiques=[], competences=[]))
+    flow.then_token_requests_count_is(2).then_current_access_token_is("my_token2")
+
+
+@pytest.mark.asyncio
+async def test_should_renew_token_and_replay_request_when_token_is_rejected_async() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response(access_token="my_token1")
+        .with_error_response(status_code=http.HTTPStatus.UNAUTHORIZED, error="invalid_token")
+        .with_token_response(access_token="my_token2")
+        .with_http_response(
+            HTTPResponse(
+                status_code=http.HTTPStatus.OK,
+                body={"id": "048KLTP"},
+                request_id=uuid.uuid4(),
+                headers={},
+            )
+        )
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    await flow.when_getting_offre_async(offer_id="048KLTP")
+
+    flow.then_offre_should_be(Offre(id="048KLTP", outils_bureautiques=[], competences=[]))
+    flow.then_token_requests_count_is(2).then_current_access_token_is("my_token2")
+
+
+def _offre_response(offer_id: str) -> HTTPResponse:
+    return HTTPResponse(status_code=http.HTTPStatus.OK, body={"id": offer_id}, request_id=uuid.uuid4(), headers={})
+
+
+def _offre_not_found_response() -> HTTPResponse:
+    return HTTPResponse(status_code=http.HTTPStatus.NO_CONTENT, body={}, request_id=uuid.uuid4(), headers={})
+
+
+def test_should_get_many_job_offers_by_id() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_offre_response("048KLTP"))
+        .with_http_response(_offre_not_found_response())
+        .with_http_response(_offre_response("201WLXK"))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    flow.when_getting_many_offres(["048KLTP", "REMOVED", "201WLXK"], max_concurrency=1)
+
+    flow.then_offre_results_are(
+        {
+            "048KLTP": Offre(id="048KLTP", outils_bureautiques=[], competences=[]),
+            "REMOVED": OffreNotFoundException,
+            "201WLXK": Offre(id="201WLXK", outils_bureautiques=[], competences=[]),
+        }
+    )
+    flow.then_token_requests_count_is(1)
+
+
+def test_should_raise_api_error_when_getting_many_job_offers() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_offre_response("048KLTP"))
+        .with_error_response(status_code=http.HTTPStatus.INTERNAL_SERVER_ERROR, description="Erreur interne")
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    with pytest.raises(FranceTravailException, match="Erreur interne"):
+        flow.when_getting_many_offres(["048KLTP", "201WLXK"], max_concurrency=1)
+
+
+@pytest.mark.asyncio
+async def test_should_raise_api_error_when_getting_job_offer_async() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_error_response(status_code=http.HTTPStatus.SERVICE_UNAVAILABLE, description="Service indisponible")
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    await flow.when_getting_offre_async(offer_id="048KLTP")
+
+    flow.then_exception_is(exception_type=FranceTravailException, match="Service indisponible")
+
+
+def test_should_reject_get_many_without_concurrency() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    with pytest.raises(ValueError, match="Maximum concurrency must be at least 1, got 0"):
+        flow.when_getting_many_offres(["048KLTP"], max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_should_get_many_job_offers_by_id_concurrently_async() -> None:
+    offer_ids = [f"OFFRE{index}" for index in range(10)]
+    flow = scenario().unit().with_token_response()
+    for offer_id in offer_ids:
+        flow.with_http_response(_offre_response(offer_id) if offer_id != "OFFRE3" else _offre_not_found_response())
+    flow.with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+    flow.with_offres_client()
+
+    await flow.when_getting_many_offres_async(offer_ids, max_concurrency=3)
+
+    flow.then_offre_results_are(
+        {
+            offer_id: Offre(id=offer_id, outils_bureautiques=[], competences=[])
+            if offer_id != "OFFRE3"
+            else OffreNotFoundException
+            for offer_id in offer_ids
+        }
+    )
+    flow.then_max_concurrent_requests_is(3)
+
+
+@pytest.mark.asyncio
+async def test_should_wait_for_cancelled_fetches_when_getting_many_job_offers_fails_async() -> None:
+    http_client = StalledHttpClient()
+    flow = (
+        scenario()
+        .unit()
+        .with_http_client(http_client)
+        .with_token_response()
+        .with_error_response(status_code=http.HTTPStatus.INTERNAL_SERVER_ERROR, description="Erreur interne")
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    with pytest.raises(FranceTravailException, match="Erreur interne"):
+        await flow.when_getting_many_offres_async(["STALLED1", "048KLTP", "STALLED2"], max_concurrency=3)
+
+    assert http_client.cancelled_gets == 2
+
+
+def test_should_serve_job_offer_from_cache() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_offre_response("048KLTP"))
+        .with_offre_cache(OffreCache())
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    flow.when_getting_offre(offer_id="048KLTP")
+    flow.when_getting_offre(offer_id="048KLTP")
+
+    flow.then_offre_should_be(Offre(id="048KLTP", outils_bureautiques=[], competences=[]))
+    flow.then_requested_get_urls_contain(["offres/048KLTP"])
+    flow.then_offre_cache_counts_are(hits=1, misses=1)
+
+
+@pytest.mark.asyncio
+async def test_should_not_cache_job_offer_not_found_async() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_offre_not_found_response())
+        .with_http_response(_offre_response("048KLTP"))
+        .with_offre_cache(OffreCache())
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    await flow.when_getting_offre_async(offer_id="048KLTP")
+    await flow.when_getting_offre_async(offer_id="048KLTP")
+
+    flow.then_offre_should_be(Offre(id="048KLTP", outils_bureautiques=[], competences=[]))
+    flow.then_offre_cache_counts_are(hits=0, misses=2)
+
+
+def test_should_return_lazy_offres_when_lazy_decoding_is_enabled() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_search_page_response(["OFFRE0", "OFFRE1"], content_range="offres 0-1/2"))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_lazy_decoding()
+        .with_offres_client()
+    )
+
+    flow.when_searching_offres(mots_cles="boulanger").then_all_offers_are(LazyOffre)
+    flow.then_offres_should_be_equal([LazyOffre.from_dict({"id": "OFFRE0"}), LazyOffre.from_dict({"id": "OFFRE1"})])
+
+
+@pytest.mark.skipif(importlib.util.find_spec("msgspec") is None, reason="msgspec missing")
+def test_should_decode_typed_offres_when_typed_decoding_is_enabled() -> None:
+    offre_json = {
+        "id": "OFFRE0",
+        "dateCreation": "2025-12-23T16:01:23.690Z",
+        "typeContrat": "CDI",
+        "experienceExige": "E",
+        "competences": [{"code": "120735", "exigence": "S"}],
+        "agence": {},
+    }
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(
+            HTTPResponse(
+                status_code=http.HTTPStatus.PARTIAL_CONTENT,
+                body={"resultats": [offre_json]},
+                request_id=uuid.uuid4(),
+                headers={"content-range": "offres 0-0/1"},
+            )
+        )
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_typed_decoding()
+        .with_offres_client()
+    )
+
+    flow.when_searching_offres(mots_cles="boulanger")
+
+    flow.then_offres_should_be_equal([Offre.from_dict(offre_json)])
+
+
+@pytest.mark.skipif(importlib.util.find_spec("msgspec") is None, reason="msgspec missing")
+def test_should_get_typed_offre_when_typed_decoding_is_enabled() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_offre_response("048KLTP"))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_typed_decoding()
+        .with_offres_client()
+    )
+
+    flow.when_getting_offre(offer_id="048KLTP")
+
+    flow.then_offre_should_be(Offre(id="048KLTP", outils_bureautiques=[], competences=[]))
+
+
+def test_should_reject_lazy_and_typed_decoding_together() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_lazy_decoding()
+        .with_typed_decoding()
+    )
+
+    with pytest.raises(ValueError, match="Lazy decoding and typed decoding cannot be combined"):
+        flow.with_offres_client()
+
+
+def test_should_search_raw_job_offers() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_search_page_response(["OFFRE0", "OFFRE1"], content_range="offres 0-1/2"))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    flow.when_searching_raw_offres(mots_cles="boulanger", range_param="0-1")
+
+    flow.then_raw_offres_are([{"id": "OFFRE0"}, {"id": "OFFRE1"}])
+    flow.then_last_get_url_contains("range=0-1")
+
+
+@pytest.mark.asyncio
+async def test_should_search_raw_job_offers_async() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_search_page_response(["OFFRE0"], content_range="offres 0-0/1"))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    await flow.when_searching_raw_offres_async(mots_cles="boulanger", type_contrat=CodeTypeContrat.CDI)
+
+    flow.then_raw_offres_are([{"id": "OFFRE0"}])
+    flow.then_last_get_url_contains("typeContrat=CDI")
+
+
+def test_should_reject_unknown_params_when_searching_raw_job_offers() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    with pytest.raises(TypeError, match="Unexpected search parameters: unknown"):
+        flow.when_searching_raw_offres(mots_cles="boulanger", unknown="value")
+
+
+def test_should_get_raw_job_offer_from_cache() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_offre_response("048KLTP"))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offre_cache(OffreCache())
+        .with_offres_client()
+    )
+
+    flow.when_getting_raw_offre("048KLTP").when_getting_raw_offre("048KLTP")
+
+    flow.then_raw_offres_are([{"id": "048KLTP"}])
+    flow.then_offre_cache_counts_are(hits=1, misses=1)
+
+
+def test_should_not_let_callers_mutate_raw_job_offer_from_cache() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_offre_response("048KLTP"))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offre_cache(OffreCache())
+        .with_offres_client()
+    )
+
+    flow.when_getting_raw_offre("048KLTP").when_modifying_raw_offres(intitule="Modifié")
+    flow.when_getting_raw_offre("048KLTP").when_modifying_raw_offres(intitule="Modifié")
+    flow.when_getting_raw_offre("048KLTP")
+
+    flow.then_raw_offres_are([{"id": "048KLTP"}])
+    flow.then_offre_cache_counts_are(hits=2, misses=1)
+
+
+@pytest.mark.asyncio
+async def test_should_report_missing_raw_job_offer_async() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_offre_not_found_response())
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    with pytest.raises(OffreNotFoundException, match="Job offer with ID 'UNKNOWN' not found"):
+        await flow.when_getting_raw_offre_async("UNKNOWN")
+
+
+def test_should_stream_job_offers_of_search_response() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_search_page_response(["048KLTP", "048KLTQ", "048KLTR"], "offres 0-2/3"))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    flow.when_streaming_offres(mots_cles="boulanger", departement="75")
+
+    flow.then_offres_should_be_equal(
+        [Offre(id=offer_id, outils_bureautiques=[], competences=[]) for offer_id in ("048KLTP", "048KLTQ", "048KLTR")]
+    )
+    flow.then_last_get_url_contains("departement=75")
+
+
+@pytest.mark.asyncio
+async def test_should_stream_job_offers_of_search_response_async() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_search_page_response(["048KLTP", "048KLTQ"], "offres 0-1/2"))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    await flow.when_streaming_offres_async(mots_cles="boulanger")
+
+    flow.then_offres_should_be_equal(
+        [Offre(id=offer_id, outils_bureautiques=[], competences=[]) for offer_id in ("048KLTP", "048KLTQ")]
+    )
+
+
+def test_should_stream_no_job_offers_when_search_has_no_results() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_offre_not_found_response())
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    flow.when_streaming_offres(mots_cles="boulanger").then_offres_should_be_equal([])
+
+
+@pytest.mark.asyncio
+async def test_should_raise_api_error_when_streaming_job_offers_async() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_error_response(description="Le paramètre departement est invalide")
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    await flow.when_streaming_offres_async(mots_cles="boulanger")
+
+    flow.then_exception_is(exception_type=FranceTravailException, match="Le paramètre departement est invalide")
+
+
+def test_should_renew_token_and_replay_request_when_streamed_search_token_is_rejected() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response(access_token="my_token1")
+        .with_error_response(status_code=http.HTTPStatus.UNAUTHORIZED, error="invalid_token")
+        .with_token_response(access_token="my_token2")
+        .with_http_response(_search_page_response(["048KLTP"], "offres 0-0/1"))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    flow.when_streaming_offres(mots_cles="boulanger")
+
+    flow.then_offres_should_be_equal([Offre(id="048KLTP", outils_bureautiques=[], competences=[])])
+    flow.then_token_requests_count_is(2).then_current_access_token_is("my_token2")
@@ -0,0 +1,51 @@
+import pytest
+
+from france_travail_api.offres._pagination import SearchPage, SearchRange, parse_content_range_total
+from france_travail_api.offres.models import Offre
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({"content-range": "offres 0-149/3456"}, 3456),
+        ({"Content-Range": "offres 150-299/300"}, 300),
+        ({"content-range": "*/0"}, 0),
+        ({"content-range": "offres 0-149"}, None),
+        ({}, None),
+    ],
+)
+def test_should_parse_total_from_content_range(headers: dict[str, str], expected: int | None) -> None:
+    assert parse_content_range_total(headers) == expected
+
+
+@pytest.mark.parametrize(
+    "current, total, expected",
+    [
+        (SearchRange(0, 149), 1000, SearchRange(150, 299)),
+        (SearchRange(0, 149), 200, SearchRange(150, 199)),
+        (SearchRange(0, 149), 150, None),
+        (SearchRange(2850, 2999), 10_000, SearchRange(3000, 3149)),
+        (SearchRange(3000, 3149), 10_000, None),
+        (SearchRange(0, 49), None, SearchRange(50, 99)),
+    ],
+)
+def test_should_compute_next_search_range(
+    current: SearchRange, total: int | None, expected: SearchRange | None
+) -> None:
+    assert current.next(total) == expected
+
+
+@pytest.mark.parametrize("page_size", [0, 151])
+def test_should_reject_out_of_bounds_page_size(page_size: int) -> None:
+    with pytest.raises(ValueError, match="Page size must be between 1 and 150"):
+        SearchRange.first(page_size)
+
+
+def test_should_convert_search_range_to_api_value() -> None:
+    assert SearchRange(150, 299).to_api_value() == "150-299"
+
+
+def test_should_list_search_ranges_following_a_page() -> None:
+    page = SearchPage(offres=[Offre(id="1")], total=400)
+
+    assert page.following_ranges(SearchRange(0, 149)) == [SearchRange(150, 299), SearchRange(300, 399)]
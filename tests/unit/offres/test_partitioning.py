@@ -0,0 +1,61 @@
+import datetime
+
+import pytest
+
+from france_travail_api.offres._partitioning import DEPARTEMENTS, SearchPartitioner
+from france_travail_api.offres.models import CodeTypeContrat
+
+NOW = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+
+
+def test_should_split_search_without_geographic_filter_by_departement() -> None:
+    narrower_searches = SearchPartitioner(now=NOW).split({"mots_cles": "boulanger"})
+
+    assert [search["departement"] for search in narrower_searches] == list(DEPARTEMENTS)
+    assert len(DEPARTEMENTS) == 101
+
+
+@pytest.mark.parametrize("param", ["departement", "commune"])
+def test_should_split_multi_valued_geographic_filter(param: str) -> None:
+    narrower_searches = SearchPartitioner(now=NOW).split({"mots_cles": "boulanger", param: "75056, 92050"})
+
+    assert narrower_searches == [
+        {"mots_cles": "boulanger", param: "75056"},
+        {"mots_cles": "boulanger", param: "92050"},
+    ]
+
+
+def test_should_split_single_departement_search_by_contract_type() -> None:
+    narrower_searches = SearchPartitioner(now=NOW).split({"mots_cles": "boulanger", "departement": "75"})
+
+    assert [search["type_contrat"] for search in narrower_searches] == [code.value for code in CodeTypeContrat]
+
+
+def test_should_split_search_by_creation_date_window() -> None:
+    narrower_searches = SearchPartitioner(now=NOW).split(
+        {
+            "mots_cles": "boulanger",
+            "region": "11",
+            "type_contrat": "CDI",
+            "min_creation_date": "2025-12-01T00:00:00Z",
+        }
+    )
+
+    assert [(search["min_creation_date"], search["max_creation_date"]) for search in narrower_searches] == [
+        ("2025-12-01T00:00:00Z", "2025-12-16T12:00:00Z"),
+        ("2025-12-16T12:00:00Z", "2026-01-01T00:00:00Z"),
+    ]
+
+
+def test_should_not_split_search_further_than_minimum_creation_date_window() -> None:
+    narrower_searches = SearchPartitioner(now=NOW).split(
+        {
+            "mots_cles": "boulanger",
+            "commune": "75056",
+            "type_contrat": "CDI",
+            "min_creation_date": "2025-12-01T00:00:00Z",
+            "max_creation_date": "2025-12-01T00:00:01Z",
+        }
+    )
+
+    assert narrower_searches == []
@@ -0,0 +1,63 @@
+import pytest
+
+from france_travail_api.offres.models import Appellation
+from france_travail_api.offres.referentiel import Referentiel, normalize_label
+
+BOULANGER = Appellation(code="11573", libelle="Boulanger / Boulangère")
+BOULANGER_PATISSIER = Appellation(code="11574", libelle="Boulanger-pâtissier / Boulangère-pâtissière")
+PATISSIER = Appellation(code="15216", libelle="Pâtissier / Pâtissière")
+DEVELOPPEUR = Appellation(code="38444", libelle="Développeur / Développeuse back-end")
+
+
+@pytest.fixture
+def appellations() -> Referentiel[Appellation]:
+    return Referentiel([PATISSIER, BOULANGER_PATISSIER, BOULANGER, DEVELOPPEUR])
+
+
+@pytest.mark.parametrize(
+    ("label", "expected"),
+    [
+        ("Boulanger / Boulangère", "boulanger boulangere"),
+        ("ÉTUDES et Développement", "etudes et developpement"),
+        ("Back-end", "back end"),
+    ],
+)
+def test_should_normalize_label(label: str, expected: str) -> None:
+    assert normalize_label(label) == expected
+
+
+def test_should_get_item_by_code(appellations: Referentiel[Appellation]) -> None:
+    assert appellations.get("11573") == BOULANGER
+    assert appellations.get("00000") is None
+    assert appellations.has_code("38444")
+    assert not appellations.has_code("00000")
+
+
+def test_should_behave_like_the_list_of_its_items(appellations: Referentiel[Appellation]) -> None:
+    assert len(appellations) == 4
+    assert appellations[0] == PATISSIER
+    assert list(appellations) == [PATISSIER, BOULANGER_PATISSIER, BOULANGER, DEVELOPPEUR]
+    assert appellations == [PATISSIER, BOULANGER_PATISSIER, BOULANGER, DEVELOPPEUR]
+
+
+def test_should_search_ignoring_accents_and_case(appellations: Referentiel[Appellation]) -> None:
+    assert appellations.search("BOULANGERE") == [BOULANGER_PATISSIER, BOULANGER]
+
+
+def test_should_rank_items_whose_label_starts_with_query_first(appellations: Referentiel[Appellation]) -> None:
+    assert appellations.search("patiss") == [PATISSIER, BOULANGER_PATISSIER]
+    assert appellations.search("boulanger patissier") == [BOULANGER_PATISSIER]
+
+
+def test_should_search_every_query_word(appellations: Referentiel[Appellation]) -> None:
+    assert appellations.search("dev back") == [DEVELOPPEUR]
+    assert appellations.search("dev front") == []
+
+
+def test_should_search_by_code_prefix(appellations: Referentiel[Appellation]) -> None:
+    assert appellations.search("1157") == [BOULANGER_PATISSIER, BOULANGER]
+
+
+def test_should_limit_search_results(appellations: Referentiel[Appellation]) -> None:
+    assert appellations.search("boulanger", limit=1) == [BOULANGER_PATISSIER]
+    assert appellations.search("   ") == []
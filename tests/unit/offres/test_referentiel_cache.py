@@ -0,0 +1,83 @@
+import pathlib
+import sys
+
+import pytest
+
+from france_travail_api.offres.referentiel_cache import CachedReferentiel, ReferentielCache
+
+METIERS = [{"code": "D1102", "libelle": "Boulangerie - viennoiserie"}]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.seconds = 1_766_656_800.0
+
+    def __call__(self) -> float:
+        return self.seconds
+
+
+def test_should_load_saved_referentiel_with_its_validators(tmp_path: pathlib.Path) -> None:
+    clock = FakeClock()
+    referentiel_cache = ReferentielCache(tmp_path, clock=clock)
+
+    referentiel_cache.save("metiers", METIERS, {"ETag": '"v1"', "Last-Modified": "Thu, 25 Dec 2025 10:00:00 GMT"})
+
+    assert referentiel_cache.load("metiers") == CachedReferentiel(
+        body=METIERS, stored_at=clock.seconds, etag='"v1"', last_modified="Thu, 25 Dec 2025 10:00:00 GMT"
+    )
+
+
+def test_should_load_nothing_when_referentiel_is_not_cached(tmp_path: pathlib.Path) -> None:
+    assert ReferentielCache(tmp_path).load("metiers") is None
+
+
+def test_should_load_nothing_when_cache_file_is_corrupted(tmp_path: pathlib.Path) -> None:
+    (tmp_path / "metiers.json").write_text("[")
+
+    assert ReferentielCache(tmp_path).load("metiers") is None
+
+
+def test_should_serve_referentiel_until_max_age(tmp_path: pathlib.Path) -> None:
+    clock = FakeClock()
+    referentiel_cache = ReferentielCache(tmp_path, max_age=3600.0, clock=clock)
+    cached_referentiel = referentiel_cache.save("metiers", METIERS, {})
+
+    clock.seconds += 3599
+    assert referentiel_cache.is_fresh(cached_referentiel)
+    clock.seconds += 1
+    assert not referentiel_cache.is_fresh(cached_referentiel)
+
+
+def test_should_restart_max_age_of_revalidated_referentiel(tmp_path: pathlib.Path) -> None:
+    clock = FakeClock()
+    referentiel_cache = ReferentielCache(tmp_path, max_age=3600.0, clock=clock)
+    cached_referentiel = referentiel_cache.save("metiers", METIERS, {"etag": '"v1"'})
+    clock.seconds += 7200
+
+    referentiel_cache.touch("metiers", cached_referentiel)
+
+    assert referentiel_cache.is_fresh(referentiel_cache.load("metiers"))  # type: ignore[arg-type]
+
+
+def test_should_build_conditional_headers() -> None:
+    cached_referentiel = CachedReferentiel(
+        body=METIERS, stored_at=0.0, etag='"v1"', last_modified="Thu, 25 Dec 2025 10:00:00 GMT"
+    )
+
+    assert cached_referentiel.to_conditional_headers() == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Thu, 25 Dec 2025 10:00:00 GMT",
+    }
+
+
+@pytest.mark.skipif(sys.platform == "darwin", reason="XDG_CACHE_HOME only applies to Linux and other Unix systems")
+def test_should_store_referentiels_in_cache_directory_of_current_user_by_default(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    ReferentielCache().save("metiers", METIERS, {})
+
+    cached_referentiel = ReferentielCache(tmp_path / "france-travail-api" / "referentiels").load("metiers")
+    assert cached_referentiel is not None
+    assert cached_referentiel.body == METIERS
@@ -1,11 +1,31 @@
 import http
+import pathlib
 import uuid
 
 import pytest
 
 from france_travail_api.auth.scope import Scope
+from france_travail_api.exceptions import FranceTravailException
 from france_travail_api.http_transport._http_response import HTTPResponse
-from france_travail_api.offres.models import Appellation, Metier
+from france_travail_api.offres.models import (
+    Appellation,
+    CodeNaf,
+    Commune,
+    Continent,
+    Departement,
+    Domaine,
+    LangueReferentiel,
+    Metier,
+    NatureContrat,
+    NiveauFormation,
+    Pays,
+    PermisReferentiel,
+    Region,
+    SecteurActivite,
+    Theme,
+    TypeContrat,
+)
+from france_travail_api.offres.referentiel_cache import ReferentielCache
 from tests.dsl import scenario
 
 
@@ -103,3 +123,231 @@ async def test_should_get_appellations_from_referentiel_async(appellations_respo
         Appellation(code="11573", libelle="Boulanger / Boulangère"),
         Appellation(code="38444", libelle="Développeur / Développeuse back-end"),
     ]
+
+
+def _stale_referentiel_cache(tmp_path: pathlib.Path, headers: dict[str, str]) -> ReferentielCache:
+    ReferentielCache(tmp_path, clock=lambda: 0.0).save(
+        "metiers", [{"code": "D1102", "libelle": "Boulangerie - viennoiserie"}], headers
+    )
+    return ReferentielCache(tmp_path, max_age=3600.0)
+
+
+def test_should_serve_cached_referentiel_without_request(
+    tmp_path: pathlib.Path, metiers_response: HTTPResponse
+) -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(metiers_response)
+        .with_referentiel_cache(ReferentielCache(tmp_path))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    flow._offres_client.referentiels.metiers()
+    metiers = flow._offres_client.referentiels.metiers()
+
+    assert len(metiers) == 2
+    flow.then_requested_get_urls_contain(["referentiel/metiers"])
+
+
+def test_should_revalidate_stale_referentiel_with_its_validators(tmp_path: pathlib.Path) -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(
+            HTTPResponse(status_code=http.HTTPStatus.NOT_MODIFIED, body={}, request_id=uuid.uuid4(), headers={})
+        )
+        .with_referentiel_cache(_stale_referentiel_cache(tmp_path, {"etag": '"v1"'}))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    metiers = flow._offres_client.referentiels.metiers()
+    flow._offres_client.referentiels.metiers()
+
+    assert metiers == [Metier(code="D1102", libelle="Boulangerie - viennoiserie")]
+    flow.then_last_get_headers_are({"If-None-Match": '"v1"'})
+    flow.then_requested_get_urls_contain(["referentiel/metiers"])
+
+
+def test_should_serve_stale_referentiel_when_api_responds_with_error(tmp_path: pathlib.Path) -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_error_response(status_code=http.HTTPStatus.SERVICE_UNAVAILABLE)
+        .with_referentiel_cache(_stale_referentiel_cache(tmp_path, {"etag": '"v1"'}))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    metiers = flow._offres_client.referentiels.metiers()
+
+    assert metiers == [Metier(code="D1102", libelle="Boulangerie - viennoiserie")]
+    cached_referentiel = ReferentielCache(tmp_path).load("metiers")
+    assert cached_referentiel is not None
+    assert cached_referentiel.body == [{"code": "D1102", "libelle": "Boulangerie - viennoiserie"}]
+
+
+@pytest.mark.asyncio
+async def test_should_raise_api_error_when_referentiel_is_not_cached_async(tmp_path: pathlib.Path) -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_error_response(status_code=http.HTTPStatus.SERVICE_UNAVAILABLE)
+        .with_referentiel_cache(ReferentielCache(tmp_path))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    with pytest.raises(FranceTravailException, match="An unknown error occurred"):
+        await flow._offres_client.referentiels.metiers_async()
+    assert ReferentielCache(tmp_path).load("metiers") is None
+
+
+@pytest.mark.asyncio
+async def test_should_download_modified_referentiel_async(
+    tmp_path: pathlib.Path, metiers_response: HTTPResponse
+) -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(metiers_response)
+        .with_referentiel_cache(_stale_referentiel_cache(tmp_path, {}))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    metiers = await flow._offres_client.referentiels.metiers_async()
+
+    assert len(metiers) == 2
+    flow.then_last_get_headers_are({})
+    assert len(ReferentielCache(tmp_path).load("metiers").body) == 2  # type: ignore[union-attr]
+
+
+@pytest.mark.parametrize(
+    ("referentiel", "path", "expected"),
+    [
+        ("communes", "communes", Commune(code="01", libelle="Libellé")),
+        ("continents", "continents", Continent(code="01", libelle="Libellé")),
+        ("departements", "departements", Departement(code="01", libelle="Libellé")),
+        ("domaines", "domaines", Domaine(code="01", libelle="Libellé")),
+        ("langues", "langues", LangueReferentiel(code="01", libelle="Libellé")),
+        ("nafs", "nafs", CodeNaf(code="01", libelle="Libellé")),
+        ("natures_contrats", "naturesContrats", NatureContrat(code="01", libelle="Libellé")),
+        ("niveaux_formations", "niveauxFormations", NiveauFormation(code="01", libelle="Libellé")),
+        ("pays", "pays", Pays(code="01", libelle="Libellé")),
+        ("permis", "permis", PermisReferentiel(code="01", libelle="Libellé")),
+        ("regions", "regions", Region(code="01", libelle="Libellé")),
+        ("secteurs_activites", "secteursActivites", SecteurActivite(code="01", libelle="Libellé")),
+        ("themes", "themes", Theme(code="01", libelle="Libellé")),
+        ("types_contrats", "typesContrats", TypeContrat(code="01", libelle="Libellé")),
+    ],
+)
+@pytest.mark.asyncio
+async def test_should_get_every_referentiel(referentiel: str, path: str, expected: object) -> None:
+    flow = scenario().unit().with_token_response()
+    for _ in range(2):
+        flow.with_http_response(
+            HTTPResponse(
+                status_code=http.HTTPStatus.OK,
+                body=[{"code": "01", "libelle": "Libellé"}],
+                request_id=uuid.uuid4(),
+                headers={},
+            )
+        )
+    flow.with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+    flow.with_offres_client()
+
+    entries = getattr(flow._offres_client.referentiels, referentiel)()
+    entries_async = await getattr(flow._offres_client.referentiels, f"{referentiel}_async")()
+
+    assert entries == entries_async == [expected]
+    assert entries.get("01") == expected
+    flow.then_requested_get_urls_contain([f"referentiel/{path}", f"referentiel/{path}"])
+
+
+def test_should_cache_every_referentiel_under_its_own_name(tmp_path: pathlib.Path) -> None:
+    flow = scenario().unit().with_token_response()
+    for code in ("CDI", "E1"):
+        flow.with_http_response(
+            HTTPResponse(
+                status_code=http.HTTPStatus.OK,
+                body=[{"code": code, "libelle": "Libellé"}],
+                request_id=uuid.uuid4(),
+                headers={},
+            )
+        )
+    flow.with_referentiel_cache(ReferentielCache(tmp_path))
+    flow.with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+    flow.with_offres_client()
+
+    flow._offres_client.referentiels.types_contrats()
+    flow._offres_client.referentiels.natures_contrats()
+
+    assert flow._offres_client.referentiels.types_contrats() == [TypeContrat(code="CDI", libelle="Libellé")]
+    assert flow._offres_client.referentiels.natures_contrats() == [NatureContrat(code="E1", libelle="Libellé")]
+    flow.then_requested_get_urls_contain(["referentiel/typesContrats", "referentiel/naturesContrats"])
+
+
+def test_should_stream_appellations_without_caching_them(
+    appellations_response: HTTPResponse, tmp_path: pathlib.Path
+) -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(appellations_response)
+        .with_referentiel_cache(ReferentielCache(tmp_path))
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    appellations = list(flow._offres_client.referentiels.stream("appellations"))
+
+    assert appellations == [
+        Appellation(code="11573", libelle="Boulanger / Boulangère"),
+        Appellation(code="38444", libelle="Développeur / Développeuse back-end"),
+    ]
+    flow.then_last_get_url_contains("referentiel/appellations")
+    assert ReferentielCache(tmp_path).load("appellations") is None
+
+
+@pytest.mark.asyncio
+async def test_should_stream_referentiel_async() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(
+            HTTPResponse(
+                status_code=http.HTTPStatus.OK,
+                body=[{"code": "CDI", "libelle": "Contrat à durée indéterminée"}],
+                request_id=uuid.uuid4(),
+                headers={},
+            )
+        )
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    types_contrats = [item async for item in flow._offres_client.referentiels.stream_async("typesContrats")]
+
+    assert types_contrats == [TypeContrat(code="CDI", libelle="Contrat à durée indéterminée")]
+
+
+def test_should_reject_streaming_unknown_referentiel() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    with pytest.raises(ValueError, match="Unknown referential 'villes'"):
+        next(flow._offres_client.referentiels.stream("villes"))
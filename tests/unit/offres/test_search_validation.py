@@ -0,0 +1,126 @@
+import http
+import uuid
+
+import pytest
+
+from france_travail_api.auth.scope import Scope
+from france_travail_api.exceptions import InvalidSearchParametersException
+from france_travail_api.http_transport._http_response import HTTPResponse
+from tests.dsl import scenario
+from tests.dsl.scenario import Scenario
+
+
+def _referentiel_response(codes: list[str]) -> HTTPResponse:
+    return HTTPResponse(
+        status_code=http.HTTPStatus.OK,
+        body=[{"code": code, "libelle": f"Libellé {code}"} for code in codes],
+        request_id=uuid.uuid4(),
+        headers={},
+    )
+
+
+def _search_response() -> HTTPResponse:
+    return HTTPResponse(
+        status_code=http.HTTPStatus.OK,
+        body={"resultats": [{"id": "201WLXK"}]},
+        request_id=uuid.uuid4(),
+        headers={},
+    )
+
+
+def _validating_scenario(*responses: HTTPResponse) -> Scenario:
+    flow = scenario().unit().with_token_response()
+    for response in responses:
+        flow = flow.with_http_response(response)
+    return (
+        flow.with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_search_params_validation()
+        .with_offres_client()
+    )
+
+
+def test_should_search_when_codes_exist_in_referentiels() -> None:
+    flow = _validating_scenario(
+        _referentiel_response(["M1805", "D1102"]),
+        _referentiel_response(["75056", "69123"]),
+        _search_response(),
+    )
+
+    flow.when_searching_offres(mots_cles="développeur", commune="75056,69123", code_rome="M1805")
+
+    flow.then_requested_get_urls_contain(["referentiel/metiers", "referentiel/communes", "offres/search"])
+
+
+def test_should_reject_unknown_codes_before_searching() -> None:
+    flow = _validating_scenario(_referentiel_response(["75056"]))
+
+    with pytest.raises(InvalidSearchParametersException, match="commune: unknown codes 99999"):
+        flow.when_searching_offres(mots_cles="développeur", commune="75056,99999")
+
+    flow.then_requested_get_urls_contain(["referentiel/communes"])
+
+
+def test_should_reject_too_many_values_without_fetching_referentiels() -> None:
+    flow = _validating_scenario()
+
+    with pytest.raises(InvalidSearchParametersException) as exception_info:
+        flow.when_searching_offres(mots_cles="développeur", commune="1,2,3,4,5,6", code_naf="62.02A,62.01Z,10.71C")
+
+    assert exception_info.value.errors == [
+        "code_naf: at most 2 values are allowed, got 3",
+        "commune: at most 5 values are allowed, got 6",
+    ]
+    flow.then_requested_get_urls_contain([])
+
+
+def test_should_fetch_each_referentiel_once() -> None:
+    flow = _validating_scenario(
+        _referentiel_response(["75", "92"]),
+        _search_response(),
+        _search_response(),
+    )
+
+    flow.when_searching_offres(mots_cles="boulanger", departement="75")
+    flow.when_searching_offres(mots_cles="boulanger", departement="92")
+
+    flow.then_requested_get_urls_contain(["referentiel/departements", "offres/search", "offres/search"])
+
+
+def test_should_not_validate_search_params_by_default() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_http_response(_search_response())
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .with_offres_client()
+    )
+
+    flow.when_searching_offres(mots_cles="boulanger", commune="1,2,3,4,5,6")
+
+    flow.then_requested_get_urls_contain(["offres/search"])
+
+
+def test_should_validate_params_when_iterating_search_results() -> None:
+    flow = _validating_scenario(_referentiel_response(["62"]))
+
+    with pytest.raises(InvalidSearchParametersException, match="secteur_activite: unknown codes 99"):
+        flow.when_iterating_offres(mots_cles="développeur", secteur_activite="62,99")
+
+
+@pytest.mark.asyncio
+async def test_should_reject_unknown_codes_before_searching_async() -> None:
+    flow = _validating_scenario(_referentiel_response(["M1805"]))
+
+    with pytest.raises(InvalidSearchParametersException, match="code_rome: unknown codes X9999"):
+        await flow.when_searching_offres_async(mots_cles="développeur", code_rome="X9999")
+
+    flow.then_requested_get_urls_contain(["referentiel/metiers"])
+
+
+@pytest.mark.asyncio
+async def test_should_validate_params_when_harvesting_async() -> None:
+    flow = _validating_scenario()
+
+    with pytest.raises(InvalidSearchParametersException, match="departement: at most 5 values are allowed, got 6"):
+        await flow.when_harvesting_offres_async(mots_cles="boulanger", departement="01,02,03,04,05,06")
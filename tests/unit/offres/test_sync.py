@@ -0,0 +1,226 @@
+import dataclasses
+import datetime
+import http
+import pathlib
+import sys
+import uuid
+from typing import Any
+
+import pytest
+
+from france_travail_api.auth.scope import Scope
+from france_travail_api.exceptions import FranceTravailException, IncompleteHarvestWarning
+from france_travail_api.http_transport._http_response import HTTPResponse
+from france_travail_api.offres.sync import FileSyncStateStore, SyncState, sync_key
+from tests.dsl import scenario
+from tests.dsl.scenario import Scenario
+
+NOW = datetime.datetime(2025, 12, 25, 10, 0, 0, tzinfo=datetime.UTC)
+
+
+def _offre_json(offer_id: str, date_actualisation: str) -> dict[str, Any]:
+    return {"id": offer_id, "dateCreation": "2025-12-01T08:00:00.000Z", "dateActualisation": date_actualisation}
+
+
+def _search_response(*offres_json: dict[str, Any]) -> HTTPResponse:
+    if not offres_json:
+        return HTTPResponse(
+            status_code=http.HTTPStatus.NO_CONTENT, body={}, request_id=uuid.uuid4(), headers={"content-range": "*/0"}
+        )
+    return HTTPResponse(
+        status_code=http.HTTPStatus.PARTIAL_CONTENT,
+        body={"resultats": list(offres_json)},
+        request_id=uuid.uuid4(),
+        headers={"content-range": f"offres 0-{len(offres_json) - 1}/{len(offres_json)}"},
+    )
+
+
+def _synchronized_flow(state_store: FileSyncStateStore, *responses: HTTPResponse) -> Scenario:
+    flow = scenario().unit().with_token_response()
+    for response in responses:
+        flow.with_http_response(response)
+    flow.with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+    return flow.with_offres_client().with_offre_synchronizer(state_store)
+
+
+def _synchronized_state(reconciled_at: datetime.datetime, high_water_mark: datetime.datetime) -> SyncState:
+    return SyncState(
+        high_water_mark=high_water_mark,
+        reconciled_at=reconciled_at,
+        offer_versions={"1": "2025-12-24T09:00:00+00:00", "2": "2025-12-23T08:00:00+00:00"},
+    )
+
+
+def test_should_insert_every_offre_on_first_synchronization(tmp_path: pathlib.Path) -> None:
+    state_store = FileSyncStateStore(tmp_path)
+    flow = _synchronized_flow(
+        state_store,
+        _search_response(_offre_json("1", "2025-12-24T09:00:00.000Z"), _offre_json("2", "2025-12-23T08:00:00.000Z")),
+    )
+
+    flow.when_synchronizing_offres(mots_cles="boulanger", departement="75")
+
+    flow.then_sync_events_are([("insert", "1"), ("insert", "2")])
+    flow.then_requested_get_urls_contain(["departement=75"])
+    assert state_store.load(sync_key("boulanger", departement="75")) == SyncState(
+        high_water_mark=datetime.datetime(2025, 12, 24, 9, 0, 0, tzinfo=datetime.UTC),
+        reconciled_at=NOW,
+        offer_versions={"1": "2025-12-24T09:00:00+00:00", "2": "2025-12-23T08:00:00+00:00"},
+    )
+
+
+def test_should_only_report_offres_created_or_updated_since_high_water_mark(tmp_path: pathlib.Path) -> None:
+    state_store = FileSyncStateStore(tmp_path)
+    state_store.save(
+        sync_key("boulanger"),
+        _synchronized_state(
+            reconciled_at=NOW - datetime.timedelta(hours=1),
+            high_water_mark=datetime.datetime(2025, 12, 24, 9, 0, 0, tzinfo=datetime.UTC),
+        ),
+    )
+    flow = _synchronized_flow(
+        state_store,
+        _search_response(
+            _offre_json("3", "2025-12-25T08:00:00.000Z"),
+            _offre_json("1", "2025-12-25T09:00:00.000Z"),
+            _offre_json("2", "2025-12-23T08:00:00.000Z"),
+        ),
+    )
+
+    flow.when_synchronizing_offres(mots_cles="boulanger")
+
+    flow.then_sync_events_are([("insert", "3"), ("update", "1")])
+    flow.then_requested_get_urls_contain(["publieeDepuis=3"])
+    state = state_store.load(sync_key("boulanger"))
+    assert state is not None
+    assert state.high_water_mark == datetime.datetime(2025, 12, 25, 9, 0, 0, tzinfo=datetime.UTC)
+    assert state.reconciled_at == NOW - datetime.timedelta(hours=1)
+    assert state.offer_versions.keys() == {"1", "2", "3"}
+
+
+@pytest.mark.parametrize(
+    ("reconciled_at", "high_water_mark"),
+    [
+        (NOW - datetime.timedelta(days=2), NOW - datetime.timedelta(hours=1)),
+        (NOW - datetime.timedelta(hours=1), NOW - datetime.timedelta(days=40)),
+    ],
+)
+def test_should_delete_offres_missing_from_reconciliation(
+    tmp_path: pathlib.Path, reconciled_at: datetime.datetime, high_water_mark: datetime.datetime
+) -> None:
+    state_store = FileSyncStateStore(tmp_path)
+    state_store.save(sync_key("boulanger"), _synchronized_state(reconciled_at, high_water_mark))
+    flow = _synchronized_flow(state_store, _search_response(_offre_json("1", "2025-12-24T09:00:00.000Z")))
+
+    flow.when_synchronizing_offres(mots_cles="boulanger")
+
+    flow.then_sync_events_are([("delete", "2")])
+    state = state_store.load(sync_key("boulanger"))
+    assert state is not None
+    assert state.reconciled_at == NOW
+    assert state.offer_versions == {"1": "2025-12-24T09:00:00+00:00"}
+
+
+def test_should_not_delete_offres_nor_save_state_when_reconciliation_fails(tmp_path: pathlib.Path) -> None:
+    state_store = FileSyncStateStore(tmp_path)
+    state = _synchronized_state(NOW - datetime.timedelta(days=2), NOW - datetime.timedelta(hours=1))
+    state_store.save(sync_key("boulanger"), state)
+    flow = _synchronized_flow(
+        state_store,
+        HTTPResponse(
+            status_code=http.HTTPStatus.SERVICE_UNAVAILABLE,
+            body={"message": "Service indisponible"},
+            request_id=uuid.uuid4(),
+            headers={},
+        ),
+    )
+
+    with pytest.raises(FranceTravailException):
+        flow.when_synchronizing_offres(mots_cles="boulanger")
+
+    assert state_store.load(sync_key("boulanger")) == state
+
+
+def test_should_not_delete_offres_nor_save_state_when_reconciliation_harvest_is_incomplete(
+    tmp_path: pathlib.Path,
+) -> None:
+    state_store = FileSyncStateStore(tmp_path)
+    state = _synchronized_state(NOW - datetime.timedelta(days=2), NOW - datetime.timedelta(hours=1))
+    state_store.save(sync_key("boulanger", departement="75,92"), state)
+    over_limit_response = _search_response(_offre_json("1", "2025-12-24T09:00:00.000Z"))
+    flow = _synchronized_flow(
+        state_store,
+        dataclasses.replace(over_limit_response, headers={"content-range": "offres 0-0/4000"}),
+        _search_response(_offre_json("1", "2025-12-24T09:00:00.000Z")),
+        _search_response(),
+    )
+
+    with pytest.warns(IncompleteHarvestWarning):
+        flow.when_synchronizing_offres(mots_cles="boulanger", departement="75,92")
+
+    flow.then_sync_events_are([])
+    assert state_store.load(sync_key("boulanger", departement="75,92")) == state
+
+
+@pytest.mark.asyncio
+async def test_should_synchronize_offres_async(tmp_path: pathlib.Path) -> None:
+    state_store = FileSyncStateStore(tmp_path)
+    flow = _synchronized_flow(
+        state_store,
+        _search_response(_offre_json("1", "2025-12-24T09:00:00.000Z")),
+        _search_response(_offre_json("1", "2025-12-25T09:30:00.000Z")),
+    )
+
+    await flow.when_synchronizing_offres_async(mots_cles="boulanger")
+    flow.then_sync_events_are([("insert", "1")])
+    await flow.when_time_passes(3600).when_synchronizing_offres_async(mots_cles="boulanger")
+
+    flow.then_sync_events_are([("update", "1")])
+    flow.then_requested_get_urls_contain(["mots", "publieeDepuis=3"])
+
+
+def test_should_not_save_state_of_interrupted_synchronization(tmp_path: pathlib.Path) -> None:
+    state_store = FileSyncStateStore(tmp_path)
+    flow = _synchronized_flow(
+        state_store,
+        _search_response(_offre_json("1", "2025-12-24T09:00:00.000Z"), _offre_json("2", "2025-12-23T08:00:00.000Z")),
+    )
+
+    events = flow._offre_synchronizer.sync(mots_cles="boulanger")  # type: ignore[union-attr]
+    next(events)
+    events.close()
+
+    assert state_store.load(sync_key("boulanger")) is None
+
+
+def test_should_reject_search_parameters_set_by_synchronization(tmp_path: pathlib.Path) -> None:
+    flow = _synchronized_flow(FileSyncStateStore(tmp_path))
+
+    with pytest.raises(TypeError, match="publiee_depuis"):
+        flow.when_synchronizing_offres(mots_cles="boulanger", publiee_depuis=1)
+
+
+def test_should_identify_search_by_its_parameters_whatever_their_order() -> None:
+    assert sync_key("boulanger", departement="75", commune="75056") == sync_key(
+        "boulanger", commune="75056", departement="75"
+    )
+    assert sync_key("boulanger", departement="75") != sync_key("boulanger", departement="92")
+
+
+def test_should_ignore_unreadable_sync_state(tmp_path: pathlib.Path) -> None:
+    (tmp_path / "boulanger.json").write_text("{not json")
+
+    assert FileSyncStateStore(tmp_path).load("boulanger") is None
+    assert FileSyncStateStore(tmp_path).load("unknown") is None
+
+
+@pytest.mark.skipif(sys.platform == "darwin", reason="XDG_CACHE_HOME only applies to Linux and other Unix systems")
+def test_should_store_states_in_cache_directory_of_current_user_by_default(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    state = SyncState(offer_versions={"1": "2025-12-24T09:00:00+00:00"})
+
+    FileSyncStateStore().save("boulanger", state)
+
+    assert FileSyncStateStore(tmp_path / "france-travail-api" / "sync").load("boulanger") == state
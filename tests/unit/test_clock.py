@@ -0,0 +1,15 @@
+import datetime
+
+from france_travail_api.auth.clock import MonotonicClock
+
+
+def test_monotonic_clock_should_return_utc_datetimes() -> None:
+    assert MonotonicClock().now().tzinfo == datetime.UTC
+
+
+def test_monotonic_clock_should_never_go_backwards() -> None:
+    clock = MonotonicClock()
+
+    instants = [clock.now() for _ in range(1_000)]
+
+    assert instants == sorted(instants)
@@ -1,9 +1,41 @@
+import asyncio
 import datetime
+import pathlib
+import threading
+
+import pytest
 
 from france_travail_api.auth._token import Token
 from france_travail_api.auth.scope import Scope
+from france_travail_api.auth.token_refresh import TokenRefreshSchedule
+from france_travail_api.auth.token_store import FileTokenStore
 from france_travail_api.exceptions import FranceTravailException
-from tests.dsl import scenario
+from tests.dsl import expect, scenario
+
+
+class BlockingTokenStore:
+    """Token store whose lock is only acquired once unblocked, and only released by exiting it."""
+
+    def __init__(self) -> None:
+        self.acquiring = threading.Event()
+        self.unblocked = threading.Event()
+        self.released = threading.Event()
+
+    def lock(self, key: str) -> "BlockingTokenStore":
+        return self
+
+    def __enter__(self) -> None:
+        self.acquiring.set()
+        self.unblocked.wait()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.released.set()
+
+    def load(self, key: str) -> Token | None:
+        return None
+
+    def save(self, key: str, token: Token) -> None:
+        pass
 
 
 def test_should_return_token() -> None:
@@ -57,3 +89,250 @@ def test_should_return_authorization_header() -> None:
     scenario().unit().with_token_response().with_credentials(
         client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES]
     ).when_authorization_header().then_authorization_header_is({"Authorization": "Bearer my_token"})
+
+
+@pytest.mark.asyncio
+async def test_should_return_token_async() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+    )
+
+    await flow.when_get_token_async()
+
+    flow.then_token_is(
+        Token(
+            access_token="my_token",
+            expires_at=flow.now + datetime.timedelta(seconds=1_499),
+            scope="api_offresdemploiv2 o2dsoffre",
+            token_type="Bearer",
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_share_a_single_token_request_between_concurrent_coroutines() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response(access_token="my_token1")
+        .with_token_response(access_token="my_token2")
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+    )
+
+    await flow.when_get_tokens_concurrently_async(count=5)
+
+    flow.then_token_requests_count_is(1).then_all_tokens_are(
+        Token(
+            access_token="my_token1",
+            expires_at=flow.now + datetime.timedelta(seconds=1_499),
+            scope="api_offresdemploiv2 o2dsoffre",
+            token_type="Bearer",
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_raise_base_exception_when_http_client_returns_error_async() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_error_response()
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+    )
+
+    await expect(flow.when_get_token_async).to_raise_async(
+        FranceTravailException,
+        match="An error occurred while communicating with the France Travail API: An unknown error occurred",
+    )
+
+
+def test_should_renew_token_in_background_thread() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response(access_token="my_token1", expires_in=1)
+        .with_token_response(access_token="my_token2", expires_in=1)
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+    )
+
+    flow.when_background_refresh_runs(TokenRefreshSchedule(refresh_ratio=0.1, jitter_ratio=0), until_token_requests=2)
+
+    flow.then_token_requests_count_is(2).then_current_access_token_is("my_token2")
+
+
+def test_should_get_valid_token_while_background_thread_renews_it() -> None:
+    token_store = BlockingTokenStore()
+    token_store.unblocked.set()
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response(access_token="my_token1", expires_in=60)
+        .with_token_response(access_token="my_token2", expires_in=60)
+        .with_token_store(token_store)
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+    )
+    flow.when_get_token()
+    token_store.unblocked.clear()
+    token_store.acquiring.clear()
+    flow.when_background_refresh_starts(TokenRefreshSchedule(refresh_ratio=0.001, jitter_ratio=0))
+    assert token_store.acquiring.wait(1.0)
+    unblocking = threading.Timer(0.5, token_store.unblocked.set)
+    unblocking.start()
+
+    try:
+        flow.when_get_token()
+    finally:
+        unblocking.join()
+        flow.when_background_refresh_stops()
+
+    flow.then_token_is(
+        Token(
+            access_token="my_token1",
+            expires_at=flow.now + datetime.timedelta(seconds=60),
+            scope="api_offresdemploiv2 o2dsoffre",
+            token_type="Bearer",
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_renew_token_in_background_task() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response(access_token="my_token1", expires_in=1)
+        .with_token_response(access_token="my_token2", expires_in=1)
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+    )
+
+    await flow.when_background_refresh_runs_async(
+        TokenRefreshSchedule(refresh_ratio=0.1, jitter_ratio=0), until_token_requests=2
+    )
+
+    flow.then_token_requests_count_is(2).then_current_access_token_is("my_token2")
+
+
+def test_should_renew_token_once_clock_reaches_its_expiration() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response(access_token="my_token1")
+        .with_token_response(access_token="my_token2")
+        .with_clock()
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+    )
+
+    flow.when_get_token_from_clock().when_time_passes(seconds=1_500).when_get_token_from_clock()
+
+    flow.then_token_requests_count_is(2).then_current_access_token_is("my_token2")
+
+
+def test_should_not_request_new_token_when_rejected_token_was_already_renewed() -> None:
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response(access_token="my_token1")
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+    )
+    rejected_token = Token(
+        access_token="my_token0",
+        expires_at=flow.now,
+        scope="api_offresdemploiv2 o2dsoffre",
+        token_type="Bearer",
+    )
+
+    flow.when_get_token().when_renewing_token(rejected_token)
+
+    flow.then_token_requests_count_is(1).then_current_access_token_is("my_token1")
+
+
+def test_should_reuse_token_saved_by_other_credentials(tmp_path: pathlib.Path) -> None:
+    token_store = FileTokenStore(tmp_path)
+    scenario().unit().with_token_response(access_token="my_token1").with_token_store(token_store).with_credentials(
+        client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES]
+    ).when_get_token()
+
+    (
+        scenario()
+        .unit()
+        .with_token_response(access_token="my_token2")
+        .with_token_store(token_store)
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .when_get_token()
+        .then_token_requests_count_is(0)
+        .then_current_access_token_is("my_token1")
+    )
+
+
+def test_should_not_reuse_stored_token_when_renewing_it(tmp_path: pathlib.Path) -> None:
+    token_store = FileTokenStore(tmp_path)
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response(access_token="my_token1")
+        .with_token_response(access_token="my_token2")
+        .with_token_store(token_store)
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .when_get_token_from_clock()
+    )
+
+    flow.when_renewing_token(flow._token)  # type: ignore[arg-type]
+
+    (
+        scenario()
+        .unit()
+        .with_token_store(token_store)
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .when_get_token_from_clock()
+        .then_token_requests_count_is(0)
+        .then_current_access_token_is("my_token2")
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_reuse_token_saved_by_other_credentials_async(tmp_path: pathlib.Path) -> None:
+    token_store = FileTokenStore(tmp_path)
+    await (
+        scenario()
+        .unit()
+        .with_token_response(access_token="my_token1")
+        .with_token_store(token_store)
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+        .when_get_token_async()
+    )
+
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response(access_token="my_token2")
+        .with_token_store(token_store)
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+    )
+    await flow.when_get_token_async()
+
+    flow.then_token_requests_count_is(0).then_current_access_token_is("my_token1")
+
+
+@pytest.mark.asyncio
+async def test_should_release_token_store_lock_acquired_after_cancellation_async() -> None:
+    token_store = BlockingTokenStore()
+    flow = (
+        scenario()
+        .unit()
+        .with_token_response()
+        .with_token_store(token_store)
+        .with_credentials(client_id="client-id", client_secret="client-secret", scopes=[Scope.OFFRES])
+    )
+    getting_token = asyncio.create_task(flow.when_get_token_async())
+    await asyncio.to_thread(token_store.acquiring.wait)
+
+    getting_token.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await getting_token
+    token_store.unblocked.set()
+
+    assert await asyncio.to_thread(token_store.released.wait, 1.0)
+    flow.then_token_requests_count_is(0)
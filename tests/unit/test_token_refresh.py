@@ -0,0 +1,44 @@
+import datetime
+import random
+
+import pytest
+
+from france_travail_api.auth._token import Token
+from france_travail_api.auth.token_refresh import TokenRefreshSchedule
+
+NOW = datetime.datetime(2025, 12, 25, 10, 0, 0, tzinfo=datetime.UTC)
+
+
+def _token_expiring_in(seconds: float) -> Token:
+    return Token(
+        access_token="my_token",
+        expires_at=NOW + datetime.timedelta(seconds=seconds),
+        scope="api_offresdemploiv2 o2dsoffre",
+        token_type="Bearer",
+    )
+
+
+def test_should_renew_token_after_fraction_of_its_lifetime() -> None:
+    schedule = TokenRefreshSchedule(refresh_ratio=0.5, jitter_ratio=0)
+
+    assert schedule.delay_before_refresh(_token_expiring_in(1_000), NOW) == 500
+
+
+def test_should_keep_jittered_delay_within_bounds() -> None:
+    schedule = TokenRefreshSchedule(refresh_ratio=0.5, jitter_ratio=0.2)
+    random_generator = random.Random(42)
+
+    delays = [schedule.delay_before_refresh(_token_expiring_in(1_000), NOW, random_generator) for _ in range(100)]
+
+    assert all(400 <= delay <= 600 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_should_renew_expired_token_right_away() -> None:
+    assert TokenRefreshSchedule().delay_before_refresh(_token_expiring_in(-10), NOW) == 0
+
+
+@pytest.mark.parametrize("refresh_ratio, jitter_ratio", [(0, 0.1), (1, 0.1), (0.5, -0.1), (0.5, 1)])
+def test_should_reject_invalid_schedule(refresh_ratio: float, jitter_ratio: float) -> None:
+    with pytest.raises(ValueError):
+        TokenRefreshSchedule(refresh_ratio=refresh_ratio, jitter_ratio=jitter_ratio)
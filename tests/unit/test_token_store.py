@@ -0,0 +1,67 @@
+import datetime
+import pathlib
+import sys
+
+import pytest
+
+from france_travail_api.auth._token import Token
+from france_travail_api.auth.token_store import FileTokenStore
+
+TOKEN = Token(
+    access_token="my_token",
+    expires_at=datetime.datetime(2025, 12, 25, 10, 25, tzinfo=datetime.UTC),
+    scope="api_offresdemploiv2 o2dsoffre",
+    token_type="Bearer",
+)
+
+
+def test_should_load_saved_token(tmp_path: pathlib.Path) -> None:
+    token_store = FileTokenStore(tmp_path)
+
+    with token_store.lock("client-id"):
+        token_store.save("client-id", TOKEN)
+
+    assert token_store.load("client-id") == TOKEN
+
+
+def test_should_replace_saved_token(tmp_path: pathlib.Path) -> None:
+    token_store = FileTokenStore(tmp_path)
+    renewed_token = Token(
+        access_token="my_token2",
+        expires_at=TOKEN.expires_at + datetime.timedelta(minutes=25),
+        scope=TOKEN.scope,
+        token_type=TOKEN.token_type,
+    )
+
+    token_store.save("client-id", TOKEN)
+    token_store.save("client-id", renewed_token)
+
+    assert token_store.load("client-id") == renewed_token
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+def test_should_load_nothing_when_no_token_was_saved(tmp_path: pathlib.Path) -> None:
+    token_store = FileTokenStore(tmp_path)
+    token_store.save("other-client-id", TOKEN)
+
+    assert token_store.load("client-id") is None
+
+
+def test_should_load_nothing_when_token_file_is_corrupted(tmp_path: pathlib.Path) -> None:
+    token_store = FileTokenStore(tmp_path)
+    token_store.save("client-id", TOKEN)
+    next(tmp_path.glob("*.json")).write_text("{not json")
+
+    assert token_store.load("client-id") is None
+
+
+@pytest.mark.skipif(sys.platform == "darwin", reason="XDG_CACHE_HOME only applies to Linux and other Unix systems")
+def test_should_store_tokens_in_cache_directory_of_current_user_by_default(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    token_store = FileTokenStore()
+
+    token_store.save("client-id", TOKEN)
+
+    assert FileTokenStore(tmp_path / "france-travail-api" / "tokens").load("client-id") == TOKEN